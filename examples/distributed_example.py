@@ -98,7 +98,6 @@ def client_example(server_ports):
         store.set("distributed:3", {"complex": "value", "with": ["array", "items"]})
         
         # Wait for async operations to complete
-        time.sleep(1)
         client.wait_for_queue_empty(2)
         
         # Get values locally
@@ -125,7 +124,6 @@ def client_example(server_ports):
         store.delete("distributed:2")
         
         # Wait for async operations to complete
-        time.sleep(1)
         client.wait_for_queue_empty(2)
         
         # Verify deletion
@@ -54,6 +54,9 @@ setup(
             "redis-cluster>=2.1.0",
             "hiredis>=2.0.0",
         ],
+        "speedups": [
+            "orjson>=3.6.0",
+        ],
         "docs": [
             "sphinx>=4.0.2",
             "sphinx-rtd-theme>=0.5.2",
@@ -4,10 +4,20 @@ Backend implementations for LlamaKV
 
 from llamakv.backends.memory import MemoryBackend
 from llamakv.backends.file import FileBackend
-from llamakv.backends.redis import RedisBackend
-from llamakv.backends.distributed import DistributedBackend
 from llamakv.backends.base import Backend
 
+
+def __getattr__(name):
+    """Import the heavier backends only when they are first accessed."""
+    if name == "RedisBackend":
+        from llamakv.backends.redis import RedisBackend
+        return RedisBackend
+    if name == "DistributedBackend":
+        from llamakv.backends.distributed import DistributedBackend
+        return DistributedBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "Backend",
     "MemoryBackend",
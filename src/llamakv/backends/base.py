@@ -1,20 +1,55 @@
 """
 Base Backend class for LlamaKV
 """
-import abc
 from typing import Dict, List, Set, Any, Optional, Union, Callable, Tuple
 
 from llamakv.exceptions import KVError
 
 
-class Backend(abc.ABC):
+class Backend:
     """
-    Abstract base class for backend implementations
+    Base class for backend implementations
     
-    All backend implementations must implement these methods.
+    All backend implementations must implement the methods listed in
+    ``_REQUIRED``; this is checked when the subclass is defined. Pub/sub
+    and close have no-op defaults so simple backends need not stub them.
+    
+    This is a plain class rather than an ``abc.ABC`` so that subclasses
+    avoid ABCMeta instance checks and can use ``__slots__``.
     """
     
-    @abc.abstractmethod
+    __slots__ = ()
+    
+    _REQUIRED = (
+        "set", "get", "delete", "exists", "expire", "ttl", "keys", "flush",
+        "increment", "decrement",
+        "list_push", "list_pop", "list_range", "list_length",
+        "set_add", "set_remove", "set_members", "set_is_member",
+        "hash_set", "hash_get", "hash_delete", "hash_exists", "hash_get_all",
+        "batch_set", "batch_get", "batch_delete",
+        "execute_transaction",
+    )
+    
+    def __init_subclass__(cls, abstract: bool = False, **kwargs: Any) -> None:
+        """
+        Check that a concrete subclass implements the backend interface.
+        
+        Args:
+            abstract: Skip the check for intermediate base classes
+            
+        Raises:
+            TypeError: If required methods are not implemented
+        """
+        super().__init_subclass__(**kwargs)
+        if abstract:
+            return
+        
+        missing = [name for name in cls._REQUIRED if getattr(cls, name) is getattr(Backend, name)]
+        if missing:
+            raise TypeError(
+                f"Can't define backend {cls.__name__} without implementing: {', '.join(missing)}"
+            )
+    
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
         Set a key to the specified value
@@ -27,9 +62,8 @@ class Backend(abc.ABC):
         Returns:
             bool: True if successful
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def get(self, key: str) -> Any:
         """
         Get the value for a key
@@ -43,9 +77,8 @@ class Backend(abc.ABC):
         Raises:
             KeyNotFoundError: If the key doesn't exist
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def delete(self, key: str) -> bool:
         """
         Delete a key
@@ -56,9 +89,8 @@ class Backend(abc.ABC):
         Returns:
             bool: True if key was deleted, False if key didn't exist
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def exists(self, key: str) -> bool:
         """
         Check if a key exists
@@ -69,9 +101,8 @@ class Backend(abc.ABC):
         Returns:
             bool: True if key exists, False otherwise
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def expire(self, key: str, ttl: int) -> bool:
         """
         Set a key's time-to-live in seconds
@@ -83,9 +114,8 @@ class Backend(abc.ABC):
         Returns:
             bool: True if successful, False if key doesn't exist
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def ttl(self, key: str) -> int:
         """
         Get a key's time-to-live in seconds
@@ -96,9 +126,8 @@ class Backend(abc.ABC):
         Returns:
             int: TTL in seconds, -1 if key has no TTL, -2 if key doesn't exist
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def keys(self, pattern: str = "*") -> List[str]:
         """
         Get all keys matching a pattern
@@ -109,9 +138,8 @@ class Backend(abc.ABC):
         Returns:
             List of keys matching the pattern
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def flush(self) -> bool:
         """
         Delete all keys
@@ -119,9 +147,8 @@ class Backend(abc.ABC):
         Returns:
             bool: True if successful
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def increment(self, key: str, amount: int = 1) -> int:
         """
         Increment a key by the given amount
@@ -133,9 +160,8 @@ class Backend(abc.ABC):
         Returns:
             int: New value
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def decrement(self, key: str, amount: int = 1) -> int:
         """
         Decrement a key by the given amount
@@ -147,9 +173,8 @@ class Backend(abc.ABC):
         Returns:
             int: New value
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def list_push(self, key: str, value: Any, left: bool = False) -> int:
         """
         Push a value onto a list
@@ -162,9 +187,8 @@ class Backend(abc.ABC):
         Returns:
             int: New list length
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def list_pop(self, key: str, left: bool = False) -> Any:
         """
         Pop a value from a list
@@ -176,9 +200,8 @@ class Backend(abc.ABC):
         Returns:
             Value popped from the list
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def list_range(self, key: str, start: int = 0, end: int = -1) -> List[Any]:
         """
         Get a range of values from a list
@@ -191,9 +214,8 @@ class Backend(abc.ABC):
         Returns:
             List of values in the specified range
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def list_length(self, key: str) -> int:
         """
         Get the length of a list
@@ -204,9 +226,8 @@ class Backend(abc.ABC):
         Returns:
             int: List length
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def set_add(self, key: str, *values: Any) -> int:
         """
         Add values to a set
@@ -218,9 +239,8 @@ class Backend(abc.ABC):
         Returns:
             int: Number of values added
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def set_remove(self, key: str, *values: Any) -> int:
         """
         Remove values from a set
@@ -232,9 +252,8 @@ class Backend(abc.ABC):
         Returns:
             int: Number of values removed
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def set_members(self, key: str) -> Set[Any]:
         """
         Get all members of a set
@@ -245,9 +264,8 @@ class Backend(abc.ABC):
         Returns:
             Set of all members
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def set_is_member(self, key: str, value: Any) -> bool:
         """
         Check if a value is a member of a set
@@ -259,9 +277,8 @@ class Backend(abc.ABC):
         Returns:
             bool: True if value is a member, False otherwise
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def hash_set(self, key: str, field: str, value: Any) -> bool:
         """
         Set a field in a hash
@@ -274,9 +291,8 @@ class Backend(abc.ABC):
         Returns:
             bool: True if field is new, False if field was updated
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def hash_get(self, key: str, field: str) -> Any:
         """
         Get a field from a hash
@@ -288,9 +304,8 @@ class Backend(abc.ABC):
         Returns:
             Value of the field
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def hash_delete(self, key: str, *fields: str) -> int:
         """
         Delete fields from a hash
@@ -302,9 +317,8 @@ class Backend(abc.ABC):
         Returns:
             int: Number of fields deleted
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def hash_exists(self, key: str, field: str) -> bool:
         """
         Check if a field exists in a hash
@@ -316,9 +330,8 @@ class Backend(abc.ABC):
         Returns:
             bool: True if field exists, False otherwise
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def hash_get_all(self, key: str) -> Dict[str, Any]:
         """
         Get all fields and values from a hash
@@ -329,9 +342,8 @@ class Backend(abc.ABC):
         Returns:
             Dict of field names to values
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def batch_set(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
         """
         Set multiple keys to their values
@@ -343,9 +355,8 @@ class Backend(abc.ABC):
         Returns:
             bool: True if successful
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def batch_get(self, keys: List[str]) -> Dict[str, Any]:
         """
         Get multiple keys
@@ -356,9 +367,8 @@ class Backend(abc.ABC):
         Returns:
             Dict of keys to values
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def batch_delete(self, keys: List[str]) -> int:
         """
         Delete multiple keys
@@ -369,9 +379,8 @@ class Backend(abc.ABC):
         Returns:
             int: Number of keys deleted
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def execute_transaction(self, commands: List[tuple]) -> List[Any]:
         """
         Execute a transaction
@@ -382,9 +391,8 @@ class Backend(abc.ABC):
         Returns:
             List of results from each command
         """
-        pass
+        raise NotImplementedError
     
-    @abc.abstractmethod
     def subscribe(self, channel: str) -> None:
         """
         Subscribe to a channel
@@ -394,7 +402,6 @@ class Backend(abc.ABC):
         """
         pass
     
-    @abc.abstractmethod
     def unsubscribe(self, channel: str) -> None:
         """
         Unsubscribe from a channel
@@ -404,7 +411,6 @@ class Backend(abc.ABC):
         """
         pass
     
-    @abc.abstractmethod
     def psubscribe(self, pattern: str) -> None:
         """
         Subscribe to a channel pattern
@@ -414,7 +420,6 @@ class Backend(abc.ABC):
         """
         pass
     
-    @abc.abstractmethod
     def punsubscribe(self, pattern: str) -> None:
         """
         Unsubscribe from a channel pattern
@@ -424,7 +429,6 @@ class Backend(abc.ABC):
         """
         pass
     
-    @abc.abstractmethod
     def publish(self, channel: str, message: Any) -> int:
         """
         Publish a message to a channel
@@ -436,9 +440,8 @@ class Backend(abc.ABC):
         Returns:
             int: Number of clients that received the message
         """
-        pass
+        return 0
     
-    @abc.abstractmethod
     def get_message(self) -> Optional[Dict[str, Any]]:
         """
         Get a message from a subscribed channel
@@ -446,9 +449,8 @@ class Backend(abc.ABC):
         Returns:
             Dict containing message information or None if no message is available
         """
-        pass
+        return None
     
-    @abc.abstractmethod
     def close(self) -> None:
         """
         Close the connection to the backend
@@ -4,15 +4,23 @@ Cache module for LlamaKV.
 This module provides caching strategies for the key-value store:
 - CacheStrategy: Base class for all caching strategies
 - LRUCache: Least Recently Used caching strategy
+- ShardedLRUCache: LRUCache split into independently locked shards
 - TTLCache: Time-To-Live caching strategy
+- ClockCache: CLOCK (second-chance) approximation of LRU
+- WTinyLFUCache: Window TinyLFU, frequency-based admission for higher hit rates
 """
 
 from llamakv.cache.strategy import CacheStrategy
-from llamakv.cache.lru import LRUCache
+from llamakv.cache.lru import LRUCache, ShardedLRUCache
 from llamakv.cache.ttl import TTLCache
+from llamakv.cache.clock import ClockCache
+from llamakv.cache.wtinylfu import WTinyLFUCache
 
 __all__ = [
     "CacheStrategy",
     "LRUCache",
-    "TTLCache"
+    "ShardedLRUCache",
+    "TTLCache",
+    "ClockCache",
+    "WTinyLFUCache"
 ] 
\ No newline at end of file
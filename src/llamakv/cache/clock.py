@@ -0,0 +1,215 @@
+"""
+CLOCK cache implementation for LlamaKV.
+
+This module provides a CLOCK (second-chance) caching strategy, an
+approximation of LRU whose reads never restructure the cache.
+"""
+
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from llamakv.core.key import Key
+from llamakv.core.value import Value
+from llamakv.cache.strategy import CacheStrategy
+
+
+class ClockCache(CacheStrategy):
+    """
+    CLOCK (second-chance) cache strategy.
+    
+    Entries live in a fixed ring of slots, each with a reference bit. A hit
+    only sets the bit, so reads take no lock. When the cache is full, a
+    hand sweeps the ring, clearing set bits and evicting the first entry
+    whose bit is already clear.
+    """
+    
+    def __init__(self, capacity: int = 1000, ttl_check: bool = True):
+        """
+        Initialize a CLOCK cache.
+        
+        Args:
+            capacity: Maximum number of items to store in the cache
+            ttl_check: Whether to check TTL on get operations
+        """
+        self._capacity = capacity
+        self._ttl_check = ttl_check
+        self._keys: List[Optional[Key]] = [None] * capacity
+        self._values: List[Optional[Value]] = [None] * capacity
+        self._ref = bytearray(capacity)
+        self._index: Dict[Key, int] = {}
+        self._free = list(range(capacity - 1, -1, -1))
+        self._hand = 0
+        self._lock = threading.Lock()  # taken by writers only
+        
+        # Stats (hot-path tallies are itertools.count objects, which next()
+        # advances atomically, so they are bumped outside the lock; each
+        # stats() read advances them once more, tracked by _peeks)
+        self._hits = itertools.count()
+        self._misses = itertools.count()
+        self._inserts = itertools.count()
+        self._peeks = 0
+        self._evictions = 0
+        self._expires = 0
+    
+    def _release(self, slot: int) -> None:
+        """Empty a slot and return it to the free list (caller must hold the lock)."""
+        del self._index[self._keys[slot]]
+        self._keys[slot] = None
+        self._values[slot] = None
+        self._ref[slot] = 0
+        self._free.append(slot)
+    
+    def get(self, key: Key) -> Optional[Value]:
+        """
+        Get a value from the cache.
+        
+        Args:
+            key: The key to look up
+            
+        Returns:
+            The value, or None if not found or expired
+        """
+        slot = self._index.get(key)
+        if slot is None:
+            next(self._misses)
+            return None
+        
+        # Writers store the key before the value, so reading the value first
+        # and then confirming the key detects a slot reused concurrently
+        value = self._values[slot]
+        if value is None or self._keys[slot] != key:
+            next(self._misses)
+            return None
+        
+        # Check if value is expired
+        if self._ttl_check and value.is_expired():
+            with self._lock:
+                if self._values[slot] is value:
+                    self._release(slot)
+                    self._expires += 1
+            next(self._misses)
+            return None
+        
+        self._ref[slot] = 1
+        next(self._hits)
+        return value
+    
+    def set(self, key: Key, value: Value) -> None:
+        """
+        Set a value in the cache.
+        
+        Args:
+            key: The key
+            value: The value
+        """
+        with self._lock:
+            slot = self._index.get(key)
+            if slot is not None:
+                self._values[slot] = value
+                self._ref[slot] = 1
+            else:
+                if self._free:
+                    slot = self._free.pop()
+                else:
+                    # Give referenced entries a second chance until the hand
+                    # finds one that has not been used since its last pass
+                    ref = self._ref
+                    hand = self._hand
+                    while ref[hand]:
+                        ref[hand] = 0
+                        hand = (hand + 1) % self._capacity
+                    self._hand = (hand + 1) % self._capacity
+                    
+                    self._release(hand)
+                    slot = self._free.pop()
+                    self._evictions += 1
+                
+                self._keys[slot] = key
+                self._values[slot] = value
+                self._index[key] = slot
+        
+        next(self._inserts)
+    
+    def delete(self, key: Key) -> bool:
+        """
+        Delete a key from the cache.
+        
+        Args:
+            key: The key
+            
+        Returns:
+            True if the key was deleted, False if it didn't exist
+        """
+        with self._lock:
+            slot = self._index.get(key)
+            if slot is None:
+                return False
+            self._release(slot)
+            return True
+    
+    def clear(self) -> None:
+        """Clear all keys from the cache."""
+        with self._lock:
+            self._index.clear()
+            self._keys = [None] * self._capacity
+            self._values = [None] * self._capacity
+            self._ref = bytearray(self._capacity)
+            self._free = list(range(self._capacity - 1, -1, -1))
+            self._hand = 0
+    
+    def evict_expired(self) -> int:
+        """
+        Evict expired items from the cache.
+        
+        Returns:
+            Number of items evicted
+        """
+        now = time.time()
+        with self._lock:
+            expired_slots = [
+                slot for slot in self._index.values()
+                if self._values[slot].is_expired(now)
+            ]
+            
+            for slot in expired_slots:
+                self._release(slot)
+            
+            self._expires += len(expired_slots)
+            return len(expired_slots)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the cache.
+        
+        Returns:
+            Dictionary of statistics
+        """
+        with self._lock:
+            peeks = self._peeks
+            self._peeks += 1
+            hits = next(self._hits) - peeks
+            misses = next(self._misses) - peeks
+            inserts = next(self._inserts) - peeks
+            size = len(self._index)
+            evictions = self._evictions
+            expires = self._expires
+        
+        # Build the result after the lock is released
+        total = hits + misses
+        hit_rate = (hits / total) * 100 if total > 0 else 0
+        
+        return {
+            'type': 'ClockCache',
+            'capacity': self._capacity,
+            'size': size,
+            'utilization': (size / self._capacity) * 100,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hit_rate,
+            'inserts': inserts,
+            'evictions': evictions,
+            'expires': expires,
+            'ttl_check': self._ttl_check
+        }
\ No newline at end of file
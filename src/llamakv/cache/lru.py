@@ -5,9 +5,11 @@ This module provides a Least Recently Used (LRU) caching strategy
 for the key-value store.
 """
 
+import itertools
 import threading
 import time
 from collections import OrderedDict
+from operator import methodcaller
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from llamakv.core.key import Key
@@ -15,6 +17,10 @@ from llamakv.core.value import Value
 from llamakv.cache.strategy import CacheStrategy
 
 
+# Sentinel for dict.pop lookups
+_MISSING = object()
+
+
 class LRUCache(CacheStrategy):
     """
     Least Recently Used (LRU) cache strategy.
@@ -33,13 +39,19 @@ class LRUCache(CacheStrategy):
         """
         self._capacity = capacity
         self._ttl_check = ttl_check
+        # OrderedDict rather than dict: move_to_end beats pop-and-reinsert on
+        # hits, and evicting from the front of a plain dict slows down as
+        # deleted slots pile up ahead of the first live entry
         self._cache = OrderedDict()  # type: OrderedDict[Key, Value]
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()  # no method re-enters the lock
         
-        # Stats
-        self._hits = 0
-        self._misses = 0
-        self._inserts = 0
+        # Stats (hot-path tallies are itertools.count objects, which next()
+        # advances atomically, so they are bumped outside the lock; each
+        # stats() read advances them once more, tracked by _peeks)
+        self._hits = itertools.count()
+        self._misses = itertools.count()
+        self._inserts = itertools.count()
+        self._peeks = 0
         self._evictions = 0
         self._expires = 0
     
@@ -54,25 +66,29 @@ class LRUCache(CacheStrategy):
             The value, or None if not found or expired
         """
         with self._lock:
-            if key not in self._cache:
-                self._misses += 1
-                return None
-            
-            value = self._cache[key]
-            
-            # Check if value is expired
-            if self._ttl_check and value.is_expired():
-                # Remove expired value from cache
-                self._cache.pop(key)
-                self._expires += 1
-                self._misses += 1
-                return None
-            
-            # Move to end (most recently used)
-            self._cache.move_to_end(key)
-            
-            self._hits += 1
-            return value
+            # Look up directly and treat KeyError as a miss, which saves a
+            # containment check on the hit path
+            try:
+                value = self._cache[key]
+            except KeyError:
+                value = None
+            else:
+                # Check if value is expired
+                if self._ttl_check and value.is_expired():
+                    # Remove expired value from cache
+                    self._cache.pop(key)
+                    self._expires += 1
+                    value = None
+                else:
+                    # Move to end (most recently used)
+                    self._cache.move_to_end(key)
+        
+        if value is None:
+            next(self._misses)
+            return None
+        
+        next(self._hits)
+        return value
     
     def set(self, key: Key, value: Value) -> None:
         """
@@ -83,17 +99,16 @@ class LRUCache(CacheStrategy):
             value: The value
         """
         with self._lock:
-            # If key already exists, remove it first
-            if key in self._cache:
-                self._cache.pop(key)
-            # If cache is full, remove least recently used item
-            elif len(self._cache) >= self._capacity:
+            # Remove the key if it already exists (one lookup), otherwise
+            # remove the least recently used item if the cache is full
+            if self._cache.pop(key, _MISSING) is _MISSING and len(self._cache) >= self._capacity:
                 self._cache.popitem(last=False)  # Remove first item (LRU)
                 self._evictions += 1
             
             # Add new key-value pair
             self._cache[key] = value
-            self._inserts += 1
+        
+        next(self._inserts)
     
     def delete(self, key: Key) -> bool:
         """
@@ -106,10 +121,11 @@ class LRUCache(CacheStrategy):
             True if the key was deleted, False if it didn't exist
         """
         with self._lock:
-            if key in self._cache:
-                self._cache.pop(key)
-                return True
-            return False
+            try:
+                del self._cache[key]
+            except KeyError:
+                return False
+            return True
     
     def clear(self) -> None:
         """Clear all keys from the cache."""
@@ -124,11 +140,10 @@ class LRUCache(CacheStrategy):
             Number of items evicted
         """
         with self._lock:
-            # Find expired keys
-            expired_keys = [
-                key for key, value in self._cache.items()
-                if value.is_expired()
-            ]
+            # Find expired keys (the loop runs in C via compress/map, and the
+            # clock is read once for the whole scan)
+            is_expired = methodcaller('is_expired', time.time())
+            expired_keys = list(itertools.compress(self._cache.keys(), map(is_expired, self._cache.values())))
             
             # Remove expired keys
             for key in expired_keys:
@@ -144,20 +159,152 @@ class LRUCache(CacheStrategy):
         Returns:
             Dictionary of statistics
         """
+        size, hits, misses, inserts, evictions, expires = self._counters()
+        
+        # Build the result after the lock is released
+        total = hits + misses
+        hit_rate = (hits / total) * 100 if total > 0 else 0
+        
+        return {
+            'type': 'LRUCache',
+            'capacity': self._capacity,
+            'size': size,
+            'utilization': (size / self._capacity) * 100,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hit_rate,
+            'inserts': inserts,
+            'evictions': evictions,
+            'expires': expires,
+            'ttl_check': self._ttl_check
+        }
+    
+    def _counters(self) -> Tuple[int, int, int, int, int, int]:
+        """
+        Snapshot the size and counters under the lock.
+        
+        Returns:
+            Tuple of (size, hits, misses, inserts, evictions, expires)
+        """
         with self._lock:
-            total = self._hits + self._misses
-            hit_rate = (self._hits / total) * 100 if total > 0 else 0
+            peeks = self._peeks
+            self._peeks += 1
+            return (len(self._cache),
+                    next(self._hits) - peeks,
+                    next(self._misses) - peeks,
+                    next(self._inserts) - peeks,
+                    self._evictions,
+                    self._expires)
+
+
+class ShardedLRUCache(CacheStrategy):
+    """
+    LRU cache split into independently locked shards.
+    
+    Keys are spread over ``num_shards`` LRUCache instances by hash, so
+    threads working on different keys rarely wait on the same lock. Each
+    shard evicts its own least recently used items, which makes eviction
+    approximately rather than strictly LRU across the whole cache.
+    """
+    
+    def __init__(self, capacity: int = 1000, ttl_check: bool = True, num_shards: int = 16):
+        """
+        Initialize a sharded LRU cache.
+        
+        Args:
+            capacity: Maximum number of items to store across all shards
+            ttl_check: Whether to check TTL on get operations
+            num_shards: Number of shards (rounded up to a power of two, but
+                never more than the capacity, so every shard holds an item)
+        """
+        shards = 1
+        while shards < num_shards and shards << 1 <= capacity:
+            shards <<= 1
+        
+        self._capacity = capacity
+        self._ttl_check = ttl_check
+        self._mask = shards - 1
+        
+        # Split the capacity so the shards add up to it exactly
+        base, extra = divmod(capacity, shards)
+        self._shards = [
+            LRUCache(max(1, base + (1 if i < extra else 0)), ttl_check)
+            for i in range(shards)
+        ]
+    
+    def get(self, key: Key) -> Optional[Value]:
+        """
+        Get a value from the cache.
+        
+        Args:
+            key: The key to look up
             
-            return {
-                'type': 'LRUCache',
-                'capacity': self._capacity,
-                'size': len(self._cache),
-                'utilization': (len(self._cache) / self._capacity) * 100,
-                'hits': self._hits,
-                'misses': self._misses,
-                'hit_rate': hit_rate,
-                'inserts': self._inserts,
-                'evictions': self._evictions,
-                'expires': self._expires,
-                'ttl_check': self._ttl_check
-            } 
\ No newline at end of file
+        Returns:
+            The value, or None if not found or expired
+        """
+        return self._shards[hash(key) & self._mask].get(key)
+    
+    def set(self, key: Key, value: Value) -> None:
+        """
+        Set a value in the cache.
+        
+        Args:
+            key: The key
+            value: The value
+        """
+        self._shards[hash(key) & self._mask].set(key, value)
+    
+    def delete(self, key: Key) -> bool:
+        """
+        Delete a key from the cache.
+        
+        Args:
+            key: The key
+            
+        Returns:
+            True if the key was deleted, False if it didn't exist
+        """
+        return self._shards[hash(key) & self._mask].delete(key)
+    
+    def clear(self) -> None:
+        """Clear all keys from the cache."""
+        for shard in self._shards:
+            shard.clear()
+    
+    def evict_expired(self) -> int:
+        """
+        Evict expired items from the cache.
+        
+        Returns:
+            Number of items evicted
+        """
+        return sum(shard.evict_expired() for shard in self._shards)
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the cache.
+        
+        Returns:
+            Dictionary of statistics
+        """
+        # Sum the raw shard counters rather than building a stats dict per shard
+        size, hits, misses, inserts, evictions, expires = (
+            sum(column) for column in zip(*(shard._counters() for shard in self._shards)))
+        
+        total = hits + misses
+        hit_rate = (hits / total) * 100 if total > 0 else 0
+        
+        return {
+            'type': 'ShardedLRUCache',
+            'capacity': self._capacity,
+            'shards': len(self._shards),
+            'size': size,
+            'utilization': (size / self._capacity) * 100,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hit_rate,
+            'inserts': inserts,
+            'evictions': evictions,
+            'expires': expires,
+            'ttl_check': self._ttl_check
+        }
\ No newline at end of file
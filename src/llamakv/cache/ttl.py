@@ -5,8 +5,12 @@ This module provides a Time-to-Live (TTL) caching strategy
 for the key-value store.
 """
 
+import heapq
+import itertools
+import sys
 import threading
 import time
+import weakref
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from llamakv.core.key import Key
@@ -41,21 +45,105 @@ class TTLCache(CacheStrategy):
         self._cleanup_interval = cleanup_interval
         self._max_size_bytes = max_size_bytes
         self._cache: Dict[Key, Value] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()  # no method re-enters the lock
+        
+        # Min-heap of (expiry, seq, key) for picking eviction victims; entries
+        # are invalidated lazily, an entry is live only while _seqs[key] == seq
+        self._expiry_heap: List[Tuple[float, int, Key]] = []
+        self._seqs: Dict[Key, int] = {}
+        self._seq = itertools.count()
         self._estimated_size_bytes = 0
+        self._sizes: Dict[Key, int] = {}  # per-item estimates, only kept with max_size_bytes
         self._last_cleanup = time.time()
         
-        # Stats
-        self._hits = 0
-        self._misses = 0
-        self._inserts = 0
+        # Stats (hot-path tallies are itertools.count objects, which next()
+        # advances atomically, so they are bumped outside the lock; each
+        # stats() read advances them once more, tracked by _peeks)
+        self._hits = itertools.count()
+        self._misses = itertools.count()
+        self._inserts = itertools.count()
+        self._peeks = 0
         self._evictions = 0
         self._expires = 0
         self._cleanups = 0
+        
+        # Expired items are cleaned up by a background thread, so reads never
+        # pay for it. The thread holds only a weak reference to the cache and
+        # exits once the cache is closed or garbage collected.
+        self._stopped = threading.Event()
+        self._cleanup_thread = threading.Thread(
+            target=self._cleanup_loop,
+            args=(weakref.ref(self), self._stopped, cleanup_interval),
+            daemon=True
+        )
+        self._cleanup_thread.start()
+    
+    @staticmethod
+    def _cleanup_loop(cache_ref: 'weakref.ref[TTLCache]', stopped: threading.Event, interval: float) -> None:
+        """
+        Thread function for periodic cleanup.
+        
+        Args:
+            cache_ref: Weak reference to the cache
+            stopped: Event set when the cache is closed
+            interval: Seconds between cleanups
+        """
+        while not stopped.wait(interval):
+            cache = cache_ref()
+            if cache is None:
+                return
+            try:
+                cache.cleanup()
+            except Exception as e:
+                # Log error but don't crash thread
+                pass
+            del cache
     
-    def _should_cleanup(self) -> bool:
-        """Check if it's time to clean up expired items."""
-        return time.time() - self._last_cleanup >= self._cleanup_interval
+    def close(self) -> None:
+        """Stop the background cleanup thread."""
+        self._stopped.set()
+    
+    def _push(self, key: Key, value: Value) -> None:
+        """Record a key's expiry in the heap (caller must hold the lock)."""
+        seq = next(self._seq)
+        self._seqs[key] = seq
+        expiry = value.expiry
+        heapq.heappush(self._expiry_heap, (expiry if expiry is not None else float('inf'), seq, key))
+        
+        # Drop stale entries once they outnumber the live ones
+        if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+            self._expiry_heap = [entry for entry in self._expiry_heap if self._seqs.get(entry[2]) == entry[1]]
+            heapq.heapify(self._expiry_heap)
+    
+    def _pop_soonest(self) -> Optional[Key]:
+        """
+        Pop the live key that expires soonest (caller must hold the lock).
+        
+        Returns:
+            The key, or None if the cache is empty
+        """
+        heap = self._expiry_heap
+        while heap:
+            _, seq, key = heapq.heappop(heap)
+            if self._seqs.get(key) == seq:
+                return key
+        return None
+    
+    def _remove(self, key: Key) -> Value:
+        """
+        Remove a key and its bookkeeping (caller must hold the lock).
+        
+        Args:
+            key: The key, which must be in the cache
+            
+        Returns:
+            The removed value
+        """
+        value = self._cache.pop(key)
+        self._seqs.pop(key, None)
+        if self._max_size_bytes is not None:
+            self._estimated_size_bytes -= self._sizes.pop(key, 0)
+        return value
     
     def _estimate_item_size(self, key: Key, value: Value) -> int:
         """
@@ -68,37 +156,9 @@ class TTLCache(CacheStrategy):
         Returns:
             Estimated size in bytes
         """
-        # This is a very rough estimate and depends on implementation details
-        # of Python objects, but it's better than nothing
-        key_size = len(str(key)) * 2  # Rough estimate
-        
-        # Estimate value size based on its type
-        value_dict = value.to_dict()
-        value_size = 0
-        
-        # Add size of value data
-        serialized_value = str(value_dict.get('value', ''))
-        value_size += len(serialized_value) * 2
-        
-        # Add metadata size
-        metadata = value_dict.get('metadata', {})
-        metadata_size = sum(len(str(k)) + len(str(v)) for k, v in metadata.items()) * 2
-        
-        # Add overhead for Python objects
-        overhead = 64  # Rough estimate for object headers and pointers
-        
-        return key_size + value_size + metadata_size + overhead
-    
-    def _update_size_bytes(self) -> None:
-        """Recalculate the total size of the cache in bytes."""
-        if self._max_size_bytes is None:
-            return
-        
-        total = 0
-        for key, value in self._cache.items():
-            total += self._estimate_item_size(key, value)
-        
-        self._estimated_size_bytes = total
+        # A rough estimate, measured from the value itself rather than from
+        # its to_dict() representation
+        return sys.getsizeof(str(key)) + value.estimated_size()
     
     def _enforce_size_limit(self) -> int:
         """
@@ -114,19 +174,14 @@ class TTLCache(CacheStrategy):
         if self._estimated_size_bytes <= self._max_size_bytes:
             return 0
         
-        # Sort items by TTL and evict those expiring soonest
-        items = [(k, v) for k, v in self._cache.items()]
-        # Sort by expiry time, with items without TTL (None) at the end
-        items.sort(key=lambda x: x[1].expiry if x[1].expiry is not None else float('inf'))
-        
+        # Evict the items expiring soonest, items without TTL last
         evicted = 0
-        for key, value in items:
-            if self._estimated_size_bytes <= self._max_size_bytes:
+        while self._estimated_size_bytes > self._max_size_bytes:
+            key = self._pop_soonest()
+            if key is None:
                 break
-                
-            size = self._estimate_item_size(key, value)
-            del self._cache[key]
-            self._estimated_size_bytes -= size
+            
+            self._remove(key)
             evicted += 1
             self._evictions += 1
         
@@ -141,22 +196,21 @@ class TTLCache(CacheStrategy):
         """
         with self._lock:
             now = time.time()
-            expired_keys = [
-                key for key, value in self._cache.items()
-                if value.is_expired()
-            ]
             
-            # Remove expired keys
-            for key in expired_keys:
-                if self._max_size_bytes is not None:
-                    self._estimated_size_bytes -= self._estimate_item_size(key, self._cache[key])
-                del self._cache[key]
+            # Expired items sit at the top of the heap
+            expired = 0
+            heap = self._expiry_heap
+            while heap and heap[0][0] <= now:
+                _, seq, key = heapq.heappop(heap)
+                if self._seqs.get(key) == seq:
+                    self._remove(key)
+                    expired += 1
             
-            self._expires += len(expired_keys)
+            self._expires += expired
             self._cleanups += 1
             self._last_cleanup = now
             
-            return len(expired_keys)
+            return expired
     
     def get(self, key: Key) -> Optional[Value]:
         """
@@ -169,28 +223,21 @@ class TTLCache(CacheStrategy):
             The value, or None if not found or expired
         """
         with self._lock:
-            # Run cleanup if needed
-            if self._should_cleanup():
-                self.cleanup()
-            
-            if key not in self._cache:
-                self._misses += 1
-                return None
-            
-            value = self._cache[key]
+            value = self._cache.get(key)
             
             # Check if value is expired
-            if value.is_expired():
+            if value is not None and value.is_expired():
                 # Remove expired value from cache
-                if self._max_size_bytes is not None:
-                    self._estimated_size_bytes -= self._estimate_item_size(key, value)
-                del self._cache[key]
+                self._remove(key)
                 self._expires += 1
-                self._misses += 1
-                return None
-            
-            self._hits += 1
-            return value
+                value = None
+        
+        if value is None:
+            next(self._misses)
+            return None
+        
+        next(self._hits)
+        return value
     
     def set(self, key: Key, value: Value) -> None:
         """
@@ -200,49 +247,41 @@ class TTLCache(CacheStrategy):
             key: The key
             value: The value
         """
+        # Set default TTL if not specified (a copy, since Value objects are
+        # shared with the backend); done before locking, like the size estimate
+        if value.ttl is None and self._default_ttl > 0:
+            value = value.with_ttl(self._default_ttl)
+        
+        # Calculate size of the new item once; removals reuse it
+        if self._max_size_bytes is not None:
+            new_size = self._estimate_item_size(key, value)
+        
         with self._lock:
-            # Set default TTL if not specified
-            if value.ttl is None and self._default_ttl > 0:
-                # We need to create a new value with the default TTL
-                # This is a bit hacky but necessary since Value objects are immutable
-                value_dict = value.to_dict()
-                value_dict['ttl'] = self._default_ttl
-                
-                # Create a new Value object with the same class
-                value_class = type(value)
-                value = value_class.from_dict(value_dict)
-            
-            # Calculate size of the new item
             if self._max_size_bytes is not None:
-                new_size = self._estimate_item_size(key, value)
-                
                 # If key already exists, remove its size from the total
-                if key in self._cache:
-                    self._estimated_size_bytes -= self._estimate_item_size(key, self._cache[key])
+                self._estimated_size_bytes -= self._sizes.get(key, 0)
                 
                 # Add new size
+                self._sizes[key] = new_size
                 self._estimated_size_bytes += new_size
             
             # If cache is full, evict items
             if len(self._cache) >= self._capacity and key not in self._cache:
-                # Sort items by TTL and evict those expiring soonest
-                items = [(k, v) for k, v in self._cache.items()]
-                items.sort(key=lambda x: x[1].expiry if x[1].expiry is not None else float('inf'))
-                
                 # Remove the item with the smallest TTL
-                evict_key, evict_value = items[0]
-                if self._max_size_bytes is not None:
-                    self._estimated_size_bytes -= self._estimate_item_size(evict_key, evict_value)
-                del self._cache[evict_key]
-                self._evictions += 1
+                evict_key = self._pop_soonest()
+                if evict_key is not None:
+                    self._remove(evict_key)
+                    self._evictions += 1
             
             # Add new key-value pair
             self._cache[key] = value
-            self._inserts += 1
+            self._push(key, value)
             
             # Enforce size limit
             if self._max_size_bytes is not None:
                 self._enforce_size_limit()
+        
+        next(self._inserts)
     
     def delete(self, key: Key) -> bool:
         """
@@ -255,17 +294,19 @@ class TTLCache(CacheStrategy):
             True if the key was deleted, False if it didn't exist
         """
         with self._lock:
-            if key in self._cache:
-                if self._max_size_bytes is not None:
-                    self._estimated_size_bytes -= self._estimate_item_size(key, self._cache[key])
-                del self._cache[key]
-                return True
-            return False
+            try:
+                self._remove(key)
+            except KeyError:
+                return False
+            return True
     
     def clear(self) -> None:
         """Clear all keys from the cache."""
         with self._lock:
             self._cache.clear()
+            self._expiry_heap.clear()
+            self._seqs.clear()
+            self._sizes.clear()
             if self._max_size_bytes is not None:
                 self._estimated_size_bytes = 0
     
@@ -277,31 +318,44 @@ class TTLCache(CacheStrategy):
             Dictionary of statistics
         """
         with self._lock:
-            total = self._hits + self._misses
-            hit_rate = (self._hits / total) * 100 if total > 0 else 0
-            
-            stats = {
-                'type': 'TTLCache',
-                'capacity': self._capacity,
-                'size': len(self._cache),
-                'utilization': (len(self._cache) / self._capacity) * 100,
-                'hits': self._hits,
-                'misses': self._misses,
-                'hit_rate': hit_rate,
-                'inserts': self._inserts,
-                'evictions': self._evictions,
-                'expires': self._expires,
-                'cleanups': self._cleanups,
-                'default_ttl': self._default_ttl,
-                'cleanup_interval': self._cleanup_interval,
-                'last_cleanup': self._last_cleanup
-            }
-            
-            if self._max_size_bytes is not None:
-                stats.update({
-                    'max_size_bytes': self._max_size_bytes,
-                    'estimated_size_bytes': self._estimated_size_bytes,
-                    'size_utilization': (self._estimated_size_bytes / self._max_size_bytes) * 100
-                })
-            
-            return stats 
\ No newline at end of file
+            peeks = self._peeks
+            self._peeks += 1
+            hits = next(self._hits) - peeks
+            misses = next(self._misses) - peeks
+            inserts = next(self._inserts) - peeks
+            size = len(self._cache)
+            evictions = self._evictions
+            expires = self._expires
+            cleanups = self._cleanups
+            last_cleanup = self._last_cleanup
+            estimated_size_bytes = self._estimated_size_bytes
+        
+        # Build the result after the lock is released
+        total = hits + misses
+        hit_rate = (hits / total) * 100 if total > 0 else 0
+        
+        stats = {
+            'type': 'TTLCache',
+            'capacity': self._capacity,
+            'size': size,
+            'utilization': (size / self._capacity) * 100,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hit_rate,
+            'inserts': inserts,
+            'evictions': evictions,
+            'expires': expires,
+            'cleanups': cleanups,
+            'default_ttl': self._default_ttl,
+            'cleanup_interval': self._cleanup_interval,
+            'last_cleanup': last_cleanup
+        }
+        
+        if self._max_size_bytes is not None:
+            stats.update({
+                'max_size_bytes': self._max_size_bytes,
+                'estimated_size_bytes': estimated_size_bytes,
+                'size_utilization': (estimated_size_bytes / self._max_size_bytes) * 100
+            })
+        
+        return stats
\ No newline at end of file
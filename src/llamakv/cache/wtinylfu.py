@@ -0,0 +1,354 @@
+"""
+W-TinyLFU cache implementation for LlamaKV.
+
+This module provides a Window TinyLFU caching strategy, which pairs a small
+LRU admission window with a segmented LRU main region and admits entries to
+the main region based on their estimated access frequency.
+"""
+
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from llamakv.core.key import Key
+from llamakv.core.value import Value
+from llamakv.cache.strategy import CacheStrategy
+
+
+# Mixing constants for the sketch's four hash functions
+_SEEDS = (0x97CB3127, 0xB8F5A0E5, 0x9A6E4F77, 0xD4A1C3E9)
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# Halves every 4-bit counter of a word after it is shifted right by one
+_RESET_MASK = 0x7777777777777777
+
+
+class CountMinSketch:
+    """
+    Count-min sketch of 4-bit counters for estimating access frequency.
+    
+    Sixteen counters are packed into each 64-bit word. An item maps to one
+    group of four counters per word for each of four hash functions, and
+    its frequency is the smallest of them. Once the number of increments
+    reaches the sample size, every counter is halved so old popularity
+    fades.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize a sketch sized for a cache.
+        
+        Args:
+            capacity: Number of entries the owning cache holds
+        """
+        width = 1
+        while width < max(capacity, 16):
+            width <<= 1
+        self._mask = width - 1
+        self._table = array('Q', bytes(8 * width))
+        self._sample_size = 10 * max(capacity, 1)
+        self._size = 0
+    
+    def _slots(self, item_hash: int) -> List[Tuple[int, int]]:
+        """
+        Get the (word index, bit shift) of each counter for an item.
+        
+        Args:
+            item_hash: Hash of the item
+            
+        Returns:
+            List of four (index, shift) pairs
+        """
+        item_hash &= _MASK64
+        start = (item_hash & 3) << 2
+        slots = []
+        for i, seed in enumerate(_SEEDS):
+            h = ((item_hash + seed) * seed) & _MASK64
+            h += h >> 32
+            slots.append((h & self._mask, (start + i) << 2))
+        return slots
+    
+    def frequency(self, item_hash: int) -> int:
+        """
+        Estimate how often an item has been seen.
+        
+        Args:
+            item_hash: Hash of the item
+            
+        Returns:
+            Estimated frequency, from 0 to 15
+        """
+        table = self._table
+        return min((table[index] >> shift) & 0xF for index, shift in self._slots(item_hash))
+    
+    def increment(self, item_hash: int) -> None:
+        """
+        Record an occurrence of an item.
+        
+        Args:
+            item_hash: Hash of the item
+        """
+        table = self._table
+        added = False
+        for index, shift in self._slots(item_hash):
+            if (table[index] >> shift) & 0xF < 15:
+                table[index] += 1 << shift
+                added = True
+        
+        if added:
+            self._size += 1
+            if self._size >= self._sample_size:
+                self._reset()
+    
+    def _reset(self) -> None:
+        """Halve every counter."""
+        table = self._table
+        for index in range(len(table)):
+            table[index] = (table[index] >> 1) & _RESET_MASK
+        self._size //= 2
+    
+    def clear(self) -> None:
+        """Reset every counter to zero."""
+        self._table = array('Q', bytes(8 * len(self._table)))
+        self._size = 0
+
+
+class WTinyLFUCache(CacheStrategy):
+    """
+    Window TinyLFU cache strategy.
+    
+    New entries go into a small LRU window (about 1% of the capacity).
+    Entries pushed out of the window compete with the main region's
+    eviction victim, and only the one the frequency sketch has seen more
+    often is kept. The main region is a segmented LRU: entries start in a
+    probation segment and move to a protected segment (80% of the main
+    region) when they are hit again. This keeps one-off scans from
+    flushing frequently used entries.
+    """
+    
+    def __init__(self, capacity: int = 1000, ttl_check: bool = True):
+        """
+        Initialize a W-TinyLFU cache.
+        
+        Args:
+            capacity: Maximum number of items to store in the cache
+            ttl_check: Whether to check TTL on get operations
+        """
+        self._capacity = capacity
+        self._ttl_check = ttl_check
+        self._window_capacity = max(1, capacity // 100)
+        self._main_capacity = capacity - self._window_capacity
+        self._protected_capacity = int(self._main_capacity * 0.8)
+        self._window = OrderedDict()  # type: OrderedDict[Key, Value]
+        self._probation = OrderedDict()  # type: OrderedDict[Key, Value]
+        self._protected = OrderedDict()  # type: OrderedDict[Key, Value]
+        self._sketch = CountMinSketch(capacity)
+        self._lock = threading.Lock()  # no method re-enters the lock
+        
+        # Stats
+        self._hits = 0
+        self._misses = 0
+        self._inserts = 0
+        self._evictions = 0
+        self._rejections = 0
+        self._expires = 0
+    
+    def _pop(self, key: Key) -> Optional[Value]:
+        """Remove a key from whichever region holds it (caller must hold the lock)."""
+        for region in (self._window, self._probation, self._protected):
+            value = region.pop(key, None)
+            if value is not None:
+                return value
+        return None
+    
+    def _promote(self, key: Key, value: Value) -> None:
+        """Move a probation entry to the protected segment (caller must hold the lock)."""
+        del self._probation[key]
+        self._protected[key] = value
+        
+        # Demote the protected segment's least recently used entry
+        if len(self._protected) > self._protected_capacity:
+            demoted_key, demoted_value = self._protected.popitem(last=False)
+            self._probation[demoted_key] = demoted_value
+    
+    def _admit(self, key: Key, value: Value) -> None:
+        """
+        Offer an entry evicted from the window to the main region (caller must hold the lock).
+        
+        Args:
+            key: The candidate key
+            value: The candidate value
+        """
+        if len(self._probation) + len(self._protected) < self._main_capacity:
+            self._probation[key] = value
+            return
+        
+        # The main region is full, so the candidate has to beat its victim
+        victims = self._probation or self._protected
+        if not victims:
+            self._rejections += 1
+            self._evictions += 1
+            return
+        
+        victim_key = next(iter(victims))
+        if self._sketch.frequency(hash(key)) > self._sketch.frequency(hash(victim_key)):
+            del victims[victim_key]
+            self._probation[key] = value
+        else:
+            self._rejections += 1
+        self._evictions += 1
+    
+    def get(self, key: Key) -> Optional[Value]:
+        """
+        Get a value from the cache.
+        
+        Args:
+            key: The key to look up
+            
+        Returns:
+            The value, or None if not found or expired
+        """
+        with self._lock:
+            self._sketch.increment(hash(key))
+            
+            if key in self._window:
+                value = self._window[key]
+                region = self._window
+            elif key in self._probation:
+                value = self._probation[key]
+                region = self._probation
+            elif key in self._protected:
+                value = self._protected[key]
+                region = self._protected
+            else:
+                self._misses += 1
+                return None
+            
+            # Check if value is expired
+            if self._ttl_check and value.is_expired():
+                del region[key]
+                self._expires += 1
+                self._misses += 1
+                return None
+            
+            # Record the hit in the entry's region
+            if region is self._probation:
+                self._promote(key, value)
+            else:
+                region.move_to_end(key)
+            
+            self._hits += 1
+            return value
+    
+    def set(self, key: Key, value: Value) -> None:
+        """
+        Set a value in the cache.
+        
+        Args:
+            key: The key
+            value: The value
+        """
+        with self._lock:
+            self._sketch.increment(hash(key))
+            self._inserts += 1
+            
+            # Overwrite in place, counting the write as an access
+            for region in (self._window, self._protected):
+                if key in region:
+                    region[key] = value
+                    region.move_to_end(key)
+                    return
+            if key in self._probation:
+                self._probation[key] = value
+                self._promote(key, value)
+                return
+            
+            # New entries start in the window; its overflow competes for
+            # a place in the main region
+            self._window[key] = value
+            if len(self._window) > self._window_capacity:
+                candidate_key, candidate_value = self._window.popitem(last=False)
+                self._admit(candidate_key, candidate_value)
+    
+    def delete(self, key: Key) -> bool:
+        """
+        Delete a key from the cache.
+        
+        Args:
+            key: The key
+            
+        Returns:
+            True if the key was deleted, False if it didn't exist
+        """
+        with self._lock:
+            return self._pop(key) is not None
+    
+    def clear(self) -> None:
+        """Clear all keys from the cache."""
+        with self._lock:
+            self._window.clear()
+            self._probation.clear()
+            self._protected.clear()
+            self._sketch.clear()
+    
+    def evict_expired(self) -> int:
+        """
+        Evict expired items from the cache.
+        
+        Returns:
+            Number of items evicted
+        """
+        now = time.time()
+        with self._lock:
+            evicted = 0
+            for region in (self._window, self._probation, self._protected):
+                expired_keys = [key for key, value in region.items() if value.is_expired(now)]
+                for key in expired_keys:
+                    del region[key]
+                evicted += len(expired_keys)
+            
+            self._expires += evicted
+            return evicted
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the cache.
+        
+        Returns:
+            Dictionary of statistics
+        """
+        with self._lock:
+            window_size = len(self._window)
+            probation_size = len(self._probation)
+            protected_size = len(self._protected)
+            hits = self._hits
+            misses = self._misses
+            inserts = self._inserts
+            evictions = self._evictions
+            rejections = self._rejections
+            expires = self._expires
+        
+        # Build the result after the lock is released
+        size = window_size + probation_size + protected_size
+        total = hits + misses
+        hit_rate = (hits / total) * 100 if total > 0 else 0
+        
+        return {
+            'type': 'WTinyLFUCache',
+            'capacity': self._capacity,
+            'size': size,
+            'utilization': (size / self._capacity) * 100,
+            'window_size': window_size,
+            'probation_size': probation_size,
+            'protected_size': protected_size,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hit_rate,
+            'inserts': inserts,
+            'evictions': evictions,
+            'rejections': rejections,
+            'expires': expires,
+            'ttl_check': self._ttl_check
+        }
\ No newline at end of file
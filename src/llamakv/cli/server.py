@@ -10,7 +10,7 @@ import logging
 import os
 import signal
 import sys
-import time
+import threading
 
 from llamakv.core.store import KVStore
 from llamakv.persistence import MemoryBackend, FileBackend, SQLiteBackend
@@ -162,12 +162,12 @@ def create_backend(args):
         )
 
 
-def handle_signals(server):
+def handle_signals(server, shutdown_event):
     """Set up signal handlers for graceful shutdown."""
     def signal_handler(signum, frame):
         logging.info(f"Received signal {signum}, shutting down...")
         server.shutdown()
-        sys.exit(0)
+        shutdown_event.set()
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -201,15 +201,15 @@ def main():
         )
         
         # Handle signals
-        handle_signals(server)
+        shutdown_event = threading.Event()
+        handle_signals(server, shutdown_event)
         
         # Start server
         server.start()
         logging.info(f"Server started at http://{args.host}:{args.port}")
         
-        # Keep main thread alive
-        while True:
-            time.sleep(1)
+        # Block the main thread until a signal handler requests shutdown
+        shutdown_event.wait()
             
     except Exception as e:
         logging.error(f"Error starting server: {e}")
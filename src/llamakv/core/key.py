@@ -5,8 +5,31 @@ This module provides the Key class for representing and manipulating
 keys in the key-value store.
 """
 
+import functools
 import hashlib
-from typing import Any, Union, Optional
+import re
+import sys
+from typing import Any, Dict, Tuple, Union, Optional
+
+
+# Maximum number of shared Key instances kept by Key.acquire
+KEY_POOL_SIZE = 1024
+
+_POOL: Dict[Tuple[Any, ...], 'Key'] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> 're.Pattern':
+    """
+    Compile a key filter pattern, reusing earlier compilations.
+    
+    Args:
+        pattern: Regular expression matched against key strings
+        
+    Returns:
+        The compiled pattern
+    """
+    return re.compile(pattern)
 
 
 class Key:
@@ -17,6 +40,8 @@ class Key:
     consistent lookup and storage. Keys are immutable and hashable.
     """
     
+    __slots__ = ("_value", "_namespace", "_key_str", "_key_hash", "_hash")
+    
     def __init__(self, value: Any, namespace: Optional[str] = None):
         """
         Initialize a key with a value and optional namespace.
@@ -28,23 +53,32 @@ class Key:
         Raises:
             TypeError: If the value is not hashable
         """
-        # Ensure the value is hashable
-        try:
-            hash(value)
-        except TypeError:
-            raise TypeError(f"Key value must be hashable, got {type(value)}")
-        
         self._value = value
-        self._namespace = namespace
+        # Namespaces repeat across many keys; interning shares one string
+        # object, so namespace comparisons usually succeed on identity
+        self._namespace = sys.intern(namespace) if type(namespace) is str else namespace
+        
+        # Plain strings are by far the most common keys; they are always
+        # hashable and normalize to themselves
+        if type(value) is str:
+            normalized = value
+        else:
+            # Ensure the value is hashable
+            try:
+                hash(value)
+            except TypeError:
+                raise TypeError(f"Key value must be hashable, got {type(value)}")
+            normalized = self._normalize_value(value)
         
         # Compute the normalized key string
         if namespace:
-            self._key_str = f"{namespace}:{self._normalize_value(value)}"
+            self._key_str = f"{namespace}:{normalized}"
         else:
-            self._key_str = self._normalize_value(value)
+            self._key_str = normalized
         
-        # Compute a hash for the key
-        self._key_hash = hashlib.md5(self._key_str.encode('utf-8')).hexdigest()
+        # Hash once for dict lookups; the hex digest is only built on demand
+        self._hash = hash(self._key_str)
+        self._key_hash: Optional[str] = None
     
     @property
     def value(self) -> Any:
@@ -58,7 +92,11 @@ class Key:
     
     @property
     def hash(self) -> str:
-        """Get the key hash."""
+        """Get the key hash (computed on first access)."""
+        if self._key_hash is None:
+            # BLAKE2b with a 16-byte digest keeps the 32-character hex form of
+            # the former MD5 digest and is faster to compute
+            self._key_hash = hashlib.blake2b(self._key_str.encode('utf-8'), digest_size=16).hexdigest()
         return self._key_hash
     
     def _normalize_value(self, value: Any) -> str:
@@ -94,7 +132,7 @@ class Key:
     
     def __hash__(self) -> int:
         """Get the hash value for the key."""
-        return hash(self._key_str)
+        return self._hash
     
     def __eq__(self, other: Any) -> bool:
         """
@@ -110,6 +148,42 @@ class Key:
             return False
         return self._key_str == other._key_str
     
+    @classmethod
+    def acquire(cls, value: Any, namespace: Optional[str] = None) -> 'Key':
+        """
+        Get a shared key instance for a value and optional namespace.
+        
+        Keys are immutable, so a single instance can safely be reused by
+        every caller that asks for the same key. Reusing instances avoids
+        recomputing the normalized string and hash for hot keys. The pool
+        is bounded and is reset once it reaches KEY_POOL_SIZE entries.
+        
+        Args:
+            value: The key value (str, int, bytes, or any hashable object)
+            namespace: Optional namespace to scope the key
+            
+        Returns:
+            A Key instance
+            
+        Raises:
+            TypeError: If the value is not hashable
+        """
+        # The value type is part of the pool key because 1, 1.0 and True
+        # compare equal but normalize to different key strings
+        pool_key = (cls, type(value), value, namespace)
+        try:
+            return _POOL[pool_key]
+        except KeyError:
+            pass
+        except TypeError:
+            raise TypeError(f"Key value must be hashable, got {type(value)}")
+        
+        key = cls(value, namespace)
+        if len(_POOL) >= KEY_POOL_SIZE:
+            _POOL.clear()
+        _POOL[pool_key] = key
+        return key
+    
     @classmethod
     def from_string(cls, key_str: str) -> 'Key':
         """
@@ -127,6 +201,7 @@ class Key:
         # Check if the key has a namespace
         if ':' in key_str:
             namespace, value = key_str.split(':', 1)
-            return cls(value, namespace)
+            return cls.acquire(value, namespace)
         else:
-            return cls(key_str) 
\ No newline at end of file
+            return cls.acquire(key_str)
+ 
\ No newline at end of file
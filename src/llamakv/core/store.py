@@ -6,9 +6,13 @@ key-value storage functionality with support for different backends,
 caching strategies, and distributed operations.
 """
 
+import functools
+import heapq
+import itertools
 import logging
+import threading
 import time
-from contextlib import contextmanager
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Set, Type, TypeVar, Union, Iterator, Tuple, Generic, Callable
 
 from llamakv.core.key import Key
@@ -21,6 +25,35 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 V = TypeVar('V', bound=Value)
 
+# Value classes for the built-in types, keyed by exact type (bool is an int
+# subclass and has always been stored as an IntValue)
+_VALUE_TYPES: Dict[type, Type[Value]] = {
+    str: StringValue,
+    int: IntValue,
+    bool: IntValue,
+    float: FloatValue,
+    bytes: BytesValue,
+    dict: JsonValue,
+}
+
+
+@functools.lru_cache(maxsize=8192, typed=True)
+def _make_key(key: Any) -> Key:
+    """
+    Build a Key from a raw key, reusing earlier results for hot keys.
+    
+    Args:
+        key: Input key (string in "namespace:key" form, or any hashable value)
+        
+    Returns:
+        Key object
+    """
+    if isinstance(key, str) and ':' in key:
+        # Handle namespace:key format
+        namespace, value = key.split(':', 1)
+        return Key(value, namespace)
+    return Key(key)
+
 
 class KVStore:
     """
@@ -39,6 +72,8 @@ class KVStore:
         default_ttl: Optional[int] = None,
         auto_purge_expired: bool = True,
         purge_interval: int = 60,
+        negative_cache_ttl: Optional[float] = None,
+        negative_cache_size: int = 100,
     ):
         """
         Initialize a new KV store.
@@ -50,6 +85,9 @@ class KVStore:
             default_ttl: Default time-to-live for values (in seconds)
             auto_purge_expired: Whether to automatically purge expired values
             purge_interval: Interval for purging expired values (in seconds)
+            negative_cache_ttl: How long to remember that a key is missing from
+                the backend (in seconds), or None to always ask the backend
+            negative_cache_size: Maximum number of missing keys to remember
         """
         self._backend = backend or MemoryBackend()
         self._cache = cache_strategy or LRUCache()
@@ -58,6 +96,34 @@ class KVStore:
         self._auto_purge = auto_purge_expired
         self._purge_interval = purge_interval
         self._last_purge = time.time()
+        self._next_purge = self._last_purge + purge_interval
+        
+        # Min-heap of (expiry, seq, key) so purges only visit keys that are due;
+        # seq breaks ties without comparing keys. _expiry_seqs maps each key
+        # to the seq of its live entry, so entries left behind by overwrites
+        # and deletes are recognized as stale without a backend lookup
+        self._expiry_heap: List[Tuple[float, int, Key]] = []
+        self._expiry_seqs: Dict[Key, int] = {}
+        self._expiry_seq = itertools.count()
+        self._expiry_lock = threading.Lock()
+        
+        # Keys the backend recently reported missing, mapped to the time.time()
+        # deadline after which the backend is asked again. Kept apart from the
+        # cache so misses never evict real values; writes go through
+        # _on_backend_set, which forgets the key
+        self._negative_ttl = negative_cache_ttl
+        self._negative_size = negative_cache_size
+        self._negative: 'OrderedDict[Key, float]' = OrderedDict()
+        self._negative_lock = threading.Lock()
+        # Backend reads in progress that may record a miss, mapped to a token
+        # of the reader; _on_backend_set drops the key, so a set that lands
+        # between the backend miss and the insert cancels the insert
+        self._negative_pending: Dict[Key, object] = {}
+        
+        # Track TTLs of values already held by the backend
+        for key, value in self._items():
+            if value.expiry is not None:
+                self._schedule_expiry(key, value.expiry)
         
         # Register hooks for backend events
         self._backend.register_on_set(self._on_backend_set)
@@ -66,71 +132,173 @@ class KVStore:
         logger.info(f"Initialized KVStore with backend: {type(self._backend).__name__}, "
                    f"cache: {type(self._cache).__name__}")
     
-    def _maybe_purge_expired(self) -> None:
-        """Purge expired values if auto_purge is enabled and interval has passed."""
+    def _maybe_purge_expired(self) -> Optional[float]:
+        """
+        Purge expired values if auto_purge is enabled and interval has passed.
+        
+        Returns:
+            The time.time() timestamp read for the check, which callers pass
+            on to Value.is_expired so the clock is read once per operation,
+            or None if auto_purge is disabled and the clock was not read
+        """
         if not self._auto_purge:
-            return
+            return None
             
         now = time.time()
-        if now - self._last_purge >= self._purge_interval:
+        if now >= self._next_purge:
             self.purge_expired()
-            self._last_purge = now
+        return now
+    
+    def _schedule_expiry(self, key: Key, expiry: float) -> None:
+        """
+        Record when a key's value expires.
+        
+        Args:
+            key: The key
+            expiry: Expiry timestamp
+        """
+        with self._expiry_lock:
+            seq = next(self._expiry_seq)
+            self._expiry_seqs[key] = seq
+            heapq.heappush(self._expiry_heap, (expiry, seq, key))
+            
+            # Drop stale entries once they outnumber the live ones
+            if len(self._expiry_heap) > 2 * len(self._expiry_seqs) + 64:
+                self._expiry_heap = [
+                    entry for entry in self._expiry_heap
+                    if self._expiry_seqs.get(entry[2]) == entry[1]
+                ]
+                heapq.heapify(self._expiry_heap)
+    
+    def _unschedule_expiry(self, key: Key) -> None:
+        """
+        Forget a key's recorded expiry, leaving its heap entry stale.
+        
+        Args:
+            key: The key
+        """
+        if key in self._expiry_seqs:
+            with self._expiry_lock:
+                self._expiry_seqs.pop(key, None)
     
     def _on_backend_set(self, key: Key, value: Value) -> None:
-        """Callback for backend set operations to update cache."""
+        """Callback for backend set operations to update cache and expiry tracking."""
         self._cache.set(key, value)
+        if self._negative or self._negative_pending:
+            with self._negative_lock:
+                self._negative.pop(key, None)
+                self._negative_pending.pop(key, None)
+        
+        expiry = value.expiry
+        if expiry is not None:
+            self._schedule_expiry(key, expiry)
+        else:
+            self._unschedule_expiry(key)
     
     def _on_backend_delete(self, key: Key) -> None:
-        """Callback for backend delete operations to update cache."""
+        """Callback for backend delete operations to update cache and expiry tracking."""
         self._cache.delete(key)
+        self._unschedule_expiry(key)
     
-    def _process_key(self, key: Any) -> Key:
+    def _lookup(self, key: Key, now: Optional[float]) -> Tuple[Optional[Value], bool]:
         """
-        Process a key input into a Key object.
+        Look a key up in the cache, falling back to the backend on a miss.
         
         Args:
-            key: Input key (can be Key object, string, or any hashable value)
+            key: The processed key
+            now: time.time() timestamp of the operation, or None if not read yet
             
         Returns:
-            Key object
+            Tuple of (value or None if missing, whether the cache had it)
         """
-        if isinstance(key, Key):
-            return key
-        elif isinstance(key, str) and ':' in key:
-            # Handle namespace:key format
-            namespace, value = key.split(':', 1)
-            return Key(value, namespace)
-        else:
-            return Key(key)
+        value = self._cache.get(key)
+        if value is not None:
+            return value, True
+        
+        if self._negative_ttl is None:
+            value = self._backend.get(key)
+            if value is not None:
+                self._cache.set(key, value)
+            return value, False
+        
+        # Skip the backend while the key is remembered as missing
+        if now is None:
+            now = time.time()
+        deadline = self._negative.get(key)
+        if deadline is not None and now < deadline:
+            return None, False
+        
+        token = object()
+        with self._negative_lock:
+            self._negative_pending[key] = token
+        
+        value = self._backend.get(key)
+        
+        with self._negative_lock:
+            if self._negative_pending.get(key) is not token:
+                # Set since the read, or another reader took over the key
+                return value, False
+            del self._negative_pending[key]
+            
+            if value is None:
+                self._negative[key] = now + self._negative_ttl
+                self._negative.move_to_end(key)
+                while len(self._negative) > self._negative_size:
+                    self._negative.popitem(last=False)
+                return None, False
+        
+        self._cache.set(key, value)
+        return value, False
     
-    def set(
+    def _items(self, pattern: Optional[str] = None, namespace: Optional[str] = None) -> List[Tuple[Key, Value]]:
+        """
+        Get key-value pairs from the backend in a single scan.
+        
+        Args:
+            pattern: Optional pattern to filter keys
+            namespace: Optional namespace to filter keys
+            
+        Returns:
+            List of (key, value) tuples
+        """
+        if hasattr(self._backend, 'items'):
+            return self._backend.items(pattern, namespace)
+        
+        # Fall back to one lookup per key for backends without items()
+        result = []
+        for key in self._backend.keys(pattern, namespace):
+            value = self._backend.get(key)
+            if value is not None:
+                result.append((key, value))
+        return result
+    
+    def _make_value(
         self,
-        key: Any,
         value: Any,
         ttl: Optional[int] = None,
         value_type: Optional[Type[Value]] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> None:
+    ) -> Value:
         """
-        Set a value for a key.
+        Wrap a raw value in a Value object.
         
         Args:
-            key: The key (can be Key object, string, or any hashable value)
             value: The value to store
             ttl: Time-to-live in seconds (defaults to store default)
             value_type: Value class to use (auto-detected if not specified)
             metadata: Optional metadata to store with the value
+            
+        Returns:
+            Value object
         """
-        self._maybe_purge_expired()
-        
-        # Process the key
-        key_obj = self._process_key(key)
-        
         # Use default TTL if not specified
         if ttl is None:
             ttl = self._default_ttl
         
-        # Auto-detect value type if not specified
+        # Auto-detect value type if not specified: an exact type match is a
+        # single dict lookup, and only subclasses fall through to isinstance
+        if value_type is None:
+            value_type = _VALUE_TYPES.get(type(value))
         if value_type is None:
             if isinstance(value, str):
                 value_type = StringValue
@@ -145,15 +313,56 @@ class KVStore:
             else:
                 value_type = PickleValue
         
+        return value_type(value, ttl=ttl, metadata=metadata)
+    
+    def _process_key(self, key: Any) -> Key:
+        """
+        Process a key input into a Key object.
+        
+        Args:
+            key: Input key (can be Key object, string, or any hashable value)
+            
+        Returns:
+            Key object
+        """
+        if isinstance(key, Key):
+            return key
+        try:
+            return _make_key(key)
+        except TypeError:
+            # Unhashable inputs cannot be cached; Key raises a clearer error
+            return Key(key)
+    
+    def set(
+        self,
+        key: Any,
+        value: Any,
+        ttl: Optional[int] = None,
+        value_type: Optional[Type[Value]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Set a value for a key.
+        
+        Args:
+            key: The key (can be Key object, string, or any hashable value)
+            value: The value to store
+            ttl: Time-to-live in seconds (defaults to store default)
+            value_type: Value class to use (auto-detected if not specified)
+            metadata: Optional metadata to store with the value
+        """
+        self._maybe_purge_expired()
+        
+        # Process the key
+        key_obj = self._process_key(key)
+        
         # Create the value object
-        value_obj = value_type(value, ttl=ttl, metadata=metadata)
+        value_obj = self._make_value(value, ttl, value_type, metadata)
         
-        # Set in the backend
+        # Set in the backend; its on-set hook also updates the cache and
+        # records the expiry
         self._backend.set(key_obj, value_obj)
         
-        # Set in the cache
-        self._cache.set(key_obj, value_obj)
-        
         # Propagate to distributed nodes if enabled
         if self._distributed:
             self._distributed.propagate_set(key_obj, value_obj)
@@ -179,27 +388,19 @@ class KVStore:
         Returns:
             The value, or default if not found
         """
-        self._maybe_purge_expired()
+        now = self._maybe_purge_expired()
         
         # Process the key
         key_obj = self._process_key(key)
         
-        # Try to get from cache first
-        value = self._cache.get(key_obj)
-        cache_hit = value is not None
-        
-        # If not in cache, try to get from backend
-        if not cache_hit:
-            value = self._backend.get(key_obj)
-            if value:
-                # Update cache
-                self._cache.set(key_obj, value)
+        # Try the cache first, then the backend
+        value, cache_hit = self._lookup(key_obj, now)
         
         # Check if value exists and is not expired
         if value is None:
             return default
         
-        if not include_expired and value.is_expired():
+        if not include_expired and value.is_expired(now):
             # Value is expired, delete it and return default
             self.delete(key_obj)
             return default
@@ -230,30 +431,24 @@ class KVStore:
         Returns:
             Tuple of (value, metadata), or (default, {}) if not found
         """
-        self._maybe_purge_expired()
+        now = self._maybe_purge_expired()
         
         # Process the key
         key_obj = self._process_key(key)
         
-        # Try to get from cache first
-        value = self._cache.get(key_obj)
-        if value is None:
-            # If not in cache, try to get from backend
-            value = self._backend.get(key_obj)
-            if value:
-                # Update cache
-                self._cache.set(key_obj, value)
+        # Try the cache first, then the backend
+        value, _ = self._lookup(key_obj, now)
         
         # Check if value exists and is not expired
         if value is None:
             return (default, {})
         
-        if not include_expired and value.is_expired():
+        if not include_expired and value.is_expired(now):
             # Value is expired, delete it and return default
             self.delete(key_obj)
             return (default, {})
         
-        return (value.value, value.metadata)
+        return (value.value, dict(value.metadata))
     
     def delete(self, key: Any) -> bool:
         """
@@ -291,25 +486,19 @@ class KVStore:
         Returns:
             True if the key exists and is not expired, False otherwise
         """
-        self._maybe_purge_expired()
+        now = self._maybe_purge_expired()
         
         # Process the key
         key_obj = self._process_key(key)
         
-        # Try to get from cache first
-        value = self._cache.get(key_obj)
-        if value is None:
-            # If not in cache, try to get from backend
-            value = self._backend.get(key_obj)
-            if value:
-                # Update cache
-                self._cache.set(key_obj, value)
+        # Try the cache first, then the backend
+        value, _ = self._lookup(key_obj, now)
         
         # Check if value exists and is not expired
         if value is None:
             return False
         
-        if value.is_expired():
+        if value.is_expired(now):
             # Value is expired, delete it
             self.delete(key_obj)
             return False
@@ -327,19 +516,12 @@ class KVStore:
         Returns:
             List of keys
         """
-        self._maybe_purge_expired()
-        
-        # Get keys from backend
-        keys = self._backend.keys(pattern, namespace)
+        now = self._maybe_purge_expired()
+        if now is None:
+            now = time.time()
         
-        # Filter out expired keys
-        result = []
-        for key in keys:
-            value = self._backend.get(key)
-            if value and not value.is_expired():
-                result.append(key)
-        
-        return result
+        # Filter out expired keys against the same clock reading the purge used
+        return [key for key, value in self._items(pattern, namespace) if not value.is_expired(now)]
     
     def count(self, pattern: Optional[str] = None, namespace: Optional[str] = None) -> int:
         """
@@ -352,7 +534,12 @@ class KVStore:
         Returns:
             Number of keys
         """
-        return len(self.keys(pattern, namespace))
+        now = self._maybe_purge_expired()
+        if now is None:
+            now = time.time()
+        
+        # Count live entries without building a list of keys
+        return sum(1 for _, value in self._items(pattern, namespace) if not value.is_expired(now))
     
     def clear(self) -> None:
         """Clear all keys from the store."""
@@ -361,6 +548,14 @@ class KVStore:
         
         # Clear the cache
         self._cache.clear()
+        with self._negative_lock:
+            self._negative.clear()
+            self._negative_pending.clear()
+        
+        # Nothing is left to expire
+        with self._expiry_lock:
+            self._expiry_heap = []
+            self._expiry_seqs.clear()
         
         # Propagate to distributed nodes if enabled
         if self._distributed:
@@ -375,18 +570,43 @@ class KVStore:
         Returns:
             Number of keys purged
         """
-        # Get all keys from backend
-        keys = self._backend.keys()
+        # Pop every key whose recorded expiry has passed, skipping entries
+        # made stale by a later overwrite or delete
+        now = time.time()
+        due = []
+        with self._expiry_lock:
+            heap = self._expiry_heap
+            seqs = self._expiry_seqs
+            while heap and heap[0][0] <= now:
+                _, seq, key = heapq.heappop(heap)
+                if seqs.get(key) == seq:
+                    del seqs[key]
+                    due.append(key)
+        
+        # The key may have been deleted or overwritten since it was recorded,
+        # so check the current value before deleting
+        backend = self._backend
+        if hasattr(backend, 'batch_get'):
+            current = backend.batch_get(due)
+        else:
+            current = {key: backend.get(key) for key in due}
+        expired = [key for key, value in current.items() if value is not None and value.is_expired(now)]
         
-        # Check each key and delete if expired
-        purged_count = 0
-        for key in keys:
-            value = self._backend.get(key)
-            if value and value.is_expired():
-                self.delete(key)
-                purged_count += 1
+        # Delete everything that is due in one batch
+        if hasattr(backend, 'batch_delete'):
+            backend.batch_delete(expired)
+        else:
+            for key in expired:
+                backend.delete(key)
+        
+        for key in expired:
+            self._cache.delete(key)
+            if self._distributed:
+                self._distributed.propagate_delete(key)
+        purged_count = len(expired)
         
         self._last_purge = time.time()
+        self._next_purge = self._last_purge + self._purge_interval
         logger.debug(f"Purged {purged_count} expired keys")
         return purged_count
     
@@ -401,27 +621,26 @@ class KVStore:
         backend_stats = self._backend.stats() if hasattr(self._backend, 'stats') else {}
         cache_stats = self._cache.stats() if hasattr(self._cache, 'stats') else {}
         
-        # Count keys by type
-        keys = self._backend.keys()
+        # Count keys by type and namespace in one pass
+        items = self._items()
+        now = time.time()
         type_counts = {}
-        for key in keys:
-            value = self._backend.get(key)
-            if value:
-                value_type = type(value).__name__
-                type_counts[value_type] = type_counts.get(value_type, 0) + 1
-        
-        # Compute key namespace distribution
         namespace_counts = {}
-        for key in keys:
+        expired_count = 0
+        for key, value in items:
+            value_type = type(value).__name__
+            type_counts[value_type] = type_counts.get(value_type, 0) + 1
             namespace = key.namespace or "__default__"
             namespace_counts[namespace] = namespace_counts.get(namespace, 0) + 1
+            if value.is_expired(now):
+                expired_count += 1
         
         # Build stats dictionary
         stats = {
-            'total_keys': len(keys),
+            'total_keys': len(items),
             'key_types': type_counts,
             'namespaces': namespace_counts,
-            'expired_keys': sum(1 for key in keys if self._backend.get(key) and self._backend.get(key).is_expired()),
+            'expired_keys': expired_count,
             'backend': {
                 'type': type(self._backend).__name__,
                 **backend_stats
@@ -438,21 +657,31 @@ class KVStore:
         
         return stats
     
-    @contextmanager
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until queued distributed propagations have been sent.
+        
+        Args:
+            timeout: Timeout in seconds, or None to wait indefinitely
+            
+        Returns:
+            True if nothing is left queued, False if the timeout elapsed
+        """
+        if self._distributed and hasattr(self._distributed, 'wait_for_queue_empty'):
+            return self._distributed.wait_for_queue_empty(timeout)
+        return True
+    
     def transaction(self) -> 'KVTransaction':
         """
         Start a transaction for atomic operations.
         
+        The transaction is its own context manager, so no generator-based
+        wrapper is created for each ``with`` block.
+        
         Returns:
             Context manager for transaction
         """
-        transaction = KVTransaction(self)
-        try:
-            yield transaction
-            transaction.commit()
-        except Exception as e:
-            transaction.rollback()
-            raise e
+        return KVTransaction(self)
 
 
 class KVTransaction:
@@ -471,7 +700,12 @@ class KVTransaction:
             store: KVStore instance
         """
         self._store = store
-        self._operations = []
+        # Pending writes by key, kept apart so commit can hand each group to
+        # the backend as one batch; a later operation on a key replaces any
+        # earlier one, so a key is never in both
+        self._sets: Dict[Key, Tuple[Any, Optional[int], Optional[Type[Value]], Optional[Dict[str, Any]]]] = {}
+        self._deletes: Dict[Key, None] = {}
+        self._op_count = 0
         self._committed = False
         self._rolled_back = False
     
@@ -491,7 +725,10 @@ class KVTransaction:
         if self._committed or self._rolled_back:
             raise ValueError("Transaction already completed")
         
-        self._operations.append(('set', key, value, ttl, value_type, metadata))
+        key_obj = self._store._process_key(key)
+        self._deletes.pop(key_obj, None)
+        self._sets[key_obj] = (value, ttl, value_type, metadata)
+        self._op_count += 1
     
     def delete(self, key: Any) -> None:
         """
@@ -503,30 +740,79 @@ class KVTransaction:
         if self._committed or self._rolled_back:
             raise ValueError("Transaction already completed")
         
-        self._operations.append(('delete', key))
+        key_obj = self._store._process_key(key)
+        self._sets.pop(key_obj, None)
+        self._deletes[key_obj] = None
+        self._op_count += 1
     
     def commit(self) -> None:
         """Commit all operations in the transaction."""
         if self._committed or self._rolled_back:
             raise ValueError("Transaction already completed")
         
-        # Process each operation
-        for op in self._operations:
-            if op[0] == 'set':
-                _, key, value, ttl, value_type, metadata = op
-                self._store.set(key, value, ttl, value_type, metadata)
-            elif op[0] == 'delete':
-                _, key = op
-                self._store.delete(key)
+        store = self._store
+        sets = {key: store._make_value(*args) for key, args in self._sets.items()}
+        deletes = list(self._deletes)
+        backend = store._backend
+        
+        if deletes:
+            if hasattr(backend, 'batch_delete'):
+                backend.batch_delete(deletes)
+            else:
+                for key in deletes:
+                    backend.delete(key)
+        
+        if sets:
+            if hasattr(backend, 'batch_set'):
+                backend.batch_set(sets)
+            else:
+                for key, value in sets.items():
+                    backend.set(key, value)
+        
+        # Update the cache and distributed nodes per key (the backend's
+        # on-set hook has already cached the new values and their expiry)
+        for key in deletes:
+            store._cache.delete(key)
+            if store._distributed:
+                store._distributed.propagate_delete(key)
+        
+        if store._distributed:
+            for key, value in sets.items():
+                store._distributed.propagate_set(key, value)
         
         self._committed = True
-        logger.debug(f"Committed transaction with {len(self._operations)} operations")
+        logger.debug(f"Committed transaction with {self._op_count} operations")
     
     def rollback(self) -> None:
         """Roll back all operations in the transaction."""
         if self._committed or self._rolled_back:
             raise ValueError("Transaction already completed")
         
-        self._operations = []
+        self._sets.clear()
+        self._deletes.clear()
         self._rolled_back = True
-        logger.debug("Rolled back transaction") 
\ No newline at end of file
+        logger.debug("Rolled back transaction") 
+    
+    def __enter__(self) -> 'KVTransaction':
+        """
+        Enter the transaction context.
+        
+        Returns:
+            self
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        """
+        Exit the transaction context.
+        
+        Commits if the block completed normally, otherwise rolls back.
+        
+        Returns:
+            False, so exceptions are never suppressed
+        """
+        if exc_type is None:
+            self.commit()
+        elif not (self._committed or self._rolled_back):
+            self.rollback()
+        return False
\ No newline at end of file
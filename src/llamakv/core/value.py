@@ -5,17 +5,46 @@ This module provides classes for representing and manipulating
 values in the key-value store, with different serialization options.
 """
 
+import copy
 import json
 import pickle
+import sys
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional, TypeVar, Type, Generic, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, TypeVar, Type, Generic, Union
 
 
 T = TypeVar('T')
 
+# Expiry timestamp of values without a TTL
+_NEVER = float('inf')
+
+# Shared metadata of values without any; metadata dicts are never modified
+# in place and only leave a value as a read-only view or a copy, so one
+# empty dict can back every such value
+_NO_METADATA: Dict[str, Any] = {}
+
+
+def _shallow_size(obj: Any) -> int:
+    """
+    Estimate the size of an object and the items it directly contains.
+    
+    Args:
+        obj: The object to measure
+        
+    Returns:
+        Estimated size in bytes
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in obj)
+    return size
+
 
 class Value(ABC, Generic[T]):
     """
@@ -25,6 +54,9 @@ class Value(ABC, Generic[T]):
     the interface for serialization and deserialization.
     """
     
+    # Slots keep per-entry overhead down when a store holds many values
+    __slots__ = ("_value", "_created_at", "_ttl", "_expiry", "_metadata")
+    
     def __init__(self, value: T, ttl: Optional[int] = None, metadata: Optional[Dict[str, Any]] = None):
         """
         Initialize a value with optional TTL and metadata.
@@ -37,7 +69,8 @@ class Value(ABC, Generic[T]):
         self._value = value
         self._created_at = time.time()
         self._ttl = ttl
-        self._metadata = metadata or {}
+        self._expiry = self._created_at + ttl if ttl is not None else _NEVER
+        self._metadata = metadata or _NO_METADATA
     
     @property
     def value(self) -> T:
@@ -59,23 +92,31 @@ class Value(ABC, Generic[T]):
         """Get the expiry timestamp, if TTL is set."""
         if self._ttl is None:
             return None
-        return self._created_at + self._ttl
+        return self._expiry
     
     @property
-    def metadata(self) -> Dict[str, Any]:
-        """Get the metadata dictionary."""
-        return self._metadata
+    def metadata(self) -> Mapping[str, Any]:
+        """Get a read-only view of the metadata dictionary."""
+        return MappingProxyType(self._metadata)
     
-    def is_expired(self) -> bool:
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """
         Check if the value has expired.
         
+        Args:
+            now: Current time.time() timestamp; pass it when checking many
+                values so the clock is only read once
+        
         Returns:
             True if the value has expired, False otherwise
         """
-        if self._ttl is None:
-            return False
-        return time.time() > self._created_at + self._ttl
+        # The expiry is precomputed, so this is a single comparison when the
+        # caller supplies the time
+        if now is None:
+            if self._ttl is None:
+                return False
+            now = time.time()
+        return now > self._expiry
     
     def add_metadata(self, key: str, value: Any) -> None:
         """
@@ -85,23 +126,77 @@ class Value(ABC, Generic[T]):
             key: Metadata key
             value: Metadata value
         """
-        self._metadata[key] = value
+        # Copy on write: the dict may be shared with other values, such as
+        # copies made by with_ttl, or with a backend's stored representation
+        self._metadata = {**self._metadata, key: value}
+    
+    def with_ttl(self, ttl: Optional[int]) -> 'Value':
+        """
+        Get a copy of the value with a different time-to-live.
+        
+        The copy keeps the creation timestamp and shares the stored value
+        and metadata, so nothing is serialized.
+        
+        Args:
+            ttl: The new time-to-live in seconds
+            
+        Returns:
+            A new Value instance of the same type
+        """
+        clone = copy.copy(self)
+        clone._ttl = ttl
+        clone._expiry = clone._created_at + ttl if ttl is not None else _NEVER
+        return clone
     
-    def to_dict(self) -> Dict[str, Any]:
+    def with_value(self, value: T) -> 'Value':
+        """
+        Get a copy of the value holding different data.
+        
+        The copy keeps the creation timestamp, TTL and metadata.
+        
+        Args:
+            value: The new data
+            
+        Returns:
+            A new Value instance of the same type
+        """
+        clone = copy.copy(self)
+        clone._value = value
+        return clone
+    
+    def to_dict(self, binary: bool = False) -> Dict[str, Any]:
         """
         Convert the value to a dictionary for serialization.
         
+        Args:
+            binary: Whether binary payloads may be left as raw bytes, for
+                formats such as msgpack that can carry them without text encoding
+        
         Returns:
             Dictionary representation of the value
         """
         return {
-            'value': self._serialize_value(),
+            'value': self._serialize_binary() if binary else self._serialize_value(),
             'type': self.__class__.__name__,
             'created_at': self._created_at,
             'ttl': self._ttl,
-            'metadata': self._metadata
+            # A copy, so callers cannot mutate a dict other values share
+            'metadata': dict(self._metadata)
         }
     
+    def estimated_size(self) -> int:
+        """
+        Estimate the memory footprint of the value in bytes.
+        
+        Measures the stored object and the metadata with sys.getsizeof,
+        counting only the first level of containers, so nothing is
+        serialized and the cost does not grow with nesting depth.
+        
+        Returns:
+            Estimated size in bytes
+        """
+        return _shallow_size(self._value) + _shallow_size(self._metadata)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Value':
         """
@@ -123,7 +218,8 @@ class Value(ABC, Generic[T]):
         instance = cls(value)
         instance._created_at = data['created_at']
         instance._ttl = data.get('ttl')
-        instance._metadata = data.get('metadata', {})
+        instance._expiry = instance._created_at + instance._ttl if instance._ttl is not None else _NEVER
+        instance._metadata = data.get('metadata') or _NO_METADATA
         return instance
     
     @abstractmethod
@@ -131,6 +227,10 @@ class Value(ABC, Generic[T]):
         """Serialize the value for storage."""
         pass
     
+    def _serialize_binary(self) -> Any:
+        """Serialize the value for a binary-capable format."""
+        return self._serialize_value()
+    
     @classmethod
     @abstractmethod
     def _deserialize_value(cls, serialized: Any) -> T:
@@ -141,6 +241,8 @@ class Value(ABC, Generic[T]):
 class StringValue(Value[str]):
     """Value implementation for string data."""
     
+    __slots__ = ()
+    
     def _serialize_value(self) -> str:
         return self._value
     
@@ -152,6 +254,8 @@ class StringValue(Value[str]):
 class IntValue(Value[int]):
     """Value implementation for integer data."""
     
+    __slots__ = ()
+    
     def _serialize_value(self) -> int:
         return self._value
     
@@ -163,6 +267,8 @@ class IntValue(Value[int]):
 class FloatValue(Value[float]):
     """Value implementation for floating-point data."""
     
+    __slots__ = ()
+    
     def _serialize_value(self) -> float:
         return self._value
     
@@ -174,16 +280,32 @@ class FloatValue(Value[float]):
 class BytesValue(Value[bytes]):
     """Value implementation for binary data."""
     
+    __slots__ = ()
+    
     def _serialize_value(self) -> str:
         return self._value.hex()
     
+    def _serialize_binary(self) -> bytes:
+        return self._value
+    
     @classmethod
-    def _deserialize_value(cls, serialized: str) -> bytes:
+    def _deserialize_value(cls, serialized: Union[str, bytes]) -> bytes:
+        if isinstance(serialized, bytes):
+            return serialized
         return bytes.fromhex(serialized)
 
 
 class JsonValue(Value[Dict[str, Any]]):
-    """Value implementation for JSON data."""
+    """
+    Value implementation for JSON data.
+    
+    Always encoded with json rather than orjson: orjson accepts types json
+    rejects (datetimes, enums, UUIDs) and cannot round-trip NaN or integers
+    wider than 64 bits, so what a value reads back as would depend on which
+    packages are installed.
+    """
+    
+    __slots__ = ()
     
     def _serialize_value(self) -> str:
         return json.dumps(self._value)
@@ -196,9 +318,23 @@ class JsonValue(Value[Dict[str, Any]]):
 class PickleValue(Value[Any]):
     """Value implementation for pickled Python objects."""
     
+    __slots__ = ()
+    
     def _serialize_value(self) -> str:
-        return pickle.dumps(self._value).hex()
+        return self._serialize_binary().hex()
+    
+    def _serialize_binary(self) -> bytes:
+        return pickle.dumps(self._value, protocol=pickle.HIGHEST_PROTOCOL)
     
     @classmethod
-    def _deserialize_value(cls, serialized: str) -> Any:
-        return pickle.loads(bytes.fromhex(serialized)) 
\ No newline at end of file
+    def _deserialize_value(cls, serialized: Union[str, bytes]) -> Any:
+        if isinstance(serialized, bytes):
+            return pickle.loads(serialized)
+        return pickle.loads(bytes.fromhex(serialized)) 
+
+
+# Value classes by the type name that to_dict() records
+VALUE_CLASSES: Dict[str, Type[Value]] = {
+    cls.__name__: cls
+    for cls in (StringValue, IntValue, FloatValue, BytesValue, JsonValue, PickleValue)
+}
\ No newline at end of file
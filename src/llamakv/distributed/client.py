@@ -8,20 +8,117 @@ operations in the key-value store.
 import json
 import logging
 import queue
+import random
 import socket
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Set, Tuple, Callable
 
+import msgpack
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+from llamakv.cache import LRUCache
 from llamakv.core.key import Key
-from llamakv.core.value import Value
+from llamakv.core.value import Value, JsonValue
 
 
 logger = logging.getLogger(__name__)
 
+# Circuit breaker states
+_CLOSED = 'closed'
+_OPEN = 'open'
+_HALF_OPEN = 'half_open'
+
+# Headers for propagation requests, shared by every request
+_MSGPACK_HEADERS = {'Content-Type': 'application/x-msgpack'}
+
+# Headers for key reads, asking for msgpack but accepting JSON from older nodes
+_READ_HEADERS = {'Accept': 'application/x-msgpack, application/json;q=0.9'}
+
+# Queued by shutdown() to wake the update worker and make it exit
+_STOP = object()
+
+
+class _Breaker:
+    """
+    Circuit breaker guarding requests to one node.
+    
+    A closed breaker lets every request through. After ``threshold``
+    consecutive failed requests it opens, and requests to the node fail
+    fast until its open timeout has passed. It then goes half-open and lets
+    a single probe through: success closes it again, failure reopens it.
+    The open timeout starts at ``reset_timeout`` and doubles with each
+    consecutive trip, up to ``max_timeout``.
+    """
+    
+    def __init__(self, threshold: int, reset_timeout: float, max_timeout: float):
+        """
+        Initialize a closed breaker.
+        
+        Args:
+            threshold: Consecutive failures that open the breaker
+            reset_timeout: Time an open breaker first waits before probing (in seconds)
+            max_timeout: Longest time an open breaker waits before probing (in seconds)
+        """
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.max_timeout = max_timeout
+        self.state = _CLOSED
+        self.fail_count = 0
+        self.trips = 0
+        self.opened_at = 0.0
+        self.next_probe_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self, now: float) -> bool:
+        """
+        Check whether a request to the node may be sent.
+        
+        Args:
+            now: Current time.monotonic() timestamp
+            
+        Returns:
+            True if the request may be sent, False if it should fail fast
+        """
+        if self.state == _CLOSED:
+            return True
+        
+        with self._lock:
+            if self.state == _OPEN and now >= self.next_probe_at:
+                # Let exactly one probe through
+                self.state = _HALF_OPEN
+                return True
+            return self.state == _CLOSED
+    
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        if self.state == _CLOSED and self.fail_count == 0:
+            return
+        
+        with self._lock:
+            self.state = _CLOSED
+            self.fail_count = 0
+            self.trips = 0
+    
+    def record_failure(self, now: float) -> None:
+        """
+        Count a failed request, opening the breaker if needed.
+        
+        Args:
+            now: Current time.monotonic() timestamp
+        """
+        with self._lock:
+            self.fail_count += 1
+            if self.state == _HALF_OPEN or self.fail_count >= self.threshold:
+                timeout = min(self.max_timeout, self.reset_timeout * (2 ** self.trips))
+                self.state = _OPEN
+                self.trips += 1
+                self.opened_at = now
+                self.next_probe_at = now + timeout
+
 
 class DistributedClient:
     """
@@ -39,31 +136,115 @@ class DistributedClient:
         connect_timeout: int = 5,
         read_timeout: int = 10,
         async_updates: bool = True,
-        max_queue_size: int = 1000
+        max_queue_size: int = 1000,
+        max_batch_size: int = 100,
+        max_batch_delay_ms: int = 10,
+        l1_maxsize: int = 0,
+        l1_ttl_seconds: float = 1.0,
+        l1_cache_misses: bool = False,
+        breaker_threshold: int = 1,
+        breaker_reset_timeout: float = 30.0,
+        max_backoff: float = 60.0,
+        auth_token: Optional[str] = None,
+        node_id: Optional[str] = None,
+        propagation_source_header: str = "X-Propagation-Source"
     ):
         """
         Initialize a distributed client.
         
         Args:
             nodes: List of node URLs (e.g., ["http://node1:8080", "http://node2:8080"])
-            retry_interval: Interval between retry attempts (in seconds)
+            retry_interval: Base interval between retry attempts (in seconds); the
+                actual wait is randomized and grows exponentially with each attempt
             retry_attempts: Number of retry attempts for operations
             connect_timeout: Connection timeout (in seconds)
             read_timeout: Read timeout (in seconds)
             async_updates: Whether to send updates asynchronously
             max_queue_size: Maximum size of the async update queue
+            max_batch_size: Maximum number of queued updates sent in one request
+            max_batch_delay_ms: Maximum time to wait for a batch to fill (in milliseconds);
+                the actual wait scales with the queue backlog
+            l1_maxsize: Maximum number of remote reads cached locally (0, the default,
+                disables the cache); cached reads may be up to l1_ttl_seconds stale
+            l1_ttl_seconds: Time-to-live for locally cached remote reads (in seconds)
+            l1_cache_misses: Whether "not found" answers are cached as well
+            breaker_threshold: Consecutive failed requests (each after all retries)
+                before a node is skipped
+            breaker_reset_timeout: Time before a skipped node is first probed again (in seconds)
+            max_backoff: Longest wait between retries or node probes (in seconds)
+            auth_token: Optional bearer token sent with every request
+            node_id: Optional ID of the local node, sent so a node can skip its own updates
+            propagation_source_header: Header that carries node_id
         """
         self._nodes = nodes
         self._retry_interval = retry_interval
+        self._max_backoff = max_backoff
         self._retry_attempts = retry_attempts
         self._connect_timeout = connect_timeout
         self._read_timeout = read_timeout
         self._async_updates = async_updates
         self._max_queue_size = max_queue_size
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay_ms / 1000.0
+        
+        # One circuit breaker per node, so down nodes fail fast but are probed again
+        self._breakers = {node: _Breaker(breaker_threshold, breaker_reset_timeout, max_backoff) for node in nodes}
+        
+        # Local read-through cache for get_remote
+        self._l1 = LRUCache(capacity=l1_maxsize) if l1_maxsize > 0 else None
+        self._l1_ttl = l1_ttl_seconds
+        self._l1_cache_misses = l1_cache_misses
+        
+        # Bumped by every invalidation, so a read that was in flight during
+        # one does not write the old answer back into the cache
+        self._l1_generation = 0
+        self._l1_lock = threading.Lock()
+        
+        # Remote reads in progress, so concurrent reads of a key share one request
+        self._inflight: Dict[Key, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # One session for all requests so connections to each node are kept alive
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max(len(nodes), 1),
+            pool_maxsize=max(32, 4 * len(nodes)),
+            max_retries=0,
+        )
+        for node in nodes:
+            self._session.mount(node, adapter)
         
-        # Set up update queue for async operations
-        self._update_queue = queue.Queue(maxsize=max_queue_size)
-        self._running = True
+        # Headers every node expects are set once on the session
+        if auth_token is not None:
+            self._session.headers['Authorization'] = f"Bearer {auth_token}"
+        if node_id is not None:
+            self._session.headers[propagation_source_header] = node_id
+        
+        # Request URLs are built once per node and API path
+        self._urls = {
+            path: {node: f"{node}{path}" for node in nodes}
+            for path in ("/api/v1/propagate", "/api/v1/batch", "/api/v1/key/")
+        }
+        
+        # Requests to different nodes are independent, so they are sent in parallel
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(len(nodes), 1),
+            thread_name_prefix="llamakv-node",
+        )
+        
+        # msgpack Packers are reused, one per thread since they are not thread-safe
+        self._local = threading.local()
+        
+        # Set up update queue for async operations; the semaphore enforces
+        # max_queue_size, which SimpleQueue does not support
+        self._update_queue = queue.SimpleQueue()
+        self._queue_slots = threading.BoundedSemaphore(max_queue_size) if max_queue_size > 0 else None
+        
+        # Set whenever every queued update has been processed
+        self._idle = threading.Event()
+        self._idle.set()
+        self._idle_lock = threading.Lock()
+        self._unfinished = 0
         
         # Start update thread if async updates are enabled
         if async_updates:
@@ -76,36 +257,240 @@ class DistributedClient:
             'propagations_failed': 0,
             'reads_sent': 0,
             'reads_failed': 0,
-            'nodes_down': set(),
             'last_sync': time.time()
         }
+        self._stats_lock = threading.Lock()
         
         logger.info(f"Initialized distributed client with {len(nodes)} nodes")
     
     def _process_updates(self) -> None:
-        """Worker thread for processing asynchronous updates."""
-        while self._running:
+        """Worker thread for processing asynchronous updates in batches."""
+        stopping = False
+        while not stopping:
+            # Block until the first update, then collect more until the batch
+            # is full or the linger time has elapsed. The linger grows with
+            # the backlog (0.1 ms per queued update, up to the batch delay),
+            # so an idle client sends at once and a busy one fills batches
+            update = self._update_queue.get()
+            if update is _STOP:
+                break
+            
+            batch = [update]
+            linger = min(self._max_batch_delay, self._update_queue.qsize() * 0.0001)
+            deadline = time.monotonic() + linger
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        update = self._update_queue.get(timeout=remaining)
+                    else:
+                        # Still take whatever is already queued
+                        update = self._update_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if update is _STOP:
+                    stopping = True
+                    break
+                batch.append(update)
+            
             try:
-                # Get next update from queue
-                update = self._update_queue.get(timeout=1)
-                
-                # Process update
-                operation, key, value = update
+                self._propagate_batch_sync(batch)
+            except (TypeError, ValueError) as e:
+                # A queued value could not be encoded; drop the batch
+                logger.error(f"Error encoding update batch: {e}")
+            except Exception:
+                # Anything else is a bug; log it with its traceback but keep
+                # the worker alive so later updates are still sent
+                logger.exception("Unexpected error processing update batch")
+            finally:
+                # Mark tasks as done
+                if self._queue_slots is not None:
+                    for _ in batch:
+                        self._queue_slots.release()
+                with self._idle_lock:
+                    self._unfinished -= len(batch)
+                    if self._unfinished == 0:
+                        self._idle.set()
+    
+    def _enqueue(self, update: Tuple[str, Optional[Key], Optional[Value]]) -> None:
+        """
+        Add an update to the async queue.
+        
+        Args:
+            update: (operation, key, value) tuple
+            
+        Raises:
+            queue.Full: If the queue is full
+        """
+        if self._queue_slots is not None and not self._queue_slots.acquire(blocking=False):
+            raise queue.Full
+        
+        with self._idle_lock:
+            self._unfinished += 1
+            self._idle.clear()
+        self._update_queue.put(update)
+    
+    def _pack(self, payload: Any) -> bytes:
+        """
+        Encode a request payload as msgpack using this thread's Packer.
+        
+        Args:
+            payload: Payload to encode
+            
+        Returns:
+            Encoded payload
+        """
+        packer = getattr(self._local, 'packer', None)
+        if packer is None:
+            packer = self._local.packer = msgpack.Packer(use_bin_type=True)
+        return packer.pack(payload)
+    
+    def _backoff(self, attempt: int) -> float:
+        """
+        Get how long to wait before retrying, using exponential backoff with full jitter.
+        
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            
+        Returns:
+            Time to wait (in seconds)
+        """
+        return random.uniform(0, min(self._max_backoff, self._retry_interval * (2 ** attempt)))
+    
+    def _live_nodes(self) -> List[str]:
+        """Get the nodes whose circuit breakers let a request through."""
+        now = time.monotonic()
+        return [node for node in self._nodes if self._breakers[node].allow(now)]
+    
+    def _record_node_result(self, node: str, ok: bool, counter: Optional[str] = None) -> None:
+        """
+        Update node health and statistics after a request to a node.
+        
+        Args:
+            node: The node URL
+            ok: Whether the node answered
+            counter: Statistic to increment, if any
+        """
+        if ok:
+            self._breakers[node].record_success()
+        else:
+            self._breakers[node].record_failure(time.monotonic())
+        
+        if counter is not None:
+            self._count(counter)
+    
+    def _count(self, counter: str, amount: int = 1) -> None:
+        """
+        Increment a statistics counter.
+        
+        Args:
+            counter: Name of the counter
+            amount: Amount to add
+        """
+        with self._stats_lock:
+            self._stats[counter] += amount
+    
+    def _send_to_node(self, node: str, operation: str, body: bytes, path: str) -> bool:
+        """
+        POST an encoded propagation request to one node, retrying on failure.
+        
+        Args:
+            node: The node URL
+            operation: Operation name used in log messages
+            body: Encoded request payload
+            path: API path appended to the node URL
+            
+        Returns:
+            True if the node accepted the request, False otherwise
+        """
+        url = self._urls[path][node]
+        
+        # Try to send with retries
+        for attempt in range(self._retry_attempts):
+            try:
+                response = self._session.post(
+                    url,
+                    data=body,
+                    headers=_MSGPACK_HEADERS,
+                    timeout=(self._connect_timeout, self._read_timeout)
+                )
                 
-                if operation == 'set':
-                    self._propagate_set_sync(key, value)
-                elif operation == 'delete':
-                    self._propagate_delete_sync(key)
-                elif operation == 'clear':
-                    self._propagate_clear_sync()
+                if response.status_code == 200:
+                    # Success
+                    self._record_node_result(node, True)
+                    return True
                 
-                # Mark task as done
-                self._update_queue.task_done()
-            except queue.Empty:
-                # Queue is empty, wait for more updates
-                continue
-            except Exception as e:
-                logger.error(f"Error processing update: {e}")
+                # Error
+                logger.warning(f"Error propagating {operation} to {node}: {response.status_code}")
+            except RequestException as e:
+                # Connection error
+                logger.warning(f"Connection error propagating {operation} to {node}: {e}")
+            
+            # Wait before retry
+            if attempt < self._retry_attempts - 1:
+                time.sleep(self._backoff(attempt))
+        
+        self._record_node_result(node, False, 'propagations_failed')
+        return False
+    
+    def _post_to_nodes(self, operation: str, payload: Any, path: str = "/api/v1/propagate") -> bool:
+        """
+        POST a msgpack-encoded propagation request to all nodes in parallel.
+        
+        Args:
+            operation: Operation name used in log messages
+            payload: Request payload
+            path: API path appended to each node URL
+            
+        Returns:
+            True if successful on at least one node, False otherwise
+        """
+        body = self._pack(payload)
+        nodes = self._live_nodes()
+        
+        if len(nodes) == 1:
+            return self._send_to_node(nodes[0], operation, body, path)
+        
+        # Wait for every node, not just the first success
+        futures = [
+            self._pool.submit(self._send_to_node, node, operation, body, path)
+            for node in nodes
+        ]
+        return any([future.result() for future in futures])
+    
+    def _propagate_batch_sync(self, updates: List[Tuple[str, Optional[Key], Optional[Value]]]) -> bool:
+        """
+        Synchronously propagate a batch of queued updates to all nodes.
+        
+        Args:
+            updates: List of (operation, key, value) tuples, in queue order
+            
+        Returns:
+            True if successful on at least one node, False otherwise
+        """
+        # Only the last update to each key matters, and a clear supersedes
+        # everything queued before it; updates to different keys commute
+        cleared = False
+        latest: Dict[Key, Tuple[str, Optional[Value]]] = {}
+        for operation, key, value in updates:
+            if operation == 'clear':
+                cleared = True
+                latest.clear()
+            else:
+                latest[key] = (operation, value)
+        
+        operations = [{'operation': 'clear'}] if cleared else []
+        for key, (operation, value) in latest.items():
+            if operation == 'set':
+                operations.append({'operation': 'set', 'key': str(key), 'value': value.to_dict(binary=True)})
+            elif operation == 'delete':
+                operations.append({'operation': 'delete', 'key': str(key)})
+        
+        success = self._post_to_nodes('batch', operations, path='/api/v1/batch')
+        
+        if success:
+            self._count('propagations_sent', len(operations))
+        return success
     
     def _propagate_set_sync(self, key: Key, value: Value) -> bool:
         """
@@ -119,60 +504,19 @@ class DistributedClient:
             True if successful on at least one node, False otherwise
         """
         key_str = str(key)
-        value_dict = value.to_dict()
+        value_dict = value.to_dict(binary=True)
         
-        # Convert to JSON
+        # Build request payload
         data = {
             'key': key_str,
             'value': value_dict,
             'operation': 'set'
         }
         
-        # Success tracker
-        success = False
-        
-        # Send to all nodes
-        for node in self._nodes:
-            if node in self._stats['nodes_down']:
-                # Skip nodes that are known to be down
-                continue
-                
-            url = f"{node}/api/v1/propagate"
-            
-            # Try to send with retries
-            for attempt in range(self._retry_attempts):
-                try:
-                    response = requests.post(
-                        url,
-                        json=data,
-                        timeout=(self._connect_timeout, self._read_timeout)
-                    )
-                    
-                    if response.status_code == 200:
-                        # Success
-                        if node in self._stats['nodes_down']:
-                            self._stats['nodes_down'].remove(node)
-                        success = True
-                        break
-                    else:
-                        # Error
-                        logger.warning(f"Error propagating set to {node}: {response.status_code}")
-                        if attempt == self._retry_attempts - 1:
-                            self._stats['propagations_failed'] += 1
-                            self._stats['nodes_down'].add(node)
-                except RequestException as e:
-                    # Connection error
-                    logger.warning(f"Connection error propagating set to {node}: {e}")
-                    if attempt == self._retry_attempts - 1:
-                        self._stats['propagations_failed'] += 1
-                        self._stats['nodes_down'].add(node)
-                
-                # Wait before retry
-                if attempt < self._retry_attempts - 1:
-                    time.sleep(self._retry_interval)
+        success = self._post_to_nodes('set', data)
         
         if success:
-            self._stats['propagations_sent'] += 1
+            self._count('propagations_sent')
         return success
     
     def _propagate_delete_sync(self, key: Key) -> bool:
@@ -187,57 +531,16 @@ class DistributedClient:
         """
         key_str = str(key)
         
-        # Convert to JSON
+        # Build request payload
         data = {
             'key': key_str,
             'operation': 'delete'
         }
         
-        # Success tracker
-        success = False
-        
-        # Send to all nodes
-        for node in self._nodes:
-            if node in self._stats['nodes_down']:
-                # Skip nodes that are known to be down
-                continue
-                
-            url = f"{node}/api/v1/propagate"
-            
-            # Try to send with retries
-            for attempt in range(self._retry_attempts):
-                try:
-                    response = requests.post(
-                        url,
-                        json=data,
-                        timeout=(self._connect_timeout, self._read_timeout)
-                    )
-                    
-                    if response.status_code == 200:
-                        # Success
-                        if node in self._stats['nodes_down']:
-                            self._stats['nodes_down'].remove(node)
-                        success = True
-                        break
-                    else:
-                        # Error
-                        logger.warning(f"Error propagating delete to {node}: {response.status_code}")
-                        if attempt == self._retry_attempts - 1:
-                            self._stats['propagations_failed'] += 1
-                            self._stats['nodes_down'].add(node)
-                except RequestException as e:
-                    # Connection error
-                    logger.warning(f"Connection error propagating delete to {node}: {e}")
-                    if attempt == self._retry_attempts - 1:
-                        self._stats['propagations_failed'] += 1
-                        self._stats['nodes_down'].add(node)
-                
-                # Wait before retry
-                if attempt < self._retry_attempts - 1:
-                    time.sleep(self._retry_interval)
+        success = self._post_to_nodes('delete', data)
         
         if success:
-            self._stats['propagations_sent'] += 1
+            self._count('propagations_sent')
         return success
     
     def _propagate_clear_sync(self) -> bool:
@@ -247,56 +550,15 @@ class DistributedClient:
         Returns:
             True if successful on at least one node, False otherwise
         """
-        # Convert to JSON
+        # Build request payload
         data = {
             'operation': 'clear'
         }
         
-        # Success tracker
-        success = False
-        
-        # Send to all nodes
-        for node in self._nodes:
-            if node in self._stats['nodes_down']:
-                # Skip nodes that are known to be down
-                continue
-                
-            url = f"{node}/api/v1/propagate"
-            
-            # Try to send with retries
-            for attempt in range(self._retry_attempts):
-                try:
-                    response = requests.post(
-                        url,
-                        json=data,
-                        timeout=(self._connect_timeout, self._read_timeout)
-                    )
-                    
-                    if response.status_code == 200:
-                        # Success
-                        if node in self._stats['nodes_down']:
-                            self._stats['nodes_down'].remove(node)
-                        success = True
-                        break
-                    else:
-                        # Error
-                        logger.warning(f"Error propagating clear to {node}: {response.status_code}")
-                        if attempt == self._retry_attempts - 1:
-                            self._stats['propagations_failed'] += 1
-                            self._stats['nodes_down'].add(node)
-                except RequestException as e:
-                    # Connection error
-                    logger.warning(f"Connection error propagating clear to {node}: {e}")
-                    if attempt == self._retry_attempts - 1:
-                        self._stats['propagations_failed'] += 1
-                        self._stats['nodes_down'].add(node)
-                
-                # Wait before retry
-                if attempt < self._retry_attempts - 1:
-                    time.sleep(self._retry_interval)
+        success = self._post_to_nodes('clear', data)
         
         if success:
-            self._stats['propagations_sent'] += 1
+            self._count('propagations_sent')
         return success
     
     def propagate_set(self, key: Key, value: Value) -> bool:
@@ -310,10 +572,12 @@ class DistributedClient:
         Returns:
             True if successful (or queued), False otherwise
         """
+        self._invalidate_l1(key)
+        
         if self._async_updates:
             try:
                 # Add to queue for async processing
-                self._update_queue.put(('set', key, value), block=False)
+                self._enqueue(('set', key, value))
                 return True
             except queue.Full:
                 logger.error("Update queue is full, dropping set operation")
@@ -332,10 +596,12 @@ class DistributedClient:
         Returns:
             True if successful (or queued), False otherwise
         """
+        self._invalidate_l1(key)
+        
         if self._async_updates:
             try:
                 # Add to queue for async processing
-                self._update_queue.put(('delete', key, None), block=False)
+                self._enqueue(('delete', key, None))
                 return True
             except queue.Full:
                 logger.error("Update queue is full, dropping delete operation")
@@ -351,10 +617,12 @@ class DistributedClient:
         Returns:
             True if successful (or queued), False otherwise
         """
+        self._invalidate_l1()
+        
         if self._async_updates:
             try:
                 # Add to queue for async processing
-                self._update_queue.put(('clear', None, None), block=False)
+                self._enqueue(('clear', None, None))
                 return True
             except queue.Full:
                 logger.error("Update queue is full, dropping clear operation")
@@ -363,74 +631,168 @@ class DistributedClient:
             # Process synchronously
             return self._propagate_clear_sync()
     
+    def _invalidate_l1(self, key: Optional[Key] = None) -> None:
+        """
+        Drop a key, or every key, from the local read cache.
+        
+        Args:
+            key: The key, or None to clear the whole cache
+        """
+        if self._l1 is None:
+            return
+        
+        with self._l1_lock:
+            self._l1_generation += 1
+            if key is None:
+                self._l1.clear()
+            else:
+                self._l1.delete(key)
+    
     def get_remote(self, key: Key) -> Optional[Dict[str, Any]]:
         """
         Get a value from a remote node.
         
+        When the local read cache is enabled, answers (and, with
+        ``l1_cache_misses``, "not found") are cached for ``l1_ttl_seconds``;
+        the cache entry is invalidated when this client propagates a change
+        to the key.
+        Concurrent calls for the same key wait for a single remote read.
+        
         Args:
             key: The key
             
         Returns:
             Value dictionary, or None if not found
         """
+        if self._l1 is not None:
+            cached = self._l1.get(key)
+            if cached is not None:
+                value_dict = cached.value
+                return dict(value_dict) if value_dict is not None else None
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        
+        if not leader:
+            # Another caller is already reading this key; copy its result
+            value_dict = future.result()
+            return dict(value_dict) if value_dict is not None else None
+        
+        try:
+            generation = self._l1_generation
+            answered, value_dict = self._get_remote_uncached(key)
+            if answered and self._l1 is not None and (value_dict is not None or self._l1_cache_misses):
+                with self._l1_lock:
+                    # Skip answers that an invalidation has overtaken
+                    if self._l1_generation == generation:
+                        self._l1.set(key, JsonValue(value_dict, ttl=self._l1_ttl))
+            future.set_result(value_dict)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        
+        # value_dict is now shared with the L1 cache and any followers
+        return dict(value_dict) if value_dict is not None else None
+    
+    def _read_from_node(self, node: str, key_str: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        GET a key from one node, retrying on failure.
+        
+        Args:
+            node: The node URL
+            key_str: String form of the key
+            
+        Returns:
+            Tuple of (whether the node answered, value dictionary or None if not found)
+        """
+        url = self._urls["/api/v1/key/"][node] + key_str
+        
+        # Try to get with retries
+        for attempt in range(self._retry_attempts):
+            try:
+                response = self._session.get(
+                    url,
+                    headers=_READ_HEADERS,
+                    timeout=(self._connect_timeout, self._read_timeout)
+                )
+                
+                if response.status_code == 200:
+                    # Success, once the body decodes
+                    if response.headers.get('Content-Type', '').startswith('application/x-msgpack'):
+                        value_dict = msgpack.unpackb(response.content, raw=False)
+                    else:
+                        # json.loads detects the encoding of the raw bytes itself,
+                        # skipping requests' text decoding
+                        value_dict = json.loads(response.content)
+                    self._record_node_result(node, True, 'reads_sent')
+                    return True, value_dict
+                elif response.status_code == 404:
+                    # Not found
+                    self._record_node_result(node, True, 'reads_sent')
+                    return True, None
+                
+                # Error
+                logger.warning(f"Error getting key from {node}: {response.status_code}")
+            except RequestException as e:
+                # Connection error
+                logger.warning(f"Connection error getting key from {node}: {e}")
+            except (ValueError, msgpack.UnpackException) as e:
+                # A malformed body counts as a failure, so a half-open breaker reopens
+                logger.warning(f"Malformed response getting key from {node}: {e}")
+            
+            # Wait before retry
+            if attempt < self._retry_attempts - 1:
+                time.sleep(self._backoff(attempt))
+        
+        self._record_node_result(node, False, 'reads_failed')
+        return False, None
+    
+    def _get_remote_uncached(self, key: Key) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Get a value from the first remote node that responds.
+        
+        Nodes are tried one at a time, failing over to the next on error.
+        Each breaker is only consulted right before its node is asked, so a
+        half-open probe is never let through without being sent.
+        
+        Args:
+            key: The key
+            
+        Returns:
+            Tuple of (whether any node answered, value dictionary or None if not found)
+        """
         key_str = str(key)
         
-        # Try each node until success or all fail
         for node in self._nodes:
-            if node in self._stats['nodes_down']:
-                # Skip nodes that are known to be down
+            if not self._breakers[node].allow(time.monotonic()):
                 continue
-                
-            url = f"{node}/api/v1/key/{key_str}"
             
-            # Try to get with retries
-            for attempt in range(self._retry_attempts):
-                try:
-                    response = requests.get(
-                        url,
-                        timeout=(self._connect_timeout, self._read_timeout)
-                    )
-                    
-                    if response.status_code == 200:
-                        # Success
-                        if node in self._stats['nodes_down']:
-                            self._stats['nodes_down'].remove(node)
-                        self._stats['reads_sent'] += 1
-                        return response.json()
-                    elif response.status_code == 404:
-                        # Not found
-                        if node in self._stats['nodes_down']:
-                            self._stats['nodes_down'].remove(node)
-                        self._stats['reads_sent'] += 1
-                        return None
-                    else:
-                        # Error
-                        logger.warning(f"Error getting key from {node}: {response.status_code}")
-                        if attempt == self._retry_attempts - 1:
-                            self._stats['reads_failed'] += 1
-                            self._stats['nodes_down'].add(node)
-                except RequestException as e:
-                    # Connection error
-                    logger.warning(f"Connection error getting key from {node}: {e}")
-                    if attempt == self._retry_attempts - 1:
-                        self._stats['reads_failed'] += 1
-                        self._stats['nodes_down'].add(node)
-                
-                # Wait before retry
-                if attempt < self._retry_attempts - 1:
-                    time.sleep(self._retry_interval)
+            answered, value_dict = self._read_from_node(node, key_str)
+            if answered:
+                return True, value_dict
         
         # All nodes failed
         logger.warning(f"All nodes failed while getting key {key_str}")
-        return None
+        return False, None
     
     def shutdown(self) -> None:
-        """Shutdown the client and stop background threads."""
-        self._running = False
-        
+        """Shutdown the client and stop background threads, sending queued updates first."""
         if self._async_updates:
-            # Wait for update thread to finish
+            # Give the worker a chance to send what is already queued
+            self.wait_for_queue_empty(timeout=5)
+            
+            # Wake the update thread and wait for it to finish
+            self._update_queue.put(_STOP)
             self._update_thread.join(timeout=5)
+        
+        self._pool.shutdown(wait=True)
+        self._session.close()
     
     def wait_for_queue_empty(self, timeout: Optional[float] = None) -> bool:
         """
@@ -444,12 +806,8 @@ class DistributedClient:
         """
         if not self._async_updates:
             return True
-            
-        try:
-            self._update_queue.join(timeout=timeout)
-            return True
-        except:
-            return False
+        
+        return self._idle.wait(timeout)
     
     def stats(self) -> Dict[str, Any]:
         """
@@ -461,19 +819,26 @@ class DistributedClient:
         queue_size = 0
         if self._async_updates:
             queue_size = self._update_queue.qsize()
+        
+        with self._stats_lock:
+            counters = dict(self._stats)
+        
+        # Breakers are created once, so the dict never changes size while iterated
+        nodes_down = sum(1 for breaker in self._breakers.values() if breaker.state != _CLOSED)
             
         return {
             'nodes': len(self._nodes),
-            'nodes_down': len(self._stats['nodes_down']),
-            'propagations_sent': self._stats['propagations_sent'],
-            'propagations_failed': self._stats['propagations_failed'],
-            'reads_sent': self._stats['reads_sent'],
-            'reads_failed': self._stats['reads_failed'],
+            'nodes_down': nodes_down,
+            'propagations_sent': counters['propagations_sent'],
+            'propagations_failed': counters['propagations_failed'],
+            'reads_sent': counters['reads_sent'],
+            'reads_failed': counters['reads_failed'],
             'async_updates': self._async_updates,
             'queue_size': queue_size,
             'max_queue_size': self._max_queue_size,
             'queue_utilization': (queue_size / self._max_queue_size) * 100 if self._max_queue_size > 0 else 0,
             'retry_attempts': self._retry_attempts,
             'retry_interval': self._retry_interval,
-            'last_sync': self._stats['last_sync']
+            'last_sync': counters['last_sync'],
+            'l1_cache': self._l1.stats() if self._l1 is not None else None
         } 
\ No newline at end of file
@@ -5,22 +5,79 @@ This module provides the server-side functionality for distributed
 operations in the key-value store.
 """
 
+import hmac
 import json
 import logging
+import re
 import threading
 import time
 from typing import Any, Dict, List, Optional, Set, Tuple, Callable, Union
 
-from flask import Flask, request, jsonify
+import msgpack
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.serving import make_server
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
 
 from llamakv.core.key import Key
-from llamakv.core.value import (
-    Value, StringValue, IntValue, FloatValue, BytesValue, JsonValue, PickleValue
-)
+from llamakv.core.value import Value, VALUE_CLASSES
 
 
 logger = logging.getLogger(__name__)
 
+# Response formats for key reads; JSON comes first so it wins for clients
+# that accept anything
+_RESPONSE_MIMETYPES = ['application/json', 'application/x-msgpack']
+
+# Pre-encoded body of the constant success response
+_SUCCESS_BODY = b'{"success":true}'
+
+# Any integer outside the 64-bit range has at least this many digits in a row
+_LONG_DIGIT_RUN = re.compile(r'\d{19}')
+_LONG_DIGIT_RUN_BYTES = re.compile(rb'\d{19}')
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes and decodes with orjson.
+    
+    Objects orjson rejects, such as Decimals or integers wider than 64 bits,
+    are handed to the default provider. So are documents orjson cannot read
+    exactly: NaN or Infinity literals, and long runs of digits, which orjson
+    would read back as floats if they are integers wider than 64 bits.
+    """
+    
+    def _dumps_bytes(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return super().dumps(obj).encode('utf-8')
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._dumps_bytes(obj).decode('utf-8')
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        long_digit_run = _LONG_DIGIT_RUN if isinstance(s, str) else _LONG_DIGIT_RUN_BYTES
+        if long_digit_run.search(s):
+            return super().loads(s)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dumps_bytes(obj), mimetype=self.mimetype)
+
 
 class DistributedServer:
     """
@@ -62,17 +119,25 @@ class DistributedServer:
         self._api_prefix = api_prefix.rstrip('/')
         self._node_id = node_id or f"node-{id(self)}"
         self._auth_token = auth_token
+        self._auth_token_bytes = auth_token.encode('utf-8') if auth_token is not None else None
         self._allow_propagation = allow_propagation
         self._propagation_source_header = propagation_source_header
         self._log_requests = log_requests
         
+        # /health only varies in its uptime, so the rest of the body is encoded once
+        self._health_prefix = f'{{"status":"ok","node_id":{json.dumps(self._node_id)},"uptime":'.encode('utf-8')
+        
         # Flask app
         self._app = Flask(f"LlamaKV-{self._node_id}")
+        if orjson is not None:
+            # jsonify() and request.json then go through orjson
+            self._app.json = _OrjsonProvider(self._app)
         
         # Set up routes
         self._setup_routes()
         
         # Server thread
+        self._http_server = None
         self._server_thread = None
         self._running = False
         
@@ -120,6 +185,9 @@ class DistributedServer:
                 # Convert value to dictionary
                 value_dict = value.to_dict()
                 
+                # Answer in msgpack when the client prefers it
+                if request.accept_mimetypes.best_match(_RESPONSE_MIMETYPES) == 'application/x-msgpack':
+                    return Response(msgpack.packb(value_dict, use_bin_type=True), mimetype='application/x-msgpack'), 200
                 return jsonify(value_dict), 200
             except Exception as e:
                 logger.error(f"Error getting key {key}: {e}")
@@ -158,19 +226,8 @@ class DistributedServer:
                 
                 # Determine value type
                 value_type = data.get('type', 'StringValue')
-                if value_type == 'StringValue':
-                    value_class = StringValue
-                elif value_type == 'IntValue':
-                    value_class = IntValue
-                elif value_type == 'FloatValue':
-                    value_class = FloatValue
-                elif value_type == 'BytesValue':
-                    value_class = BytesValue
-                elif value_type == 'JsonValue':
-                    value_class = JsonValue
-                elif value_type == 'PickleValue':
-                    value_class = PickleValue
-                else:
+                value_class = VALUE_CLASSES.get(value_type)
+                if value_class is None:
                     return jsonify({"error": f"Invalid value type: {value_type}"}), 400
                 
                 # Create value object
@@ -179,7 +236,7 @@ class DistributedServer:
                 # Set in store
                 self._store.set(key_obj, value_obj)
                 
-                return jsonify({"success": True}), 200
+                return self._success()
             except Exception as e:
                 logger.error(f"Error setting key: {e}")
                 self._stats['errors'] += 1
@@ -209,7 +266,7 @@ class DistributedServer:
                 if not deleted:
                     return jsonify({"error": "Key not found"}), 404
                 
-                return jsonify({"success": True}), 200
+                return self._success()
             except Exception as e:
                 logger.error(f"Error deleting key {key}: {e}")
                 self._stats['errors'] += 1
@@ -219,7 +276,6 @@ class DistributedServer:
         @self._app.route(f"{self._api_prefix}/propagate", methods=["POST"])
         def propagate():
             self._stats['requests'] += 1
-            self._stats['propagations_received'] += 1
             
             if self._log_requests:
                 logger.debug(f"POST {self._api_prefix}/propagate")
@@ -240,75 +296,74 @@ class DistributedServer:
             
             # Process request
             try:
-                data = request.json
+                data = self._request_body(request)
                 
+                # Several operations may be sent at once as {"operations": [...]}
+                if isinstance(data, dict) and isinstance(data.get('operations'), list):
+                    applied, error = self._apply_operations(data['operations'])
+                    if error:
+                        return jsonify({"error": error, "applied": applied}), 400
+                    return jsonify({"success": True, "applied": applied}), 200
+                
+                self._stats['propagations_received'] += 1
                 if not data or 'operation' not in data:
                     return jsonify({"error": "Invalid request"}), 400
                 
-                operation = data['operation']
-                
-                if operation == 'set':
-                    # Extract key and value
-                    key_str = data['key']
-                    value_dict = data['value']
-                    
-                    # Create key object
-                    key_obj = Key.from_string(key_str)
-                    
-                    # Determine value type
-                    value_type = value_dict['type']
-                    if value_type == 'StringValue':
-                        value_obj = StringValue.from_dict(value_dict)
-                    elif value_type == 'IntValue':
-                        value_obj = IntValue.from_dict(value_dict)
-                    elif value_type == 'FloatValue':
-                        value_obj = FloatValue.from_dict(value_dict)
-                    elif value_type == 'BytesValue':
-                        value_obj = BytesValue.from_dict(value_dict)
-                    elif value_type == 'JsonValue':
-                        value_obj = JsonValue.from_dict(value_dict)
-                    elif value_type == 'PickleValue':
-                        value_obj = PickleValue.from_dict(value_dict)
-                    else:
-                        return jsonify({"error": f"Invalid value type: {value_type}"}), 400
-                    
-                    # Set in store
-                    self._store.set(key_obj, value_obj)
-                    self._stats['sets'] += 1
-                    
-                elif operation == 'delete':
-                    # Extract key
-                    key_str = data['key']
-                    
-                    # Create key object
-                    key_obj = Key.from_string(key_str)
-                    
-                    # Delete key
-                    self._store.delete(key_obj)
-                    self._stats['deletes'] += 1
-                    
-                elif operation == 'clear':
-                    # Clear store
-                    self._store.clear()
-                    self._stats['clears'] += 1
-                    
-                else:
-                    return jsonify({"error": f"Invalid operation: {operation}"}), 400
+                error = self._apply_operation(data)
+                if error:
+                    return jsonify({"error": error}), 400
                 
-                return jsonify({"success": True}), 200
+                return self._success()
             except Exception as e:
                 logger.error(f"Error processing propagation: {e}")
                 self._stats['errors'] += 1
                 return jsonify({"error": str(e)}), 500
         
+        # Batch propagation endpoint
+        @self._app.route(f"{self._api_prefix}/batch", methods=["POST"])
+        def batch():
+            self._stats['requests'] += 1
+            
+            if self._log_requests:
+                logger.debug(f"POST {self._api_prefix}/batch")
+            
+            # Authenticate
+            if not self._authenticate(request):
+                self._stats['unauthorized'] += 1
+                return jsonify({"error": "Unauthorized"}), 401
+            
+            # Check if propagation is allowed
+            if not self._allow_propagation:
+                return jsonify({"error": "Propagation not allowed"}), 403
+            
+            # Check for propagation loop
+            source = request.headers.get(self._propagation_source_header)
+            if source and source == self._node_id:
+                return jsonify({"success": True, "skipped": True}), 200
+            
+            # Process request
+            try:
+                operations = self._request_body(request)
+                
+                if not isinstance(operations, list):
+                    return jsonify({"error": "Invalid request"}), 400
+                
+                applied, error = self._apply_operations(operations)
+                if error:
+                    return jsonify({"error": error, "applied": applied}), 400
+                
+                return jsonify({"success": True, "applied": applied}), 200
+            except Exception as e:
+                logger.error(f"Error processing batch propagation: {e}")
+                self._stats['errors'] += 1
+                return jsonify({"error": str(e)}), 500
+        
         # Health check
         @self._app.route(f"{self._api_prefix}/health", methods=["GET"])
         def health():
-            return jsonify({
-                "status": "ok",
-                "node_id": self._node_id,
-                "uptime": time.time() - self._stats['start_time']
-            }), 200
+            uptime = time.time() - self._stats['start_time']
+            body = self._health_prefix + repr(uptime).encode('ascii') + b'}'
+            return Response(body, mimetype='application/json'), 200
         
         # Stats
         @self._app.route(f"{self._api_prefix}/stats", methods=["GET"])
@@ -334,6 +389,153 @@ class DistributedServer:
                 "store": store_stats
             }), 200
     
+    def _request_body(self, req) -> Any:
+        """
+        Decode a request body sent as msgpack or JSON.
+        
+        Args:
+            req: Flask request object
+            
+        Returns:
+            Decoded body
+        """
+        if req.mimetype == 'application/x-msgpack':
+            return msgpack.unpackb(req.get_data(), raw=False)
+        return req.json
+    
+    def _apply_operations(self, operations: List[Any]) -> Tuple[int, Optional[str]]:
+        """
+        Apply propagated operations in order, stopping at the first invalid one.
+        
+        Sets and deletes are gathered in a store transaction, so each run of
+        them reaches the backend as one batch; a clear commits the run before it.
+        
+        Args:
+            operations: List of operation dictionaries
+            
+        Returns:
+            Tuple of (number of operations applied, error message or None)
+        """
+        transaction = self._store.transaction() if hasattr(self._store, 'transaction') else None
+        applied = 0
+        error = None
+        
+        try:
+            for data in operations:
+                self._stats['propagations_received'] += 1
+                
+                # Validate before applying, so a malformed entry is reported
+                # as invalid rather than failing part way through
+                try:
+                    operation, key_obj, value_obj = self._parse_operation(data)
+                except ValueError as e:
+                    error = str(e)
+                    break
+                
+                if operation == 'clear' and transaction is not None:
+                    # Earlier operations must land before the clear
+                    transaction.commit()
+                    transaction = self._store.transaction()
+                
+                self._execute_operation(operation, key_obj, value_obj, transaction)
+                applied += 1
+        finally:
+            # Operations before an invalid one still take effect
+            if transaction is not None:
+                transaction.commit()
+        
+        return applied, error
+    
+    def _apply_operation(self, data: Any) -> Optional[str]:
+        """
+        Apply a single propagated operation to the local store.
+        
+        Args:
+            data: Operation dictionary with an 'operation' field
+            
+        Returns:
+            Error message if the operation is invalid, None on success
+        """
+        try:
+            operation, key_obj, value_obj = self._parse_operation(data)
+        except ValueError as e:
+            return str(e)
+        
+        self._execute_operation(operation, key_obj, value_obj)
+        return None
+    
+    def _parse_operation(self, data: Any) -> Tuple[str, Optional[Key], Optional[Value]]:
+        """
+        Validate a propagated operation and build its key and value.
+        
+        Args:
+            data: Operation dictionary with an 'operation' field
+            
+        Returns:
+            Tuple of (operation, key or None, value or None)
+            
+        Raises:
+            ValueError: If the operation is malformed
+        """
+        if not isinstance(data, dict) or 'operation' not in data:
+            raise ValueError("Invalid request")
+        
+        operation = data['operation']
+        if operation == 'clear':
+            return operation, None, None
+        if operation not in ('set', 'delete'):
+            raise ValueError(f"Invalid operation: {operation}")
+        
+        # Create key object
+        key_str = data.get('key')
+        if not isinstance(key_str, str):
+            raise ValueError(f"Invalid key for {operation}: {key_str!r}")
+        key_obj = Key.from_string(key_str)
+        
+        if operation == 'delete':
+            return operation, key_obj, None
+        
+        # Determine value type
+        value_dict = data.get('value')
+        value_type = value_dict.get('type') if isinstance(value_dict, dict) else None
+        value_class = VALUE_CLASSES.get(value_type)
+        if value_class is None:
+            raise ValueError(f"Invalid value type: {value_type}")
+        
+        try:
+            value_obj = value_class.from_dict(value_dict)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid value for {key_str}: {e}")
+        
+        return operation, key_obj, value_obj
+    
+    def _execute_operation(self, operation: str, key_obj: Optional[Key], value_obj: Optional[Value],
+                           transaction: Any = None) -> None:
+        """
+        Apply a validated operation to the local store.
+        
+        Args:
+            operation: Operation name
+            key_obj: Key of a set or delete
+            value_obj: Value of a set
+            transaction: Store transaction to queue sets and deletes in, if any
+        """
+        target = transaction if transaction is not None else self._store
+        
+        if operation == 'set':
+            target.set(key_obj, value_obj)
+            self._stats['sets'] += 1
+        elif operation == 'delete':
+            target.delete(key_obj)
+            self._stats['deletes'] += 1
+        else:
+            self._store.clear()
+            self._stats['clears'] += 1
+    
+    def _success(self) -> Tuple[Response, int]:
+        """Build the constant success response from its pre-encoded body."""
+        return Response(_SUCCESS_BODY, mimetype='application/json'), 200
+    
     def _authenticate(self, req) -> bool:
         """
         Authenticate a request.
@@ -344,13 +546,13 @@ class DistributedServer:
         Returns:
             True if authenticated, False otherwise
         """
-        if self._auth_token is None:
+        if self._auth_token_bytes is None:
             return True
             
         auth_header = req.headers.get('Authorization')
         if auth_header and auth_header.startswith('Bearer '):
-            token = auth_header.split(' ')[1]
-            return token == self._auth_token
+            # Compare in constant time so response timing does not leak the token
+            return hmac.compare_digest(auth_header[7:].encode('utf-8'), self._auth_token_bytes)
             
         return False
     
@@ -361,14 +563,12 @@ class DistributedServer:
             return
             
         self._running = True
+        
+        # A thread per request, so a slow store call does not block other
+        # requests; keeping the server object allows a clean shutdown
+        self._http_server = make_server(self._host, self._port, self._app, threaded=True)
         self._server_thread = threading.Thread(
-            target=self._app.run,
-            kwargs={
-                'host': self._host,
-                'port': self._port,
-                'debug': False,
-                'use_reloader': False
-            },
+            target=self._http_server.serve_forever,
             daemon=True
         )
         self._server_thread.start()
@@ -377,12 +577,16 @@ class DistributedServer:
     
     def shutdown(self) -> None:
         """Shutdown the server."""
+        if not self._running:
+            return
         self._running = False
         
-        # Flask doesn't have a clean shutdown mechanism when running in a thread
-        # So we'll just let the daemon thread terminate when the process exits
+        # Stop accepting requests and wait for the serving thread to exit
+        self._http_server.shutdown()
+        self._http_server.server_close()
+        self._server_thread.join(timeout=5)
         
-        logger.info("Server shutdown initiated")
+        logger.info("Server shut down")
     
     def get_url(self) -> str:
         """
@@ -2,33 +2,68 @@
 File backend implementation for LlamaKV.
 
 This module provides a file-based storage backend for the key-value store,
-which persists data to disk in a JSON file.
+which persists data to disk as an append-only log of msgpack records.
 """
 
 import json
+import logging
+import mmap
 import os
-import re
 import threading
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-from llamakv.core.key import Key
-from llamakv.core.value import Value, StringValue, IntValue, FloatValue, BytesValue, JsonValue, PickleValue
+import msgpack
+from filelock import FileLock
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
+
+from llamakv.core.key import Key, compile_pattern
+from llamakv.core.value import Value, VALUE_CLASSES
+
+logger = logging.getLogger(__name__)
+
+# Log record opcodes
+_OP_SET = "S"
+_OP_DELETE = "D"
+
+# Logs smaller than this are never compacted
+_MIN_COMPACT_BYTES = 64 * 1024
+
+
+def _namespace_of(key_str: str) -> Optional[str]:
+    """Get the namespace Key.from_string would give a key string, without building the key."""
+    namespace, sep, _ = key_str.partition(':')
+    return namespace if sep else None
+
+
+def _to_dict(entry: Union[Value, Dict[str, Any]]) -> Dict[str, Any]:
+    """Get the log form of a stored entry, which may already be a dictionary."""
+    if isinstance(entry, Value):
+        # msgpack carries bytes natively, so binary payloads skip hex encoding
+        return entry.to_dict(binary=True)
+    return entry
 
 
 class FileBackend:
     """
     File-based storage backend for the key-value store.
     
-    Stores data in a JSON file on disk, which provides persistence
-    across process restarts.
+    Every mutation is appended to a log file as a msgpack record, and an
+    in-memory index holds the live values. When the log grows larger than
+    ``compact_ratio`` times the size of the live data, it is rewritten as a
+    fresh snapshot. This provides persistence across process restarts.
     """
     
-    def __init__(self, 
-                 file_path: str, 
+    def __init__(self,
+                 file_path: str,
                  auto_sync: bool = True,
-                 sync_interval: int = 5):
+                 sync_interval: int = 5,
+                 compact_ratio: float = 2.0):
         """
         Initialize a file backend.
         
@@ -36,12 +71,21 @@ class FileBackend:
             file_path: Path to the storage file
             auto_sync: Whether to automatically sync to disk
             sync_interval: Interval for auto-syncing (in seconds)
+            compact_ratio: Compact the log once it exceeds this multiple of the live data size
         """
         self._file_path = file_path
         self._auto_sync = auto_sync
         self._sync_interval = sync_interval
-        self._store: Dict[str, Dict[str, Any]] = {}
+        self._compact_ratio = compact_ratio
+        # Live entries by key string. Values loaded from disk stay in their
+        # dictionary form until first read, when they are replaced by the
+        # built Value so later reads skip from_dict
+        self._store: Dict[str, Union[Value, Dict[str, Any]]] = {}
+        self._record_sizes: Dict[str, int] = {}
+        self._live_bytes = 0
         self._lock = threading.RLock()
+        self._packer = msgpack.Packer(use_bin_type=True)
+        self._file_lock = FileLock(f"{file_path}.lock")
         self._on_set_callbacks: List[Callable[[Key, Value], None]] = []
         self._on_delete_callbacks: List[Callable[[Key], None]] = []
         self._last_sync = time.time()
@@ -52,9 +96,14 @@ class FileBackend:
         self._writes = 0
         self._deletes = 0
         self._syncs = 0
+        self._compactions = 0
         
-        # Load data from file if it exists
+        # Ensure directory exists
+        os.makedirs(os.path.dirname(os.path.abspath(self._file_path)), exist_ok=True)
+        
+        # Load data from file if it exists, then open the log for appending
         self._load()
+        self._fp = open(self._file_path, 'ab')
         
         # Start auto-sync thread if enabled
         if auto_sync:
@@ -73,61 +122,173 @@ class FileBackend:
                     pass
     
     def _load(self) -> None:
-        """Load data from file."""
+        """Rebuild the in-memory index by replaying the log file."""
         with self._lock:
-            if not os.path.exists(self._file_path):
+            if not os.path.exists(self._file_path) or os.path.getsize(self._file_path) == 0:
                 return
             
-            try:
-                with open(self._file_path, 'r') as f:
-                    data = json.load(f)
-                
-                for key_str, value_data in data.items():
-                    # Create Key object
-                    key = Key.from_string(key_str)
-                    
-                    # Determine value type and create Value object
-                    value_type = value_data.get('type')
-                    if value_type == 'StringValue':
-                        value = StringValue.from_dict(value_data)
-                    elif value_type == 'IntValue':
-                        value = IntValue.from_dict(value_data)
-                    elif value_type == 'FloatValue':
-                        value = FloatValue.from_dict(value_data)
-                    elif value_type == 'BytesValue':
-                        value = BytesValue.from_dict(value_data)
-                    elif value_type == 'JsonValue':
-                        value = JsonValue.from_dict(value_data)
-                    elif value_type == 'PickleValue':
-                        value = PickleValue.from_dict(value_data)
+            file_size = os.path.getsize(self._file_path)
+            log_end = file_size
+            with open(self._file_path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    if mm[:1] == b'{':
+                        # Legacy JSON snapshot; it is rewritten as a log below
+                        try:
+                            self._store = self._loads_snapshot(mm[:])
+                        except Exception as e:
+                            logger.error(f"Discarding unreadable snapshot {self._file_path}: {e}")
+                            self._store = {}
+                        
+                        for key_str, value_dict in self._store.items():
+                            self._record_sizes[key_str] = len(self._pack(_OP_SET, key_str, value_dict))
+                        self._live_bytes = sum(self._record_sizes.values())
+                        self._write_snapshot()
                     else:
-                        # Skip unknown value types
-                        continue
-                    
-                    # Store in memory
-                    self._store[key_str] = value_data
-            except Exception as e:
-                # If loading fails, start with empty store
-                self._store = {}
+                        log_end = self._replay(mm)
+                finally:
+                    mm.close()
+            
+            if log_end < file_size:
+                # Cut off the torn tail so new records are appended after the
+                # last complete one instead of behind bytes replay cannot read
+                logger.warning(f"Truncating {file_size - log_end} bytes of torn records from {self._file_path}")
+                os.truncate(self._file_path, log_end)
     
-    def sync(self) -> None:
-        """Sync data to disk."""
-        with self._lock:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(os.path.abspath(self._file_path)), exist_ok=True)
+    def _loads_snapshot(self, data: bytes) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse a legacy JSON snapshot.
+        
+        Uses orjson when it is installed, falling back to json for
+        snapshots orjson rejects, such as ones containing NaN.
+        
+        Args:
+            data: Contents of the snapshot file
+            
+        Returns:
+            Stored value dictionaries by key string
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except ValueError:
+                pass
+        return json.loads(data)
+    
+    def _replay(self, mm: mmap.mmap) -> int:
+        """
+        Replay a msgpack log straight out of a memory map.
+        
+        The first pass only decodes opcodes and keys, remembering where the
+        latest value of each key lives; values that are later overwritten or
+        deleted are skipped without being decoded. The second pass decodes
+        just the surviving values.
+        
+        Args:
+            mm: Read-only memory map of the log file
             
+        Returns:
+            Offset just past the last complete record, where the log is
+            truncated before new records are appended
+        """
+        unpacker = msgpack.Unpacker(mm, raw=False)
+        spans: Dict[str, Tuple[int, int, int]] = {}
+        log_end = 0
+        
+        try:
+            while True:
+                record_start = unpacker.tell()
+                length = unpacker.read_array_header()
+                op = unpacker.unpack()
+                key_str = unpacker.unpack()
+                if op == _OP_SET and length == 3:
+                    value_start = unpacker.tell()
+                    unpacker.skip()
+                    spans[key_str] = (record_start, value_start, unpacker.tell())
+                elif op == _OP_DELETE:
+                    spans.pop(key_str, None)
+                log_end = unpacker.tell()
+        except msgpack.OutOfData:
+            # End of the log, possibly inside a torn record
+            pass
+        except Exception as e:
+            # Keep everything replayed before a corrupt record
+            logger.error(f"Corrupt record at offset {log_end} in {self._file_path}: {e}")
+        
+        for key_str, (record_start, value_start, value_end) in spans.items():
+            try:
+                self._store[key_str] = msgpack.unpackb(mm[value_start:value_end], raw=False)
+            except Exception as e:
+                logger.error(f"Dropping undecodable value for {key_str} in {self._file_path}: {e}")
+                continue
+            self._record_sizes[key_str] = value_end - record_start
+            self._live_bytes += value_end - record_start
+        
+        return log_end
+    
+    def _pack(self, op: str, key_str: str, value_dict: Optional[Dict[str, Any]] = None) -> bytes:
+        """Encode a log record (caller must hold the lock, the packer is shared)."""
+        if op == _OP_SET:
+            return self._packer.pack((op, key_str, value_dict))
+        return self._packer.pack((op, key_str))
+    
+    def _append(self, record: bytes) -> None:
+        """Append a record to the log (caller must hold the lock)."""
+        self._fp.write(record)
+        self._fp.flush()
+        self._dirty = True
+        self._maybe_compact()
+    
+    def _maybe_compact(self) -> None:
+        """Compact the log if it has grown too large relative to the live data."""
+        log_bytes = self._fp.tell()
+        if log_bytes > _MIN_COMPACT_BYTES and log_bytes > self._compact_ratio * self._live_bytes:
+            self.compact()
+    
+    def _write_snapshot(self) -> None:
+        """Atomically replace the log with a snapshot of the live data."""
+        with self._file_lock:
             # Write to temporary file first to avoid corruption if process is killed
             temp_path = f"{self._file_path}.tmp"
-            with open(temp_path, 'w') as f:
-                json.dump(self._store, f)
+            with open(temp_path, 'wb') as f:
+                f.write(b''.join(
+                    self._pack(_OP_SET, key_str, _to_dict(entry))
+                    for key_str, entry in self._store.items()
+                ))
+                f.flush()
+                os.fsync(f.fileno())
             
             # Rename to actual file (atomic operation on most file systems)
             os.replace(temp_path, self._file_path)
+    
+    def compact(self) -> None:
+        """Rewrite the log so it contains only live keys."""
+        with self._lock:
+            self._fp.close()
+            self._write_snapshot()
+            self._fp = open(self._file_path, 'ab')
+            
+            self._last_sync = time.time()
+            self._dirty = False
+            self._compactions += 1
+    
+    def sync(self) -> None:
+        """Sync data to disk."""
+        with self._lock:
+            self._fp.flush()
+            os.fsync(self._fp.fileno())
             
             self._last_sync = time.time()
             self._dirty = False
             self._syncs += 1
     
+    def close(self) -> None:
+        """Sync and close the log file."""
+        with self._lock:
+            if not self._fp.closed:
+                self.sync()
+                self._fp.close()
+    
     def register_on_set(self, callback: Callable[[Key, Value], None]) -> None:
         """
         Register a callback for set operations.
@@ -155,12 +316,15 @@ class FileBackend:
             value: The value
         """
         key_str = str(key)
-        value_dict = value.to_dict()
+        value_dict = _to_dict(value)
         
         with self._lock:
-            self._store[key_str] = value_dict
+            record = self._pack(_OP_SET, key_str, value_dict)
+            self._store[key_str] = value
+            self._live_bytes += len(record) - self._record_sizes.get(key_str, 0)
+            self._record_sizes[key_str] = len(record)
             self._writes += 1
-            self._dirty = True
+            self._append(record)
         
         # Call callbacks
         for callback in self._on_set_callbacks:
@@ -187,26 +351,49 @@ class FileBackend:
         key_str = str(key)
         
         with self._lock:
-            if key_str in self._store:
-                self._reads += 1
-                value_data = self._store[key_str]
-                
-                # Determine value type and create Value object
-                value_type = value_data.get('type')
-                if value_type == 'StringValue':
-                    return StringValue.from_dict(value_data)
-                elif value_type == 'IntValue':
-                    return IntValue.from_dict(value_data)
-                elif value_type == 'FloatValue':
-                    return FloatValue.from_dict(value_data)
-                elif value_type == 'BytesValue':
-                    return BytesValue.from_dict(value_data)
-                elif value_type == 'JsonValue':
-                    return JsonValue.from_dict(value_data)
-                elif value_type == 'PickleValue':
-                    return PickleValue.from_dict(value_data)
+            entry = self._store.get(key_str)
+            if entry is None:
+                return None
+            self._reads += 1
+        
+        if isinstance(entry, Value):
+            return entry
+        return self._build_value(key_str, entry)
+    
+    def _build_value(self, key_str: str, value_data: Dict[str, Any]) -> Optional[Value]:
+        """
+        Build the Value for a stored key outside the lock and store it in place of its dictionary.
+        
+        Args:
+            key_str: String form of the key
+            value_data: Dictionary representation of the value, read under the lock
             
+        Returns:
+            The value, or None if the type is unknown
+        """
+        value = self._to_value(value_data)
+        if value is not None:
+            with self._lock:
+                # Skip keys that were overwritten or deleted in the meantime
+                if self._store.get(key_str) is value_data:
+                    self._store[key_str] = value
+        return value
+    
+    def _to_value(self, value_data: Dict[str, Any]) -> Optional[Value]:
+        """
+        Create a Value object from its stored dictionary form.
+        
+        Args:
+            value_data: Dictionary representation of the value
+            
+        Returns:
+            The value, or None if the type is unknown
+        """
+        # Determine value type and create Value object
+        value_class = VALUE_CLASSES.get(value_data.get('type'))
+        if value_class is None:
             return None
+        return value_class.from_dict(value_data)
     
     def delete(self, key: Key) -> bool:
         """
@@ -223,8 +410,9 @@ class FileBackend:
         with self._lock:
             if key_str in self._store:
                 del self._store[key_str]
+                self._live_bytes -= self._record_sizes.pop(key_str, 0)
                 self._deletes += 1
-                self._dirty = True
+                self._append(self._pack(_OP_DELETE, key_str))
                 deleted = True
             else:
                 deleted = False
@@ -244,6 +432,84 @@ class FileBackend:
         
         return deleted
     
+    def batch_set(self, mapping: Dict[Key, Value]) -> None:
+        """
+        Set values for multiple keys.
+        
+        All records are appended to the log in a single write.
+        
+        Args:
+            mapping: Dictionary of keys to values
+        """
+        value_dicts = [(str(key), value, _to_dict(value)) for key, value in mapping.items()]
+        
+        with self._lock:
+            records = []
+            for key_str, value, value_dict in value_dicts:
+                record = self._pack(_OP_SET, key_str, value_dict)
+                self._store[key_str] = value
+                self._live_bytes += len(record) - self._record_sizes.get(key_str, 0)
+                self._record_sizes[key_str] = len(record)
+                records.append(record)
+            self._writes += len(records)
+            self._append(b''.join(records))
+        
+        # Call callbacks
+        for callback in self._on_set_callbacks:
+            for key, value in mapping.items():
+                try:
+                    callback(key, value)
+                except Exception as e:
+                    # Don't let callback exceptions propagate
+                    pass
+        
+        # Sync immediately if auto_sync is disabled
+        if not self._auto_sync:
+            self.sync()
+    
+    def batch_delete(self, keys: List[Key]) -> int:
+        """
+        Delete multiple keys from the store.
+        
+        All records are appended to the log in a single write.
+        
+        Args:
+            keys: List of keys
+            
+        Returns:
+            Number of keys deleted
+        """
+        deleted: List[Key] = []
+        
+        with self._lock:
+            records = []
+            for key in keys:
+                key_str = str(key)
+                if key_str in self._store:
+                    del self._store[key_str]
+                    self._live_bytes -= self._record_sizes.pop(key_str, 0)
+                    records.append(self._pack(_OP_DELETE, key_str))
+                    deleted.append(key)
+            if records:
+                self._deletes += len(records)
+                self._append(b''.join(records))
+        
+        # Call callbacks (only for keys that were deleted)
+        if deleted:
+            for callback in self._on_delete_callbacks:
+                for key in deleted:
+                    try:
+                        callback(key)
+                    except Exception as e:
+                        # Don't let callback exceptions propagate
+                        pass
+            
+            # Sync immediately if auto_sync is disabled
+            if not self._auto_sync:
+                self.sync()
+        
+        return len(deleted)
+    
     def keys(self, pattern: Optional[str] = None, namespace: Optional[str] = None) -> List[Key]:
         """
         Get all keys in the store.
@@ -255,34 +521,71 @@ class FileBackend:
         Returns:
             List of keys
         """
+        # Compile the pattern once for the whole scan
+        regex = compile_pattern(pattern) if pattern is not None else None
+        
+        # Filter a snapshot of the keys so the lock is not held for the scan
+        with self._lock:
+            key_strs = list(self._store)
+        
+        # Filter on the key strings so only matching keys are parsed
+        result = []
+        for key_str in key_strs:
+            # Filter by namespace if specified
+            if namespace is not None and _namespace_of(key_str) != namespace:
+                continue
+            
+            # Filter by pattern if specified
+            if regex is not None and not regex.search(key_str):
+                continue
+            
+            result.append(Key.from_string(key_str))
+        
+        return result
+    
+    def items(self, pattern: Optional[str] = None, namespace: Optional[str] = None) -> List[Tuple[Key, Value]]:
+        """
+        Get all key-value pairs in the store.
+        
+        Args:
+            pattern: Optional pattern to filter keys
+            namespace: Optional namespace to filter keys
+            
+        Returns:
+            List of (key, value) tuples
+        """
+        # Compile the pattern once for the whole scan
+        regex = compile_pattern(pattern) if pattern is not None else None
+        
+        # Filter and build values from a snapshot so the lock is not held for the scan
         with self._lock:
-            result = []
-            for key_str in self._store.keys():
-                key = Key.from_string(key_str)
-                
-                # Filter by namespace if specified
-                if namespace is not None and key.namespace != namespace:
-                    continue
-                
-                # Filter by pattern if specified
-                if pattern is not None:
-                    # Use regex pattern matching
-                    if not re.search(pattern, key_str):
-                        continue
-                
-                result.append(key)
+            entries = list(self._store.items())
+        
+        result = []
+        for key_str, entry in entries:
+            # Filter by namespace if specified
+            if namespace is not None and _namespace_of(key_str) != namespace:
+                continue
             
-            return result
+            # Filter by pattern if specified
+            if regex is not None and not regex.search(key_str):
+                continue
+            
+            value = entry if isinstance(entry, Value) else self._build_value(key_str, entry)
+            if value is not None:
+                result.append((Key.from_string(key_str), value))
+        
+        return result
     
     def clear(self) -> None:
         """Clear all keys from the store."""
         with self._lock:
             self._store.clear()
-            self._dirty = True
-        
-        # Sync immediately if auto_sync is disabled
-        if not self._auto_sync:
-            self.sync()
+            self._record_sizes.clear()
+            self._live_bytes = 0
+            
+            # An empty snapshot is the cheapest way to record a clear
+            self.compact()
     
     def stats(self) -> Dict[str, Any]:
         """
@@ -292,20 +595,18 @@ class FileBackend:
             Dictionary of statistics
         """
         with self._lock:
-            file_size = 0
-            if os.path.exists(self._file_path):
-                file_size = os.path.getsize(self._file_path)
-            
             return {
                 'reads': self._reads,
                 'writes': self._writes,
                 'deletes': self._deletes,
                 'syncs': self._syncs,
+                'compactions': self._compactions,
                 'keys': len(self._store),
                 'file_backend': True,
                 'file_path': self._file_path,
-                'file_size': file_size,
+                'file_size': self._fp.tell(),
+                'live_bytes': self._live_bytes,
                 'last_sync': self._last_sync,
                 'auto_sync': self._auto_sync,
                 'dirty': self._dirty
-            } 
\ No newline at end of file
+            }
\ No newline at end of file
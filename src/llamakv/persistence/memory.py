@@ -4,34 +4,78 @@ Memory backend implementation for LlamaKV.
 This module provides a simple in-memory storage backend for the key-value store.
 """
 
-import re
+import sys
 import threading
 import time
+from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from llamakv.core.key import Key
-from llamakv.core.value import Value
+from llamakv.core.key import Key, compile_pattern
+from llamakv.core.value import Value, IntValue, JsonValue
+
+
+# Number of lock-striped shards (must be a power of two)
+NUM_SHARDS = 64
+
+# Sentinel for dict.pop lookups
+_MISSING = object()
 
 
 class MemoryBackend:
     """
     In-memory storage backend for the key-value store.
     
-    Stores all data in a Python dictionary in memory. This backend is fast
+    Stores all data in Python dictionaries in memory. Keys are spread over
+    a fixed number of shards, each guarded by its own lock, so concurrent
+    operations on different keys rarely contend. This backend is fast
     but non-persistent; all data is lost when the process exits.
     """
     
+    __slots__ = (
+        "_mask", "_shards", "_locks", "_on_set_callbacks", "_on_delete_callbacks",
+        "_reads", "_writes", "_deletes",
+    )
+    
     def __init__(self):
         """Initialize a new memory backend."""
-        self._store: Dict[Key, Value] = {}
-        self._lock = threading.RLock()
+        self._mask = NUM_SHARDS - 1
+        self._shards: List[Dict[Key, Value]] = [{} for _ in range(NUM_SHARDS)]
+        self._locks = [threading.RLock() for _ in range(NUM_SHARDS)]
         self._on_set_callbacks: List[Callable[[Key, Value], None]] = []
         self._on_delete_callbacks: List[Callable[[Key], None]] = []
         
-        # Stats
-        self._reads = 0
-        self._writes = 0
-        self._deletes = 0
+        # Stats (kept per shard so they are updated under the shard lock)
+        self._reads = [0] * NUM_SHARDS
+        self._writes = [0] * NUM_SHARDS
+        self._deletes = [0] * NUM_SHARDS
+    
+    def _pick(self, key: Key) -> int:
+        """
+        Get the shard index for a key.
+        
+        Args:
+            key: The key
+            
+        Returns:
+            Index of the shard holding the key
+        """
+        return hash(key) & self._mask
+    
+    def _group(self, keys) -> Dict[int, List[Key]]:
+        """
+        Group keys by shard index.
+        
+        Args:
+            keys: Iterable of keys
+            
+        Returns:
+            Dictionary mapping shard index to the keys in that shard
+        """
+        mask = self._mask
+        by_shard: Dict[int, List[Key]] = defaultdict(list)
+        for key in keys:
+            by_shard[hash(key) & mask].append(key)
+        return by_shard
     
     def register_on_set(self, callback: Callable[[Key, Value], None]) -> None:
         """
@@ -59,9 +103,11 @@ class MemoryBackend:
             key: The key
             value: The value
         """
-        with self._lock:
-            self._store[key] = value
-            self._writes += 1
+        # Shard selection is inlined on the hot path to save a method call
+        i = hash(key) & self._mask
+        with self._locks[i]:
+            self._shards[i][key] = value
+            self._writes[i] += 1
         
         # Call callbacks
         for callback in self._on_set_callbacks:
@@ -81,11 +127,14 @@ class MemoryBackend:
         Returns:
             The value, or None if not found
         """
-        with self._lock:
-            if key in self._store:
-                self._reads += 1
-                return self._store[key]
-            return None
+        # Readers take no lock: a single dict lookup is atomic, and writers
+        # only ever replace whole values. The read counter may therefore
+        # undercount slightly when many threads hit the same shard.
+        i = hash(key) & self._mask
+        value = self._shards[i].get(key)
+        if value is not None:
+            self._reads[i] += 1
+        return value
     
     def delete(self, key: Key) -> bool:
         """
@@ -97,13 +146,11 @@ class MemoryBackend:
         Returns:
             True if the key was deleted, False if it didn't exist
         """
-        with self._lock:
-            if key in self._store:
-                del self._store[key]
-                self._deletes += 1
-                deleted = True
-            else:
-                deleted = False
+        i = hash(key) & self._mask
+        with self._locks[i]:
+            deleted = self._shards[i].pop(key, None) is not None
+            if deleted:
+                self._deletes[i] += 1
         
         # Call callbacks (only if the key was deleted)
         if deleted:
@@ -116,6 +163,301 @@ class MemoryBackend:
         
         return deleted
     
+    def increment(self, key: Key, amount: int = 1) -> int:
+        """
+        Increment an integer value by the given amount.
+        
+        Only the lock of the key's shard is held, so counters in different
+        shards can be updated concurrently. A missing or expired key is
+        treated as 0. The TTL and metadata of an existing value are kept.
+        
+        Args:
+            key: The key
+            amount: Amount to increment by
+            
+        Returns:
+            The new value
+            
+        Raises:
+            ValueError: If the stored value is not an integer
+        """
+        i = self._pick(key)
+        with self._locks[i]:
+            shard = self._shards[i]
+            current = shard.get(key)
+            
+            if current is None or current.is_expired():
+                value = IntValue(amount)
+            elif isinstance(current, IntValue):
+                value_dict = current.to_dict()
+                value_dict['value'] += amount
+                value = IntValue.from_dict(value_dict)
+            else:
+                raise ValueError(f"Value for key {key} is not an integer")
+            
+            shard[key] = value
+            self._writes[i] += 1
+        
+        # Call callbacks
+        for callback in self._on_set_callbacks:
+            try:
+                callback(key, value)
+            except Exception as e:
+                # Don't let callback exceptions propagate
+                pass
+        
+        return value.value
+    
+    def decrement(self, key: Key, amount: int = 1) -> int:
+        """
+        Decrement an integer value by the given amount.
+        
+        Args:
+            key: The key
+            amount: Amount to decrement by
+            
+        Returns:
+            The new value
+            
+        Raises:
+            ValueError: If the stored value is not an integer
+        """
+        return self.increment(key, -amount)
+    
+    def _hash_value(self, shard: Dict[Key, Value], key: Key) -> Optional[JsonValue]:
+        """
+        Get the stored value of a hash (caller must hold the shard lock).
+        
+        Args:
+            shard: The shard holding the key
+            key: The hash key
+            
+        Returns:
+            The JsonValue holding the fields, or None if the hash doesn't exist
+            
+        Raises:
+            ValueError: If the stored value is not a hash
+        """
+        current = shard.get(key)
+        
+        if current is None or current.is_expired():
+            return None
+        if not isinstance(current, JsonValue) or not isinstance(current.value, dict):
+            raise ValueError(f"Value for key {key} is not a hash")
+        
+        return current
+    
+    def hash_set(self, key: Key, field: str, value: Any) -> bool:
+        """
+        Set a field in a hash.
+        
+        Hashes are stored as JsonValue dicts. Updates build a new dict and
+        replace the whole value under the lock of the key's shard, so
+        lock-free readers never see a dict change and no per-hash lock is
+        ever allocated. The TTL and metadata of an existing hash are kept.
+        
+        Args:
+            key: The hash key
+            field: Field to set
+            value: Value to set
+            
+        Returns:
+            True if the field is new, False if it was updated
+            
+        Raises:
+            ValueError: If the stored value is not a hash
+        """
+        i = self._pick(key)
+        with self._locks[i]:
+            shard = self._shards[i]
+            current = self._hash_value(shard, key)
+            if current is None:
+                updated = JsonValue({field: value})
+                is_new = True
+            else:
+                is_new = field not in current.value
+                updated = current.with_value({**current.value, field: value})
+            shard[key] = updated
+            self._writes[i] += 1
+        
+        # Call callbacks
+        for callback in self._on_set_callbacks:
+            try:
+                callback(key, updated)
+            except Exception as e:
+                # Don't let callback exceptions propagate
+                pass
+        
+        return is_new
+    
+    def hash_get(self, key: Key, field: str) -> Any:
+        """
+        Get a field from a hash.
+        
+        Args:
+            key: The hash key
+            field: Field to get
+            
+        Returns:
+            The field value, or None if not found
+        """
+        i = self._pick(key)
+        with self._locks[i]:
+            current = self._hash_value(self._shards[i], key)
+            self._reads[i] += 1
+            return current.value.get(field) if current is not None else None
+    
+    def hash_delete(self, key: Key, *fields: str) -> int:
+        """
+        Delete fields from a hash.
+        
+        Like hash_set, this replaces the whole value rather than changing
+        the stored dict, and counts as a single write.
+        
+        Args:
+            key: The hash key
+            *fields: Fields to delete
+            
+        Returns:
+            Number of fields deleted
+        """
+        i = self._pick(key)
+        with self._locks[i]:
+            shard = self._shards[i]
+            current = self._hash_value(shard, key)
+            if current is None:
+                return 0
+            
+            remaining = dict(current.value)
+            count = 0
+            for field in fields:
+                if remaining.pop(field, _MISSING) is not _MISSING:
+                    count += 1
+            if not count:
+                return 0
+            
+            updated = current.with_value(remaining)
+            shard[key] = updated
+            self._writes[i] += 1
+        
+        # Call callbacks
+        for callback in self._on_set_callbacks:
+            try:
+                callback(key, updated)
+            except Exception as e:
+                # Don't let callback exceptions propagate
+                pass
+        
+        return count
+    
+    def hash_exists(self, key: Key, field: str) -> bool:
+        """
+        Check if a field exists in a hash.
+        
+        Args:
+            key: The hash key
+            field: Field to check
+            
+        Returns:
+            True if the field exists, False otherwise
+        """
+        i = self._pick(key)
+        with self._locks[i]:
+            current = self._hash_value(self._shards[i], key)
+            return current is not None and field in current.value
+    
+    def hash_get_all(self, key: Key) -> Dict[str, Any]:
+        """
+        Get all fields and values from a hash.
+        
+        Args:
+            key: The hash key
+            
+        Returns:
+            A copy of the hash's fields
+        """
+        i = self._pick(key)
+        with self._locks[i]:
+            current = self._hash_value(self._shards[i], key)
+            self._reads[i] += 1
+            return dict(current.value) if current is not None else {}
+    
+    def batch_set(self, mapping: Dict[Key, Value]) -> None:
+        """
+        Set values for multiple keys.
+        
+        Each shard lock is acquired at most once for the whole batch.
+        
+        Args:
+            mapping: Dictionary of keys to values
+        """
+        for i, keys in self._group(mapping).items():
+            with self._locks[i]:
+                self._shards[i].update((key, mapping[key]) for key in keys)
+                self._writes[i] += len(keys)
+        
+        # Call callbacks
+        for callback in self._on_set_callbacks:
+            for key, value in mapping.items():
+                try:
+                    callback(key, value)
+                except Exception as e:
+                    # Don't let callback exceptions propagate
+                    pass
+    
+    def batch_get(self, keys: List[Key]) -> Dict[Key, Value]:
+        """
+        Get values for multiple keys.
+        
+        Each shard lock is acquired at most once for the whole batch.
+        
+        Args:
+            keys: List of keys
+            
+        Returns:
+            Dictionary of keys to values for the keys that were found
+        """
+        result: Dict[Key, Value] = {}
+        for i, shard_keys in self._group(keys).items():
+            with self._locks[i]:
+                shard = self._shards[i]
+                found = {key: shard[key] for key in shard_keys if key in shard}
+                self._reads[i] += len(found)
+            result.update(found)
+        return result
+    
+    def batch_delete(self, keys: List[Key]) -> int:
+        """
+        Delete multiple keys from the store.
+        
+        Each shard lock is acquired at most once for the whole batch.
+        
+        Args:
+            keys: List of keys
+            
+        Returns:
+            Number of keys deleted
+        """
+        deleted: List[Key] = []
+        for i, shard_keys in self._group(keys).items():
+            with self._locks[i]:
+                shard = self._shards[i]
+                for key in shard_keys:
+                    if shard.pop(key, None) is not None:
+                        deleted.append(key)
+                        self._deletes[i] += 1
+        
+        # Call callbacks (only for keys that were deleted)
+        for callback in self._on_delete_callbacks:
+            for key in deleted:
+                try:
+                    callback(key)
+                except Exception as e:
+                    # Don't let callback exceptions propagate
+                    pass
+        
+        return len(deleted)
+    
     def keys(self, pattern: Optional[str] = None, namespace: Optional[str] = None) -> List[Key]:
         """
         Get all keys in the store.
@@ -127,31 +469,86 @@ class MemoryBackend:
         Returns:
             List of keys
         """
-        with self._lock:
-            if pattern is None and namespace is None:
-                return list(self._store.keys())
-            
-            result = []
-            for key in self._store.keys():
-                # Filter by namespace if specified
-                if namespace is not None and key.namespace != namespace:
-                    continue
-                
-                # Filter by pattern if specified
-                if pattern is not None:
-                    key_str = str(key)
-                    # Use regex pattern matching
-                    if not re.search(pattern, key_str):
-                        continue
-                
-                result.append(key)
-            
-            return result
+        # Snapshot each shard under its own lock; no global lock is taken
+        all_keys = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                all_keys.extend(shard)
+        
+        if pattern is None and namespace is None:
+            return all_keys
+        
+        # Compile the pattern once for the whole scan
+        regex = compile_pattern(pattern) if pattern is not None else None
+        
+        # Key namespaces are interned, so interning the filter lets keys in
+        # the namespace match on identity without comparing strings
+        if type(namespace) is str:
+            namespace = sys.intern(namespace)
+        
+        result = []
+        for key in all_keys:
+            # Filter by namespace if specified
+            key_namespace = key.namespace
+            if namespace is not None and key_namespace is not namespace and key_namespace != namespace:
+                continue
+            
+            # Filter by pattern if specified
+            if regex is not None and not regex.search(str(key)):
+                continue
+            
+            result.append(key)
+        
+        return result
+    
+    def items(self, pattern: Optional[str] = None, namespace: Optional[str] = None) -> List[Tuple[Key, Value]]:
+        """
+        Get all key-value pairs in the store.
+        
+        Args:
+            pattern: Optional pattern to filter keys
+            namespace: Optional namespace to filter keys
+            
+        Returns:
+            List of (key, value) tuples
+        """
+        # Snapshot each shard under its own lock; no global lock is taken
+        all_items = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                all_items.extend(shard.items())
+        
+        if pattern is None and namespace is None:
+            return all_items
+        
+        # Compile the pattern once for the whole scan
+        regex = compile_pattern(pattern) if pattern is not None else None
+        
+        # Key namespaces are interned, so interning the filter lets keys in
+        # the namespace match on identity without comparing strings
+        if type(namespace) is str:
+            namespace = sys.intern(namespace)
+        
+        result = []
+        for key, value in all_items:
+            # Filter by namespace if specified
+            key_namespace = key.namespace
+            if namespace is not None and key_namespace is not namespace and key_namespace != namespace:
+                continue
+            
+            # Filter by pattern if specified
+            if regex is not None and not regex.search(str(key)):
+                continue
+            
+            result.append((key, value))
+        
+        return result
     
     def clear(self) -> None:
         """Clear all keys from the store."""
-        with self._lock:
-            self._store.clear()
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
     
     def stats(self) -> Dict[str, Any]:
         """
@@ -160,11 +557,11 @@ class MemoryBackend:
         Returns:
             Dictionary of statistics
         """
-        with self._lock:
-            return {
-                'reads': self._reads,
-                'writes': self._writes,
-                'deletes': self._deletes,
-                'keys': len(self._store),
-                'memory_backend': True
-            } 
\ No newline at end of file
+        return {
+            'reads': sum(self._reads),
+            'writes': sum(self._writes),
+            'deletes': sum(self._deletes),
+            'keys': sum(len(shard) for shard in self._shards),
+            'shards': NUM_SHARDS,
+            'memory_backend': True
+        } 
\ No newline at end of file
@@ -7,15 +7,14 @@ which persists data in a SQLite database file.
 
 import json
 import os
-import re
 import sqlite3
 import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-from llamakv.core.key import Key
-from llamakv.core.value import Value, StringValue, IntValue, FloatValue, BytesValue, JsonValue, PickleValue
+from llamakv.core.key import Key, compile_pattern
+from llamakv.core.value import Value, VALUE_CLASSES
 
 
 class SQLiteBackend:
@@ -235,35 +234,36 @@ class SQLiteBackend:
                 return None
             
             self._reads += 1
+            return self._row_to_value(row)
+    
+    def _row_to_value(self, row: Tuple[str, str, float, Optional[int], Optional[str]]) -> Optional[Value]:
+        """
+        Create a Value object from a database row.
+        
+        Args:
+            row: Tuple of (value, type, created_at, ttl, metadata) columns
             
-            # Parse row
-            value_json, value_type, created_at, ttl, metadata_json = row
-            
-            # Create value dictionary
-            value_dict = {
-                'value': json.loads(value_json),
-                'type': value_type,
-                'created_at': created_at,
-                'ttl': ttl,
-                'metadata': json.loads(metadata_json) if metadata_json else {}
-            }
-            
-            # Create Value object based on type
-            if value_type == 'StringValue':
-                return StringValue.from_dict(value_dict)
-            elif value_type == 'IntValue':
-                return IntValue.from_dict(value_dict)
-            elif value_type == 'FloatValue':
-                return FloatValue.from_dict(value_dict)
-            elif value_type == 'BytesValue':
-                return BytesValue.from_dict(value_dict)
-            elif value_type == 'JsonValue':
-                return JsonValue.from_dict(value_dict)
-            elif value_type == 'PickleValue':
-                return PickleValue.from_dict(value_dict)
-            else:
-                # Unknown value type
-                return None
+        Returns:
+            The value, or None if the type is unknown
+        """
+        # Parse row
+        value_json, value_type, created_at, ttl, metadata_json = row
+        
+        value_class = VALUE_CLASSES.get(value_type)
+        if value_class is None:
+            # Unknown value type
+            return None
+        
+        # Create value dictionary
+        value_dict = {
+            'value': json.loads(value_json),
+            'type': value_type,
+            'created_at': created_at,
+            'ttl': ttl,
+            'metadata': json.loads(metadata_json) if metadata_json else {}
+        }
+        
+        return value_class.from_dict(value_dict)
     
     def delete(self, key: Key) -> bool:
         """
@@ -311,6 +311,53 @@ class SQLiteBackend:
         
         return exists
     
+    def batch_set(self, mapping: Dict[Key, Value]) -> None:
+        """
+        Set values for multiple keys.
+        
+        All rows are written with a single executemany call.
+        
+        Args:
+            mapping: Dictionary of keys to values
+        """
+        rows = []
+        for key, value in mapping.items():
+            value_dict = value.to_dict()
+            rows.append((
+                str(key),
+                json.dumps(value_dict['value']),
+                value_dict['type'],
+                value_dict['created_at'],
+                value_dict.get('ttl'),
+                json.dumps(value_dict.get('metadata', {}))
+            ))
+        
+        with self._lock, self._connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO kv_store
+                (key, value, type, created_at, ttl, metadata)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows
+            )
+            
+            self._writes += len(rows)
+            self._transaction_active = True
+            
+            # Commit immediately if auto_commit is disabled
+            if not self._auto_commit:
+                self._commit()
+        
+        # Call callbacks
+        for callback in self._on_set_callbacks:
+            for key, value in mapping.items():
+                try:
+                    callback(key, value)
+                except Exception as e:
+                    # Don't let callback exceptions propagate
+                    pass
+    
     def keys(self, pattern: Optional[str] = None, namespace: Optional[str] = None) -> List[Key]:
         """
         Get all keys in the store.
@@ -322,9 +369,20 @@ class SQLiteBackend:
         Returns:
             List of keys
         """
+        # Compile the pattern once for the whole scan
+        regex = compile_pattern(pattern) if pattern is not None else None
+        
         with self._lock, self._connection() as conn:
-            # Query all keys
-            cursor = conn.execute("SELECT key FROM kv_store")
+            if namespace is not None:
+                # Namespaced keys share the "namespace:" prefix, so a range
+                # scan on the primary key index avoids reading every row
+                cursor = conn.execute(
+                    "SELECT key FROM kv_store WHERE key >= ? AND key < ?",
+                    (f"{namespace}:", f"{namespace};")
+                )
+            else:
+                # Query all keys
+                cursor = conn.execute("SELECT key FROM kv_store")
             
             # Process results
             result = []
@@ -337,15 +395,63 @@ class SQLiteBackend:
                     continue
                 
                 # Filter by pattern if specified
-                if pattern is not None:
-                    # Use regex pattern matching
-                    if not re.search(pattern, key_str):
-                        continue
+                if regex is not None and not regex.search(key_str):
+                    continue
                 
                 result.append(key)
             
             return result
     
+    def items(self, pattern: Optional[str] = None, namespace: Optional[str] = None) -> List[Tuple[Key, Value]]:
+        """
+        Get all key-value pairs in the store.
+        
+        Args:
+            pattern: Optional pattern to filter keys
+            namespace: Optional namespace to filter keys
+            
+        Returns:
+            List of (key, value) tuples
+        """
+        # Compile the pattern once for the whole scan
+        regex = compile_pattern(pattern) if pattern is not None else None
+        
+        with self._lock, self._connection() as conn:
+            if namespace is not None:
+                # Same prefix range scan as keys()
+                cursor = conn.execute(
+                    """
+                    SELECT key, value, type, created_at, ttl, metadata
+                    FROM kv_store
+                    WHERE key >= ? AND key < ?
+                    """,
+                    (f"{namespace}:", f"{namespace};")
+                )
+            else:
+                cursor = conn.execute(
+                    "SELECT key, value, type, created_at, ttl, metadata FROM kv_store"
+                )
+            
+            # Process results
+            result = []
+            for row in cursor:
+                key_str = row[0]
+                key = Key.from_string(key_str)
+                
+                # Filter by namespace if specified
+                if namespace is not None and key.namespace != namespace:
+                    continue
+                
+                # Filter by pattern if specified
+                if regex is not None and not regex.search(key_str):
+                    continue
+                
+                value = self._row_to_value(row[1:])
+                if value is not None:
+                    result.append((key, value))
+            
+            return result
+    
     def clear(self) -> None:
         """Clear all keys from the store."""
         with self._lock, self._connection() as conn:
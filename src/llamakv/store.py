@@ -12,8 +12,6 @@ from llamakv.transaction import Transaction
 from llamakv.pubsub import PubSub
 from llamakv.backends.memory import MemoryBackend
 from llamakv.backends.file import FileBackend
-from llamakv.backends.redis import RedisBackend
-from llamakv.backends.distributed import DistributedBackend
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +72,8 @@ class KVStore:
                 max_keys=max_keys
             )
         elif backend == "redis":
+            # Imported here so redis is only loaded when it is used
+            from llamakv.backends.redis import RedisBackend
             self.backend = RedisBackend(
                 host=host,
                 port=port,
@@ -82,6 +82,7 @@ class KVStore:
         elif backend == "distributed":
             if not nodes:
                 raise ValueError("Nodes must be specified for distributed backend")
+            from llamakv.backends.distributed import DistributedBackend
             self.backend = DistributedBackend(nodes=nodes)
         else:
             raise ValueError(f"Unknown backend type: {backend}")
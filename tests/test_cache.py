@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""
+Unit tests for the cache strategies.
+"""
+
+import unittest
+
+from llamakv.core.key import Key
+from llamakv.core.value import StringValue
+from llamakv.cache.clock import ClockCache
+from llamakv.cache.lru import ShardedLRUCache
+from llamakv.cache.wtinylfu import CountMinSketch, WTinyLFUCache
+
+
+class TestWTinyLFUCache(unittest.TestCase):
+    """Test cases for the WTinyLFUCache class."""
+    
+    def test_promotion(self):
+        """Test that entries move from the window to probation to protected."""
+        cache = WTinyLFUCache(capacity=100)
+        
+        # The window holds a single entry, so the second set pushes the first out
+        cache.set(Key("a"), StringValue("1"))
+        self.assertEqual(cache.stats()['window_size'], 1)
+        cache.set(Key("b"), StringValue("2"))
+        stats = cache.stats()
+        self.assertEqual(stats['window_size'], 1)
+        self.assertEqual(stats['probation_size'], 1)
+        
+        # A hit in probation promotes the entry
+        self.assertEqual(cache.get(Key("a")).value, "1")
+        stats = cache.stats()
+        self.assertEqual(stats['probation_size'], 0)
+        self.assertEqual(stats['protected_size'], 1)
+    
+    def test_admission_rejects_cold_candidate(self):
+        """Test that a rarely seen candidate cannot evict a hot victim."""
+        cache = WTinyLFUCache(capacity=2)
+        cache.set(Key("hot"), StringValue("hot"))
+        cache.set(Key("cold"), StringValue("cold"))
+        for _ in range(5):
+            self.assertIsNotNone(cache.get(Key("hot")))
+        
+        # "cold" leaves the window and loses to "hot"
+        cache.set(Key("new"), StringValue("new"))
+        self.assertEqual(cache.stats()['rejections'], 1)
+        self.assertIsNotNone(cache.get(Key("hot")))
+        self.assertIsNone(cache.get(Key("cold")))
+        self.assertIsNotNone(cache.get(Key("new")))
+    
+    def test_small_capacities(self):
+        """Test that tiny caches never grow past their capacity."""
+        for capacity in (1, 2):
+            cache = WTinyLFUCache(capacity=capacity)
+            for i in range(10):
+                cache.set(Key(f"key{i}"), StringValue(str(i)))
+                cache.get(Key(f"key{i}"))
+                self.assertLessEqual(cache.stats()['size'], capacity)
+            
+            # The most recent entry is always in the window
+            self.assertEqual(cache.get(Key("key9")).value, "9")
+            
+            # Overwrites and deletes work in every region
+            cache.set(Key("key9"), StringValue("updated"))
+            self.assertEqual(cache.get(Key("key9")).value, "updated")
+            self.assertTrue(cache.delete(Key("key9")))
+            self.assertIsNone(cache.get(Key("key9")))
+    
+    def test_sketch_reset(self):
+        """Test that the sketch halves its counters once the sample is full."""
+        sketch = CountMinSketch(16)
+        for _ in range(10):
+            sketch.increment(1)
+        self.assertEqual(sketch.frequency(1), 10)
+        
+        # Other items fill the sample until every counter is halved
+        item = 1000
+        size = sketch._size
+        while sketch._size >= size:
+            # Collisions may have raised the estimate, so compare with the latest one
+            frequency = sketch.frequency(1)
+            size = sketch._size
+            sketch.increment(item)
+            item += 1
+        self.assertGreaterEqual(frequency, 10)
+        self.assertEqual(sketch.frequency(1), frequency // 2)
+        
+        # Counters saturate at 15
+        for _ in range(20):
+            sketch.increment(2)
+        self.assertEqual(sketch.frequency(2), 15)
+
+
+class TestClockCache(unittest.TestCase):
+    """Test cases for the ClockCache class."""
+    
+    def test_second_chance_eviction(self):
+        """Test that the hand skips referenced entries and evicts the first unreferenced one."""
+        cache = ClockCache(capacity=3)
+        for name in ("a", "b", "c"):
+            cache.set(Key(name), StringValue(name))
+        
+        # "a" is referenced, so the hand clears its bit and evicts "b"
+        self.assertIsNotNone(cache.get(Key("a")))
+        cache.set(Key("d"), StringValue("d"))
+        self.assertIsNone(cache.get(Key("b")))
+        for name in ("a", "c", "d"):
+            self.assertEqual(cache.get(Key(name)).value, name)
+        self.assertEqual(cache.stats()['evictions'], 1)
+    
+    def test_overwrite_and_delete(self):
+        """Test overwriting and deleting entries."""
+        cache = ClockCache(capacity=2)
+        cache.set(Key("a"), StringValue("1"))
+        cache.set(Key("a"), StringValue("2"))
+        self.assertEqual(cache.get(Key("a")).value, "2")
+        self.assertEqual(cache.stats()['size'], 1)
+        
+        self.assertTrue(cache.delete(Key("a")))
+        self.assertFalse(cache.delete(Key("a")))
+        self.assertIsNone(cache.get(Key("a")))
+        
+        # The freed slot is reused without evicting anything
+        cache.set(Key("b"), StringValue("b"))
+        cache.set(Key("c"), StringValue("c"))
+        stats = cache.stats()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['evictions'], 0)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+
+
+class TestShardedLRUCache(unittest.TestCase):
+    """Test cases for the ShardedLRUCache class."""
+    
+    def test_capacity(self):
+        """Test that the shards add up to the requested capacity."""
+        for capacity, num_shards in ((100, 16), (3, 16), (1, 4)):
+            cache = ShardedLRUCache(capacity=capacity, num_shards=num_shards)
+            for i in range(capacity * 10):
+                cache.set(Key(f"key{i}"), StringValue(str(i)))
+            stats = cache.stats()
+            self.assertLessEqual(stats['shards'], capacity)
+            self.assertLessEqual(stats['size'], capacity)
+    
+    def test_basic_operations(self):
+        """Test get, overwrite and delete across shards."""
+        cache = ShardedLRUCache(capacity=1024, num_shards=5)
+        self.assertEqual(cache.stats()['shards'], 8)
+        
+        for i in range(32):
+            cache.set(Key(f"key{i}"), StringValue(str(i)))
+        cache.set(Key("key0"), StringValue("updated"))
+        self.assertEqual(cache.get(Key("key0")).value, "updated")
+        self.assertEqual(cache.get(Key("key31")).value, "31")
+        
+        self.assertTrue(cache.delete(Key("key0")))
+        self.assertIsNone(cache.get(Key("key0")))
+        self.assertEqual(cache.stats()['size'], 31)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
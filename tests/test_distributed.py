@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+"""
+Unit tests for the distributed client and server.
+"""
+
+import unittest
+
+from flask import Flask
+
+from llamakv.core.key import Key
+from llamakv.core.store import KVStore
+from llamakv.core.value import StringValue
+
+from llamakv.distributed.client import DistributedClient, _Breaker
+from llamakv.distributed.server import DistributedServer, _OrjsonProvider, orjson
+
+
+class _Response:
+    """Canned response standing in for requests.Response."""
+    
+    def __init__(self, status_code, content, content_type='application/json'):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {'Content-Type': content_type}
+
+
+class TestDistributedClient(unittest.TestCase):
+    """Test cases for the DistributedClient class."""
+    
+    def test_breaker_transitions(self):
+        """Test the breaker's open, half-open and closed states."""
+        breaker = _Breaker(threshold=2, reset_timeout=10, max_timeout=25)
+        self.assertTrue(breaker.allow(0))
+        
+        # Opens after the threshold and fails fast until the timeout passes
+        breaker.record_failure(0)
+        self.assertEqual(breaker.state, 'closed')
+        breaker.record_failure(1)
+        self.assertEqual(breaker.state, 'open')
+        self.assertFalse(breaker.allow(10))
+        
+        # Half-open lets a single probe through
+        self.assertTrue(breaker.allow(11))
+        self.assertEqual(breaker.state, 'half_open')
+        self.assertFalse(breaker.allow(11))
+        
+        # A failed probe reopens it for twice as long, up to the maximum
+        breaker.record_failure(11)
+        self.assertEqual(breaker.state, 'open')
+        self.assertFalse(breaker.allow(30))
+        self.assertTrue(breaker.allow(31))
+        breaker.record_failure(31)
+        self.assertFalse(breaker.allow(55))
+        self.assertTrue(breaker.allow(56))
+        
+        # A successful probe closes it and resets the timeout
+        breaker.record_success()
+        self.assertEqual(breaker.state, 'closed')
+        self.assertEqual(breaker.trips, 0)
+        self.assertTrue(breaker.allow(56))
+    
+    def test_malformed_response_reopens_breaker(self):
+        """Test that an undecodable body during a probe counts as a failure."""
+        node = "http://node1:8080"
+        client = DistributedClient([node], retry_attempts=1, async_updates=False, l1_maxsize=0)
+        try:
+            breaker = client._breakers[node]
+            requests_sent = []
+            
+            def respond(content, content_type='application/json'):
+                def get(*args, **kwargs):
+                    requests_sent.append(content)
+                    return _Response(200, content, content_type)
+                client._session.get = get
+            
+            for content, content_type in ((b'{"value": ', 'application/json'),
+                                          (b'\xc1', 'application/x-msgpack')):
+                respond(content, content_type)
+                
+                # Open the breaker with its probe already due
+                breaker.record_failure(0)
+                breaker.next_probe_at = 0
+                
+                self.assertIsNone(client.get_remote(Key("key")))
+                self.assertEqual(requests_sent[-1], content)
+                self.assertEqual(breaker.state, 'open')
+            
+            # A good answer to the next probe closes it again
+            respond(b'{"value": "v"}')
+            breaker.next_probe_at = 0
+            self.assertEqual(client.get_remote(Key("key")), {"value": "v"})
+            self.assertEqual(breaker.state, 'closed')
+        finally:
+            client.shutdown()
+    
+    def test_read_fails_over_between_nodes(self):
+        """Test that reads try one node at a time and leave unused breakers alone."""
+        nodes = ["http://a", "http://b"]
+        client = DistributedClient(nodes, retry_attempts=1, async_updates=False, l1_maxsize=0)
+        try:
+            requested = []
+            
+            down = {"http://a"}
+            
+            def get(url, **kwargs):
+                requested.append(url)
+                if url.startswith(tuple(down)):
+                    return _Response(500, b'')
+                return _Response(200, b'{"value": "v"}')
+            client._session.get = get
+            
+            # "a" fails, so the read moves on to "b"
+            self.assertEqual(client.get_remote(Key("key")), {"value": "v"})
+            self.assertEqual(requested, ["http://a/api/v1/key/key", "http://b/api/v1/key/key"])
+            
+            # Once "a" answers, "b" is not asked, and its due probe is not used up
+            down.clear()
+            breaker = client._breakers["http://b"]
+            breaker.record_failure(0)
+            breaker.next_probe_at = 0
+            client._breakers["http://a"].record_success()
+            requested.clear()
+            self.assertEqual(client.get_remote(Key("other")), {"value": "v"})
+            self.assertEqual(requested, ["http://a/api/v1/key/other"])
+            self.assertEqual(breaker.state, 'open')
+            self.assertEqual(client._live_nodes(), nodes)
+        finally:
+            client.shutdown()
+    
+    def test_l1_cache(self):
+        """Test that the local read cache is opt-in and honours invalidations."""
+        requested = []
+        
+        def get(url, **kwargs):
+            requested.append(url)
+            if url.endswith("/missing"):
+                return _Response(404, b'')
+            return _Response(200, b'{"value": "v"}')
+        
+        # Off by default
+        client = DistributedClient(["http://a"], retry_attempts=1, async_updates=False)
+        try:
+            client._session.get = get
+            client.get_remote(Key("key"))
+            client.get_remote(Key("key"))
+            self.assertEqual(len(requested), 2)
+        finally:
+            client.shutdown()
+        
+        client = DistributedClient(["http://a"], retry_attempts=1, async_updates=False, l1_maxsize=10)
+        try:
+            client._session.get = get
+            requested.clear()
+            
+            # Answers are cached, misses are not unless asked for
+            self.assertEqual(client.get_remote(Key("key")), {"value": "v"})
+            self.assertEqual(client.get_remote(Key("key")), {"value": "v"})
+            self.assertIsNone(client.get_remote(Key("missing")))
+            self.assertIsNone(client.get_remote(Key("missing")))
+            self.assertEqual(len(requested), 3)
+            
+            # An invalidation during a read keeps its answer out of the cache
+            def racing_get(url, **kwargs):
+                client._invalidate_l1(Key("racy"))
+                return get(url, **kwargs)
+            client._session.get = racing_get
+            client.get_remote(Key("racy"))
+            client._session.get = get
+            requested.clear()
+            client.get_remote(Key("racy"))
+            self.assertEqual(len(requested), 1)
+        finally:
+            client.shutdown()
+
+
+def _set(key):
+    """Build a propagated set operation."""
+    return {'operation': 'set', 'key': key, 'value': StringValue(key).to_dict()}
+
+
+class TestDistributedServer(unittest.TestCase):
+    """Test cases for the DistributedServer class."""
+    
+    def setUp(self):
+        """Set up a server around a fresh store."""
+        self.store = KVStore()
+        self.server = DistributedServer(self.store, log_requests=False)
+        self.client = self.server._app.test_client()
+    
+    def test_batch_ordering_around_clear(self):
+        """Test that operations before a clear land before it and later ones after it."""
+        response = self.client.post("/api/v1/batch", json=[
+            _set("before"),
+            {'operation': 'delete', 'key': 'missing'},
+            {'operation': 'clear'},
+            _set("after"),
+            _set("deleted"),
+            {'operation': 'delete', 'key': 'deleted'},
+        ])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"success": True, "applied": 6})
+        
+        self.assertFalse(self.store.exists("before"))
+        self.assertTrue(self.store.exists("after"))
+        self.assertFalse(self.store.exists("deleted"))
+    
+    def test_propagate_operations(self):
+        """Test that /propagate applies an operation list like /batch."""
+        response = self.client.post("/api/v1/propagate", json={'operations': [_set("a"), _set("b")]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["applied"], 2)
+        self.assertTrue(self.store.exists("a"))
+        self.assertTrue(self.store.exists("b"))
+        self.assertEqual(self.server._stats['propagations_received'], 2)
+        
+        # A single operation is still accepted
+        response = self.client.post("/api/v1/propagate", json=_set("c"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.store.exists("c"))
+    
+    def test_invalid_operation_stops_batch(self):
+        """Test that operations before an invalid one are applied and reported."""
+        invalid_entries = [
+            {'operation': 'bogus'},
+            {'operation': 'set', 'value': StringValue("x").to_dict()},
+            {'operation': 'set', 'key': 'bad', 'value': {'type': 'StringValue'}},
+            {'operation': 'delete'},
+            "not an operation",
+        ]
+        for path, wrap in (("/api/v1/batch", list), ("/api/v1/propagate", lambda ops: {'operations': ops})):
+            for invalid in invalid_entries:
+                self.store.clear()
+                response = self.client.post(path, json=wrap([_set("first"), invalid, _set("never")]))
+                self.assertEqual(response.status_code, 400, (path, invalid))
+                self.assertEqual(response.get_json()["applied"], 1)
+                self.assertTrue(self.store.exists("first"))
+                self.assertFalse(self.store.exists("never"))
+        
+        # A malformed single operation is a client error too
+        response = self.client.post("/api/v1/propagate", json={'operation': 'delete'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post("/api/v1/batch", json={'operation': 'clear'})
+        self.assertEqual(response.status_code, 400)
+    
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_provider_loads(self):
+        """Test that the orjson provider reads what the json provider reads."""
+        provider = _OrjsonProvider(Flask(__name__))
+        
+        self.assertEqual(provider.loads(b'{"a": 1}'), {"a": 1})
+        self.assertEqual(provider.loads('{"a": 1}'), {"a": 1})
+        
+        # NaN and Infinity literals fall back to json
+        data = provider.loads(b'{"nan": NaN, "inf": Infinity}')
+        self.assertNotEqual(data["nan"], data["nan"])
+        self.assertEqual(data["inf"], float("inf"))
+        
+        # Integers wider than 64 bits stay integers
+        self.assertEqual(provider.loads(b'{"big": 1180591620717411303424}'), {"big": 2 ** 70})
+        
+        with self.assertRaises(ValueError):
+            provider.loads(b'{"a": ')
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -75,6 +75,20 @@ class TestKey(unittest.TestCase):
         self.assertEqual(key_bytes.value, b"binary")
         self.assertEqual(str(key_bool), "True")
     
+    def test_acquire_shares_instances(self):
+        """Test that acquired keys are shared but distinguish value types."""
+        key1 = Key.acquire("test", namespace="ns")
+        key2 = Key.acquire("test", namespace="ns")
+        self.assertIs(key1, key2)
+        self.assertEqual(key1, Key("test", namespace="ns"))
+        
+        # 1 and True compare equal but are different keys
+        self.assertEqual(str(Key.acquire(1)), "1")
+        self.assertEqual(str(Key.acquire(True)), "True")
+        
+        with self.assertRaises(TypeError):
+            Key.acquire([1, 2, 3])
+    
     def test_unhashable_key_value(self):
         """Test creating a key with an unhashable value."""
         with self.assertRaises(TypeError):
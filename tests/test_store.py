@@ -7,10 +7,11 @@ import time
 import unittest
 import tempfile
 import os
+import json
 from typing import Dict, Any
 
 from llamakv.core.key import Key
-from llamakv.core.value import StringValue
+from llamakv.core.value import StringValue, BytesValue, IntValue
 from llamakv.core.store import KVStore
 from llamakv.persistence import MemoryBackend, FileBackend, SQLiteBackend
 from llamakv.cache import LRUCache, TTLCache
@@ -178,6 +179,11 @@ class TestKVStore(unittest.TestCase):
         value, meta = self.store.get_with_metadata("meta")
         self.assertEqual(value, "value")
         self.assertEqual(meta, metadata)
+        
+        # The metadata is a plain dict the caller may change
+        self.assertIsInstance(meta, dict)
+        meta["changed"] = True
+        self.assertNotIn("changed", self.store.get_with_metadata("meta")[1])
     
     def test_file_backend(self):
         """Test using a file backend."""
@@ -204,6 +210,109 @@ class TestKVStore(unittest.TestCase):
             # Clean up
             os.unlink(temp_path)
     
+    def test_file_backend_replay(self):
+        """Test that overwrites and deletes survive a reopen."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "store.log")
+            
+            backend = FileBackend(temp_path)
+            backend.set(Key("kept"), StringValue("1"))
+            backend.set(Key("overwritten"), StringValue("old"))
+            backend.set(Key("overwritten"), StringValue("new"))
+            backend.set(Key("deleted"), StringValue("gone"))
+            self.assertTrue(backend.delete(Key("deleted")))
+            backend.batch_set({Key("batch1"): StringValue("b1"), Key("batch2"): StringValue("b2")})
+            self.assertEqual(backend.batch_delete([Key("batch2"), Key("missing")]), 1)
+            backend.close()
+            
+            backend = FileBackend(temp_path)
+            self.assertEqual(sorted(str(key) for key in backend.keys()), ["batch1", "kept", "overwritten"])
+            self.assertEqual(backend.get(Key("overwritten")).value, "new")
+            self.assertIsNone(backend.get(Key("deleted")))
+            
+            # A decoded value is kept, and snapshots mix decoded and undecoded entries
+            self.assertIs(backend.get(Key("overwritten")), backend.get(Key("overwritten")))
+            backend.compact()
+            backend.close()
+            
+            backend = FileBackend(temp_path)
+            self.assertEqual(backend.get(Key("overwritten")).value, "new")
+            self.assertEqual(backend.get(Key("kept")).value, "1")
+            backend.close()
+    
+    def test_file_backend_compaction(self):
+        """Test that a compacted log holds only live keys and reopens intact."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "store.log")
+            
+            # Overwriting one key grows the log until it is compacted
+            backend = FileBackend(temp_path)
+            for i in range(5000):
+                backend.set(Key("counter"), StringValue(str(i)))
+            backend.set(Key("other"), StringValue("value"))
+            stats = backend.stats()
+            self.assertGreater(stats['compactions'], 0)
+            self.assertLess(stats['file_size'], 64 * 1024)
+            
+            backend.compact()
+            self.assertEqual(backend.stats()['file_size'], backend.stats()['live_bytes'])
+            backend.close()
+            
+            backend = FileBackend(temp_path)
+            self.assertEqual(backend.get(Key("counter")).value, "4999")
+            self.assertEqual(backend.get(Key("other")).value, "value")
+            self.assertEqual(len(backend.keys()), 2)
+            backend.close()
+    
+    def test_file_backend_legacy_snapshot(self):
+        """Test that a legacy JSON snapshot is loaded and rewritten as a log."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "store.json")
+            with open(temp_path, 'w') as f:
+                json.dump({
+                    "legacy": StringValue("old").to_dict(),
+                    "ns:data": BytesValue(b"raw").to_dict(),
+                }, f)
+            
+            backend = FileBackend(temp_path)
+            self.assertEqual(backend.get(Key("legacy")).value, "old")
+            self.assertEqual(backend.get(Key.from_string("ns:data")).value, b"raw")
+            backend.set(Key("new"), StringValue("value"))
+            backend.close()
+            
+            with open(temp_path, 'rb') as f:
+                self.assertNotEqual(f.read(1), b'{')
+            
+            backend = FileBackend(temp_path)
+            self.assertEqual(sorted(str(key) for key in backend.keys()), ["legacy", "new", "ns:data"])
+            self.assertEqual(backend.get(Key.from_string("ns:data")).value, b"raw")
+            backend.close()
+    
+    def test_file_backend_torn_tail(self):
+        """Test that writes after a torn record survive the next reopen."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "store.log")
+            
+            backend = FileBackend(temp_path)
+            backend.set(Key("a"), StringValue("1"))
+            backend.set(Key("b"), StringValue("2"))
+            backend.close()
+            
+            # Simulate a crash part way through appending a record
+            with open(temp_path, 'rb') as f:
+                record = f.read()[-20:]
+            with open(temp_path, 'ab') as f:
+                f.write(record[:10])
+            
+            backend = FileBackend(temp_path)
+            backend.set(Key("d"), StringValue("4"))
+            backend.close()
+            
+            backend = FileBackend(temp_path)
+            self.assertEqual(sorted(str(key) for key in backend.keys()), ["a", "b", "d"])
+            self.assertEqual(backend.get(Key("d")).value, "4")
+            backend.close()
+    
     def test_sqlite_backend(self):
         """Test using a SQLite backend."""
         # Create a temporary file
@@ -245,6 +354,118 @@ class TestKVStore(unittest.TestCase):
         time.sleep(1.1)
         self.assertIsNone(store_ttl.get("ttl"))
     
+    def test_single_cache_write_per_set(self):
+        """Test that a set writes the cache once."""
+        cache = LRUCache(capacity=10)
+        store = KVStore(cache_strategy=cache)
+        store.set("once", "value")
+        self.assertEqual(cache.stats()['inserts'], 1)
+        self.assertEqual(store.get("once"), "value")
+        self.assertEqual(cache.stats()['hits'], 1)
+    
+    def test_negative_cache(self):
+        """Test that recent backend misses are remembered until the key is set."""
+        lookups = []
+        
+        class CountingBackend(MemoryBackend):
+            def get(self, key):
+                lookups.append(key)
+                return super().get(key)
+        
+        backend = CountingBackend()
+        store = KVStore(backend=backend, negative_cache_ttl=60)
+        
+        self.assertIsNone(store.get("absent"))
+        self.assertFalse(store.exists("absent"))
+        self.assertEqual(len(lookups), 1)
+        
+        store.set("absent", "present")
+        self.assertEqual(store.get("absent"), "present")
+        
+        # A set landing between the backend miss and the negative insert wins
+        class RacingBackend(MemoryBackend):
+            def get(self, key):
+                value = super().get(key)
+                if value is None:
+                    super().set(key, StringValue("raced"))
+                return value
+        
+        store = KVStore(backend=RacingBackend(), cache_strategy=LRUCache(capacity=1), negative_cache_ttl=60)
+        self.assertIsNone(store.get("racy"))
+        store.set("evicts_racy", "value")
+        self.assertEqual(store.get("racy"), "raced")
+    
+    def test_memory_backend_batch_operations(self):
+        """Test the memory backend's shard-grouped batch operations."""
+        backend = MemoryBackend()
+        keys = [Key(f"batch{i}") for i in range(200)]
+        deleted = []
+        backend.register_on_delete(deleted.append)
+        
+        backend.batch_set({key: StringValue(str(key)) for key in keys})
+        self.assertEqual(len(backend.keys()), 200)
+        
+        found = backend.batch_get(keys[:10] + [Key("missing")])
+        self.assertEqual({str(key): value.value for key, value in found.items()},
+                         {str(key): str(key) for key in keys[:10]})
+        
+        self.assertEqual(backend.batch_delete(keys[:50] + [Key("missing")]), 50)
+        self.assertEqual(len(deleted), 50)
+        self.assertEqual(backend.batch_get(keys[:50]), {})
+        self.assertEqual(len(backend.keys()), 150)
+    
+    def test_memory_backend_namespace_filter(self):
+        """Test namespace filtering with a namespace string built at runtime."""
+        backend = MemoryBackend()
+        backend.set(Key("a", "users"), StringValue("1"))
+        backend.set(Key("b", "users"), StringValue("2"))
+        backend.set(Key("c", "other"), StringValue("3"))
+        backend.set(Key("d"), StringValue("4"))
+        
+        namespace = "".join(["us", "ers"])
+        self.assertEqual(sorted(str(key) for key in backend.keys(namespace=namespace)), ["users:a", "users:b"])
+        self.assertEqual(len(backend.items(namespace=namespace)), 2)
+        self.assertEqual(len(backend.items(pattern="users:a", namespace=namespace)), 1)
+    
+    def test_memory_backend_increment(self):
+        """Test incrementing and decrementing integers in the memory backend."""
+        backend = MemoryBackend()
+        key = Key("counter")
+        
+        self.assertEqual(backend.increment(key), 1)
+        self.assertEqual(backend.increment(key, 5), 6)
+        self.assertEqual(backend.decrement(key, 2), 4)
+        
+        # TTL and metadata of an existing value are kept
+        backend.set(key, IntValue(10, ttl=60, metadata={"owner": "test"}))
+        self.assertEqual(backend.increment(key), 11)
+        value = backend.get(key)
+        self.assertEqual(value.ttl, 60)
+        self.assertEqual(value.metadata["owner"], "test")
+        
+        backend.set(Key("text"), StringValue("not a number"))
+        with self.assertRaises(ValueError):
+            backend.increment(Key("text"))
+    
+    def test_hash_ops_notify_store(self):
+        """Test that backend hash operations reach the store's caches."""
+        backend = MemoryBackend()
+        store = KVStore(backend=backend, negative_cache_ttl=60)
+        
+        self.assertIsNone(store.get("hash"))
+        self.assertTrue(backend.hash_set(Key("hash"), "field", 1))
+        self.assertEqual(store.get("hash"), {"field": 1})
+        
+        # Updates replace the stored value, so earlier reads do not change
+        before = store.get("hash")
+        backend.hash_set(Key("hash"), "other", 2)
+        self.assertEqual(before, {"field": 1})
+        self.assertEqual(backend.hash_get_all(Key("hash")), {"field": 1, "other": 2})
+        
+        self.assertEqual(backend.hash_delete(Key("hash"), "field", "missing"), 1)
+        self.assertEqual(store.get("hash"), {"other": 2})
+        self.assertEqual(backend.stats()['deletes'], 0)
+    
     def test_transactions(self):
         """Test transaction functionality."""
         # Set initial values
@@ -73,6 +73,19 @@ class TestValue(unittest.TestCase):
         # Recreate from dict
         value2 = BytesValue.from_dict(data)
         self.assertEqual(value2.value, binary_data)
+        
+        # Binary serialization keeps the raw bytes
+        data = value.to_dict(binary=True)
+        self.assertEqual(data['value'], binary_data)
+        self.assertEqual(BytesValue.from_dict(data).value, binary_data)
+        
+        # Size estimates grow with the payload
+        self.assertGreater(BytesValue(binary_data * 10).estimated_size(), value.estimated_size())
+        
+        # Estimates never serialize, so even unserializable payloads have one
+        self.assertGreater(JsonValue({"items": {1, 2, 3}}).estimated_size(), 0)
+        self.assertGreater(PickleValue(lambda: None).estimated_size(), 0)
+        self.assertGreater(JsonValue({"a": "x" * 1000}).estimated_size(), JsonValue({"a": "x"}).estimated_size())
     
     def test_json_value(self):
         """Test JsonValue class."""
@@ -88,6 +101,23 @@ class TestValue(unittest.TestCase):
         value2 = JsonValue.from_dict(data)
         self.assertEqual(value2.value, json_data)
     
+    def test_json_value_round_trip(self):
+        """Test that JsonValue stores exactly what json would."""
+        # Non-finite floats survive rather than turning into null
+        data = JsonValue.from_dict(JsonValue({"nan": float("nan"), "inf": float("inf")}).to_dict()).value
+        self.assertNotEqual(data["nan"], data["nan"])
+        self.assertEqual(data["inf"], float("inf"))
+        
+        # Integer keys come back as strings, as with json
+        self.assertEqual(JsonValue.from_dict(JsonValue({1: "x"}).to_dict()).value, {"1": "x"})
+        
+        # Integers wider than 64 bits stay integers
+        self.assertEqual(JsonValue.from_dict(JsonValue({"big": 2 ** 70}).to_dict()).value, {"big": 2 ** 70})
+        
+        # Types json rejects are rejected rather than stored as strings
+        with self.assertRaises(TypeError):
+            JsonValue({"when": datetime(2020, 1, 1)}).to_dict()
+    
     def test_pickle_value(self):
         """Test PickleValue class."""
         class Person:
@@ -146,6 +176,12 @@ class TestValue(unittest.TestCase):
         data = value.to_dict()
         value2 = StringValue.from_dict(data)
         self.assertEqual(value2.metadata, value.metadata)
+        
+        # Mutating a serialized copy does not leak into other values
+        StringValue("x").to_dict()['metadata']['leak'] = 1
+        self.assertEqual(dict(StringValue("y").metadata), {})
+        value.to_dict()['metadata']['leak'] = 1
+        self.assertNotIn('leak', value.metadata)
 
 
 if __name__ == "__main__":